@@ -34,6 +34,7 @@ from aethos.helpers import groupby_analysis
 
 from aethos.analysis import Analysis
 from aethos.modelling import Classification, Regression, Unsupervised
+from aethos.modelling.util import flush_tracking
 from aethos.model_analysis import (
     ClassificationModelAnalysis,
     RegressionModelAnalysis,
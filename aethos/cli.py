@@ -90,3 +90,90 @@ def mlflow_ui(host, port):
     os.system(
         f"mlflow ui -h {host} -p {port} --backend-store-uri {EXP_DIR[5:]} --default-artifact-root {EXP_DIR[5:]}"
     )
+
+
+@main.command()
+@click.argument("project")
+@click.option(
+    "-d",
+    "--data",
+    required=True,
+    help="CSV file of rows to send, with the columns the model was trained on in the same order.",
+)
+@click.option(
+    "-t",
+    "--target",
+    default=None,
+    help="Column to drop from the data, such as the target.",
+)
+@click.option(
+    "-c",
+    "--concurrency",
+    show_default=True,
+    default=16,
+    help="Number of requests in flight at once.",
+)
+@click.option(
+    "-n",
+    "--requests",
+    "n_requests",
+    show_default=True,
+    default=1000,
+    help="Number of requests sent to each endpoint.",
+)
+@click.option(
+    "-b",
+    "--batch-size",
+    show_default=True,
+    default=64,
+    help="Number of rows in each /predict_batch request.",
+)
+@click.option(
+    "-w",
+    "--workers",
+    show_default=True,
+    default=1,
+    help="Number of uvicorn workers running the service.",
+)
+@click.option(
+    "--in-process",
+    is_flag=True,
+    help="Run the service in a thread of this process rather than in a uvicorn subprocess.",
+)
+def bench_service(
+    project, data, target, concurrency, n_requests, batch_size, workers, in_process
+):
+    """
+    Load tests a service created with `to_service`, PROJECT being its name or directory.
+
+    Reports throughput, p50/p95/p99 latency and error rate of the single row and batch endpoints.
+    """
+
+    import pandas as pd
+
+    from aethos.templates.benchmark import benchmark_service
+    from aethos.templates.util import _create_dir
+
+    app_dir = (
+        project if os.path.isdir(project) else os.path.join(_create_dir(), project)
+    )
+
+    if os.path.isdir(os.path.join(app_dir, "app")):
+        app_dir = os.path.join(app_dir, "app")
+
+    rows = pd.read_csv(data)
+
+    if target:
+        rows = rows.drop(columns=target)
+
+    report = benchmark_service(
+        app_dir,
+        rows,
+        concurrency=concurrency,
+        n_requests=n_requests,
+        batch_size=batch_size,
+        in_process=in_process,
+        workers=workers,
+    )
+
+    click.echo(report.to_string())
@@ -507,3 +507,4 @@ def is_type_factory(_type):
 
 is_bool = is_type_factory(bool)
 is_list = is_type_factory(list)
+is_int = is_type_factory(int)
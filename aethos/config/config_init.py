@@ -1,6 +1,6 @@
 import aethos.config.config as cf
 from aethos.config import cfg, shell
-from aethos.config.config import is_bool, is_list
+from aethos.config.config import is_bool, is_int, is_list
 from aethos.config.user_config import _make_experiment_dir
 from aethos.util import _make_dir
 
@@ -77,10 +77,75 @@ project_metric_doc = """
 track_experiments_doc = """
 : bool
     Track experminets with MLFlow
+    Models and artifacts are logged in the background, `aethos.flush_tracking()` waits for them to be logged.
     Default value is False
     Valid values: False, True
 """
 
+explain_models_doc = """
+: bool
+    Allow SHAP and Interpret model explanations of supervised models.
+    Explainers are only built the first time they are used.
+    Can be overridden per model with the `explain` keyword argument.
+    Default value is True
+    Valid values: False, True
+"""
+
+shap_background_size_doc = """
+: int
+    Number of k-means summarized training samples used as background data by the SHAP KernelExplainer.
+    Default value is 100
+"""
+
+shap_max_rows_doc = """
+: int
+    Maximum number of test samples explained by the SHAP KernelExplainer.
+    Samples are stratified on the target when possible.
+    Default value is 1000
+"""
+
+max_workers_doc = """
+: int
+    Maximum number of worker processes used to run queued models in parallel.
+    0 uses one worker per CPU.
+    Default value is 0
+"""
+
+threads_per_model_doc = """
+: int
+    Number of threads each model can use when queued models are run in parallel.
+    0 splits the CPUs evenly between the workers.
+    Default value is 0
+"""
+
+fit_cache_doc = """
+: bool
+    Cache fitted models on disk and reuse them when a model is trained again
+    with the same data, parameters and gridsearch.
+    Default value is True
+    Valid values: False, True
+"""
+
+fit_cache_size_doc = """
+: int
+    Maximum size of the fitted model cache in MB, the least recently used models are evicted first.
+    Default value is 2048
+"""
+
+pretrained_cache_size_doc = """
+: int
+    Maximum size of the pretrained pipeline result cache in MB, the least recently used results are evicted first.
+    Default value is 512
+"""
+
+n_jobs_doc = """
+: int
+    Number of processes used by row wise text transformations, such as `clean_text`.
+    -1 uses one process per CPU.
+    Can be overridden per call with the `n_jobs` keyword argument.
+    Default value is 1
+"""
+
 
 def use_qgrid(key):
     import qgrid
@@ -132,3 +197,39 @@ cf.register_option(
     validator=is_bool,
     cb=create_experiment_dir,
 )
+
+cf.register_option(
+    "explain_models", default=True, doc=explain_models_doc, validator=is_bool
+)
+
+cf.register_option(
+    "shap_background_size",
+    default=100,
+    doc=shap_background_size_doc,
+    validator=is_int,
+)
+
+cf.register_option(
+    "shap_max_rows", default=1000, doc=shap_max_rows_doc, validator=is_int
+)
+
+cf.register_option("max_workers", default=0, doc=max_workers_doc, validator=is_int)
+
+cf.register_option(
+    "threads_per_model", default=0, doc=threads_per_model_doc, validator=is_int
+)
+
+cf.register_option("fit_cache", default=True, doc=fit_cache_doc, validator=is_bool)
+
+cf.register_option(
+    "fit_cache_size", default=2048, doc=fit_cache_size_doc, validator=is_int
+)
+
+cf.register_option(
+    "pretrained_cache_size",
+    default=512,
+    doc=pretrained_cache_size_doc,
+    validator=is_int,
+)
+
+cf.register_option("n_jobs", default=1, doc=n_jobs_doc, validator=is_int)
@@ -46,6 +46,7 @@ DEFAULT_EXPERIMENTS_DIR = "file:" + os.path.join(
     os.path.expanduser("~"), ".aethos", "experiments", "mlruns"
 )
 DEFAULT_DEPLOYMENTS_DIR = os.path.join(os.path.expanduser("~"), ".aethos", "projects")
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".aethos", "cache")
 
 IMAGE_DIR = _make_image_dir()
 EXP_DIR = _make_experiment_dir()
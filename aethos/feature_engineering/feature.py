@@ -22,7 +22,14 @@ from aethos.util import (
 
 class Feature(object):
     def onehot_encode(
-        self, *list_args, list_of_cols=[], keep_col=True, **onehot_kwargs
+        self,
+        *list_args,
+        list_of_cols=[],
+        keep_col=True,
+        sparse=False,
+        max_categories=None,
+        min_frequency=None,
+        **onehot_kwargs,
     ):
         """
         Creates a matrix of converted categorical columns into binary columns of ones and zeros.
@@ -43,6 +50,16 @@ class Feature(object):
             A parameter to specify whether to drop the column being transformed, by default
             keep the column, True
 
+        sparse : bool, optional
+            True to store the encoded columns as pandas sparse columns, False to store them densely, by default False
+
+        max_categories : int, optional
+            Maximum number of categories encoded per column, the least frequent categories are grouped in an `infrequent` category, by default None
+
+        min_frequency : int or float, optional
+            Categories seen less than `min_frequency` times, or in less than `min_frequency` of the rows if a float,
+            are grouped in an `infrequent` category, by default None
+
         categories : ‘auto’ or a list of array-like, default=’auto’
             Categories (unique values) per feature:
 
@@ -61,9 +78,6 @@ class Feature(object):
 
                 array : drop[i] is the category in feature X[:, i] that should be dropped.
 
-        sparsebool : default=True
-            Will return sparse matrix if set True else will return an array.
-
         dtype : number type, default=np.float
             Desired dtype of output.
 
@@ -81,6 +95,8 @@ class Feature(object):
         --------
         >>> data.onehot_encode('col1', 'col2', 'col3')
         >>> data.onehot_encode('col1', 'col2', 'col3', drop='first')
+        >>> data.onehot_encode('zip_code', max_categories=100, min_frequency=10)
+        >>> data.onehot_encode('zip_code', sparse=True)
         """
 
         # If a list of columns is provided use the list, otherwise use arguemnts.
@@ -89,16 +105,31 @@ class Feature(object):
         enc = OneHotEncoder(handle_unknown="ignore", **onehot_kwargs)
         list_of_cols = _get_columns(list_of_cols, self.x_train)
 
-        enc_data = enc.fit_transform(self.x_train[list_of_cols]).toarray()
-        enc_df = pd.DataFrame(enc_data, columns=enc.get_feature_names(list_of_cols))
+        x_train = self.x_train[list_of_cols]
+        x_test = self.x_test[list_of_cols] if self.x_test is not None else None
+
+        if max_categories is not None or min_frequency is not None:
+            bucketed = util.bucket_categories(
+                x_train,
+                x_test,
+                list_of_cols=list_of_cols,
+                max_categories=max_categories,
+                min_frequency=min_frequency,
+            )
+            x_train, x_test = bucketed if x_test is not None else (bucketed, None)
+
+        enc_data = enc.fit_transform(x_train)
+        enc_df = util.encoded_frame(
+            enc_data, columns=enc.get_feature_names(list_of_cols), sparse=sparse
+        )
         self.x_train = drop_replace_columns(
             self.x_train, list_of_cols, enc_df, keep_col
         )
 
         if self.x_test is not None:
-            enc_test = enc.transform(self.x_test[list_of_cols]).toarray()
-            enc_test_df = pd.DataFrame(
-                enc_test, columns=enc.get_feature_names(list_of_cols)
+            enc_test = enc.transform(x_test)
+            enc_test_df = util.encoded_frame(
+                enc_test, columns=enc.get_feature_names(list_of_cols), sparse=sparse
             )
             self.x_test = drop_replace_columns(
                 self.x_test, list_of_cols, enc_test_df, keep_col
@@ -106,7 +137,9 @@ class Feature(object):
 
         return self
 
-    def tfidf(self, *list_args, list_of_cols=[], keep_col=True, **tfidf_kwargs):
+    def tfidf(
+        self, *list_args, list_of_cols=[], keep_col=True, sparse=False, **tfidf_kwargs
+    ):
         """
         Creates a matrix of the tf-idf score for every word in the corpus as it pertains to each document.
 
@@ -128,6 +161,10 @@ class Feature(object):
         keep_col : bool, optional
             True if you want to keep the column(s) or False if you want to drop the column(s)
 
+        sparse : bool, optional
+            True to store the encoded columns as pandas sparse columns, False to store them densely, by default False
+            Sparse columns are only densified for models that do not train on sparse matrices.
+
         encoding: str, default=’utf-8’
             If bytes or files are given to analyze, this encoding is used to decode.
 
@@ -230,6 +267,7 @@ class Feature(object):
         --------
         >>> data.tfidf('col1', 'col2', 'col3')
         >>> data.tfidf('col1', 'col2', 'col3', lowercase=False, smoothidf=False)
+        >>> data.tfidf('col1', sparse=True)
         """
 
         # If a list of columns is provided use the list, otherwise use arguemnts.
@@ -239,20 +277,26 @@ class Feature(object):
         list_of_cols = _get_columns(list_of_cols, self.x_train)
 
         for col in list_of_cols:
-            enc_data = enc.fit_transform(self.x_train[col]).toarray()
-            enc_df = pd.DataFrame(enc_data, columns=enc.get_feature_names())
+            enc_data = enc.fit_transform(self.x_train[col])
+            enc_df = util.encoded_frame(
+                enc_data, columns=enc.get_feature_names(), sparse=sparse
+            )
             self.x_train = drop_replace_columns(self.x_train, col, enc_df, keep_col)
 
             if self.x_test is not None:
-                enc_test = enc.transform(self.x_test[col]).toarray()
-                enc_test_df = pd.DataFrame(enc_test, columns=enc.get_feature_names())
+                enc_test = enc.transform(self.x_test[col])
+                enc_test_df = util.encoded_frame(
+                    enc_test, columns=enc.get_feature_names(), sparse=sparse
+                )
                 self.x_test = drop_replace_columns(
                     self.x_test, col, enc_test_df, keep_col
                 )
 
         return self
 
-    def bag_of_words(self, *list_args, list_of_cols=[], keep_col=True, **bow_kwargs):
+    def bag_of_words(
+        self, *list_args, list_of_cols=[], keep_col=True, sparse=False, **bow_kwargs
+    ):
         """
         Creates a matrix of how many times a word appears in a document.
 
@@ -273,6 +317,10 @@ class Feature(object):
         keep_col : bool, optional
             True if you want to keep the column(s) or False if you want to drop the column(s)
 
+        sparse : bool, optional
+            True to store the encoded columns as pandas sparse columns, False to store them densely, by default False
+            Sparse columns are only densified for models that do not train on sparse matrices.
+
         encoding: str, default=’utf-8’
             If bytes or files are given to analyze, this encoding is used to decode.
 
@@ -358,6 +406,7 @@ class Feature(object):
         --------
         >>> data.bag_of_words('col1', 'col2', 'col3')
         >>> data.bag_of_words('col1', 'col2', 'col3', binary=True)
+        >>> data.bag_of_words('col1', sparse=True)
         """
 
         # If a list of columns is provided use the list, otherwise use arguemnts.
@@ -367,20 +416,26 @@ class Feature(object):
         list_of_cols = _get_columns(list_of_cols, self.x_train)
 
         for col in list_of_cols:
-            enc_data = enc.fit_transform(self.x_train[col]).toarray()
-            enc_df = pd.DataFrame(enc_data, columns=enc.get_feature_names())
+            enc_data = enc.fit_transform(self.x_train[col])
+            enc_df = util.encoded_frame(
+                enc_data, columns=enc.get_feature_names(), sparse=sparse
+            )
             self.x_train = drop_replace_columns(self.x_train, col, enc_df, keep_col)
 
             if self.x_test is not None:
-                enc_test = enc.transform(self.x_test[col]).toarray()
-                enc_test_df = pd.DataFrame(enc_test, columns=enc.get_feature_names())
+                enc_test = enc.transform(self.x_test[col])
+                enc_test_df = util.encoded_frame(
+                    enc_test, columns=enc.get_feature_names(), sparse=sparse
+                )
                 self.x_test = drop_replace_columns(
                     self.x_test, col, enc_test_df, keep_col
                 )
 
         return self
 
-    def text_hash(self, *list_args, list_of_cols=[], keep_col=True, **hash_kwargs):
+    def text_hash(
+        self, *list_args, list_of_cols=[], keep_col=True, sparse=False, **hash_kwargs
+    ):
         """
         Creates a matrix of how many times a word appears in a document. It can possibly normalized as token frequencies if norm=’l1’ or projected on the euclidean unit sphere if norm=’l2’.
 
@@ -409,6 +464,10 @@ class Feature(object):
         keep_col : bool, optional
             True if you want to keep the column(s) or False if you want to drop the column(s)
 
+        sparse : bool, optional
+            True to store the encoded columns as pandas sparse columns, False to store them densely, by default False
+            Sparse columns are only densified for models that do not train on sparse matrices.
+
         n_features : integer, default=(2 ** 20)
             The number of features (columns) in the output matrices.
             Small numbers of features are likely to cause hash collisions, but large numbers will cause larger coefficient dimensions in linear learners.
@@ -425,6 +484,7 @@ class Feature(object):
         --------
         >>> data.text_hash('col1', 'col2', 'col3')
         >>> data.text_hash('col1', 'col2', 'col3', n_features=50)
+        >>> data.text_hash('col1', sparse=True)
         """
 
         # If a list of columns is provided use the list, otherwise use arguemnts.
@@ -434,13 +494,13 @@ class Feature(object):
         list_of_cols = _get_columns(list_of_cols, self.x_train)
 
         for col in list_of_cols:
-            enc_data = enc.fit_transform(self.x_train[col]).toarray()
-            enc_df = pd.DataFrame(enc_data)
+            enc_data = enc.fit_transform(self.x_train[col])
+            enc_df = util.encoded_frame(enc_data, sparse=sparse)
             self.x_train = drop_replace_columns(self.x_train, col, enc_df, keep_col)
 
             if self.x_test is not None:
-                enc_test = enc.transform(self.x_test[col]).toarray()
-                enc_test_df = pd.DataFrame(enc_test)
+                enc_test = enc.transform(self.x_test[col])
+                enc_test_df = util.encoded_frame(enc_test, sparse=sparse)
                 self.x_test = drop_replace_columns(
                     self.x_test, col, enc_test_df, keep_col
                 )
@@ -488,7 +548,14 @@ class Feature(object):
 
         return self
 
-    def postag_spacy(self, *list_args, list_of_cols=[], new_col_name="_postagged"):
+    def postag_spacy(
+        self,
+        *list_args,
+        list_of_cols=[],
+        new_col_name="_postagged",
+        batch_size=1000,
+        n_process=None,
+    ):
         """
         Tag documents with their respective "Part of Speech" tag with the Spacy NLP engine and the Universal Dependencies scheme.
         These tags classify a word as a noun, verb, adjective, etc. A full list and their meaning can be found here:
@@ -507,6 +574,12 @@ class Feature(object):
         new_col_name : str, optional
             New column name to be created when applying this technique, by default `COLUMN_postagged`
 
+        batch_size : int, optional
+            Number of texts spaCy processes together, by default 1000
+
+        n_process : int, optional
+            Number of processes spaCy uses, -1 for one per CPU, by default the `n_jobs` option
+
         Returns
         -------
         Data:
@@ -515,6 +588,7 @@ class Feature(object):
         Examples
         --------
         >>> data.postag_spacy('col1', 'col2', 'col3')
+        >>> data.postag_spacy('col1', batch_size=500, n_process=4)
         """
 
         list_of_cols = _input_columns(list_args, list_of_cols)
@@ -525,12 +599,19 @@ class Feature(object):
             list_of_cols=list_of_cols,
             new_col_name=new_col_name,
             method="s",
+            batch_size=batch_size,
+            n_process=n_process,
         )
 
         return self
 
     def postag_spacy_detailed(
-        self, *list_args, list_of_cols=[], new_col_name="_postagged"
+        self,
+        *list_args,
+        list_of_cols=[],
+        new_col_name="_postagged",
+        batch_size=1000,
+        n_process=None,
     ):
         """
         Tag documents with their respective "Part of Speech" tag with the Spacy NLP engine and the PennState PoS tags.
@@ -550,6 +631,12 @@ class Feature(object):
         new_col_name : str, optional
             New column name to be created when applying this technique, by default `COLUMN_postagged`
 
+        batch_size : int, optional
+            Number of texts spaCy processes together, by default 1000
+
+        n_process : int, optional
+            Number of processes spaCy uses, -1 for one per CPU, by default the `n_jobs` option
+
         Returns
         -------
         Data:
@@ -558,6 +645,7 @@ class Feature(object):
         Examples
         --------
         >>> data.postag_spacy_detailed('col1', 'col2', 'col3')
+        >>> data.postag_spacy_detailed('col1', batch_size=500, n_process=4)
         """
 
         list_of_cols = _input_columns(list_args, list_of_cols)
@@ -568,6 +656,8 @@ class Feature(object):
             list_of_cols=list_of_cols,
             new_col_name=new_col_name,
             method="d",
+            batch_size=batch_size,
+            n_process=n_process,
         )
 
         return self
@@ -611,7 +701,14 @@ class Feature(object):
 
         return self
 
-    def nounphrases_spacy(self, *list_args, list_of_cols=[], new_col_name="_phrases"):
+    def nounphrases_spacy(
+        self,
+        *list_args,
+        list_of_cols=[],
+        new_col_name="_phrases",
+        batch_size=1000,
+        n_process=None,
+    ):
         """
         Extract noun phrases from text using the Textblob packages which uses the NLTK NLP engine.
 
@@ -628,6 +725,12 @@ class Feature(object):
         new_col_name : str, optional
             New column name to be created when applying this technique, by default `COLUMN_phrases`
 
+        batch_size : int, optional
+            Number of texts spaCy processes together, by default 1000
+
+        n_process : int, optional
+            Number of processes spaCy uses, -1 for one per CPU, by default the `n_jobs` option
+
         Returns
         -------
         Data:
@@ -636,35 +739,34 @@ class Feature(object):
         Examples
         --------
         >>> data.nounphrases_spacy('col1', 'col2', 'col3')
+        >>> data.nounphrases_spacy('col1', batch_size=500, n_process=4)
         """
 
-        import spacy
-
         list_of_cols = _input_columns(list_args, list_of_cols)
         list_of_cols = _get_columns(list_of_cols, self.x_train)
 
-        nlp = spacy.load("en")
+        func = lambda x: [str(phrase) for phrase in x.noun_chunks]
 
         for col in list_of_cols:
 
             if new_col_name.startswith("_"):
                 new_col_name = col + new_col_name
 
-            transformed_text = list(map(nlp, self.x_train[col]))
-            self.x_train[new_col_name] = pd.Series(
-                map(
-                    lambda x: [str(phrase) for phrase in x.noun_chunks],
-                    transformed_text,
-                )
+            self.x_train[new_col_name] = text.spacy_pipe(
+                self.x_train[col],
+                func,
+                disable=text.SPACY_NOUN_CHUNKS_DISABLE,
+                batch_size=batch_size,
+                n_process=n_process,
             )
 
             if self.x_test is not None:
-                transformed_text = map(nlp, self.x_test[col])
-                self.x_test[new_col_name] = pd.Series(
-                    map(
-                        lambda x: [str(phrase) for phrase in x.noun_chunks],
-                        transformed_text,
-                    )
+                self.x_test[new_col_name] = text.spacy_pipe(
+                    self.x_test[col],
+                    func,
+                    disable=text.SPACY_NOUN_CHUNKS_DISABLE,
+                    batch_size=batch_size,
+                    n_process=n_process,
                 )
 
         return self
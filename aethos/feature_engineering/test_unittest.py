@@ -49,6 +49,25 @@ class TestFeatureExtraction(unittest.TestCase):
 
         self.assertEqual(validate, 2)
 
+    def test_featureextractiontext_tfidf_sparse(self):
+
+        list_of_sentences = ["Hi my name is pyml", "Hi name pyml"]
+        columns = ["text"]
+        data = pd.DataFrame(list_of_sentences, columns=columns)
+
+        feature = Classification(x_train=data, target="", x_test=data)
+        feature.tfidf(
+            keep_col=False, lowercase=False, stop_words="english", sparse=True
+        )
+        dense = Classification(x_train=data, target="", x_test=data)
+        dense.tfidf(keep_col=False, lowercase=False, stop_words="english", sparse=False)
+
+        validate = all(
+            isinstance(dtype, pd.SparseDtype) for dtype in feature.x_train.dtypes
+        ) and np.allclose(feature.x_train.sparse.to_dense(), dense.x_train)
+
+        self.assertTrue(validate)
+
     def test_featureextractiontext_splittfidf(self):
 
         list_of_sentences = ["Hi my name is pyml", "Hi name pyml"]
@@ -93,6 +112,42 @@ class TestFeatureExtraction(unittest.TestCase):
             [["Green", 0, 1, 1, 0], ["Other", 0, 1, 0, 1], ["Other", 1, 0, 0, 1]],
         )
 
+    def test_featureextractioncategorical_onehot_max_categories(self):
+
+        normal_data = [["a", 1], ["a", 2], ["a", 3], ["b", 4], ["b", 5], ["c", 6]]
+
+        columns = ["col1", "col2"]
+        data = pd.DataFrame(normal_data, columns=columns)
+
+        feature = Classification(x_train=data, target="", x_test=data)
+        feature.onehot_encode("col1", keep_col=False, sparse=True, max_categories=2)
+        validate = feature.x_train.columns.tolist() == [
+            "col2",
+            "col1_a",
+            "col1_infrequent",
+        ] and isinstance(feature.x_train["col1_a"].dtype, pd.SparseDtype)
+
+        self.assertTrue(validate)
+
+    def test_featureextractioncategorical_bucket_categories(self):
+
+        from aethos.feature_engineering.util import bucket_categories
+
+        x_train = pd.DataFrame({"col1": ["a", "a", np.nan, np.nan, "b", "b"]})
+        x_test = pd.DataFrame({"col1": ["a", "c", np.nan]})
+
+        x_train, x_test = bucket_categories(
+            x_train, x_test, list_of_cols=["col1"], min_frequency=2
+        )
+
+        self.assertListEqual(
+            x_train["col1"].fillna("missing").tolist(),
+            ["a", "a", "missing", "missing", "b", "b"],
+        )
+        self.assertListEqual(
+            x_test["col1"].fillna("missing").tolist(), ["a", "infrequent", "missing"]
+        )
+
     def test_featureextractiontext_nltkpostag(self):
 
         normal_data = [
@@ -209,6 +264,26 @@ class TestFeatureExtraction(unittest.TestCase):
 
         self.assertTrue(validate, 2)
 
+    def test_featureextractiontext_spacy_cached_batched(self):
+
+        from aethos.feature_engineering.text import load_spacy
+
+        normal_data = [
+            "hi welcome to aethos.",
+            "This application automates common Classification Science/ML Classification tasks.",
+        ]
+
+        columns = ["text"]
+        data = pd.DataFrame(normal_data, columns=columns)
+
+        feature = Classification(x_train=data, target="", x_test=data)
+        feature.postag_spacy(batch_size=1)
+        feature.nounphrases_spacy(batch_size=1)
+
+        self.assertIs(load_spacy(), load_spacy())
+        self.assertIn("ner", load_spacy().pipe_names)
+        self.assertEqual(len(feature.x_train["text_phrases"]), 2)
+
     def test_featureextractiontext_nltkphrases(self):
 
         normal_data = [
@@ -1,10 +1,81 @@
+from functools import lru_cache
+
 import pandas as pd
 import spacy
 
 from textblob import TextBlob
 
+from aethos.config.config import _global_config
 from aethos.util import _get_columns
 
+# Pipeline components each spaCy feature does not need, they are disabled while it runs
+SPACY_POSTAG_DISABLE = ("parser", "ner", "lemmatizer", "textcat")
+SPACY_NOUN_CHUNKS_DISABLE = ("ner", "lemmatizer", "textcat")
+
+
+@lru_cache(maxsize=None)
+def load_spacy(name="en_core_web_sm"):
+    """
+    Loads a spaCy model once per process.
+    
+    Parameters
+    ----------
+    name : str, optional
+        Name of the spaCy model, by default "en_core_web_sm"
+
+    Returns
+    -------
+    Language
+        spaCy model
+    """
+
+    return spacy.load(name)
+
+
+def spacy_pipe(texts, func, disable=(), batch_size=1000, n_process=None) -> list:
+    """
+    Runs texts through the cached spaCy model in batches and applies `func` to each document.
+
+    Parameters
+    ----------
+    texts : iterable
+        Texts to process
+
+    func : callable
+        Function applied to each processed document
+
+    disable : tuple, optional
+        Pipeline components to disable while processing, components not in the pipeline are ignored, by default ()
+
+    batch_size : int, optional
+        Number of texts processed together, by default 1000
+
+    n_process : int, optional
+        Number of processes, -1 for one per CPU, by default the `n_jobs` option
+
+    Returns
+    -------
+    list
+        `func` applied to each document, in order
+    """
+
+    nlp = load_spacy()
+    n_process = _global_config["n_jobs"] if n_process is None else n_process
+
+    disable = [pipe for pipe in disable if pipe in nlp.pipe_names]
+    # spaCy 3 replaced disable_pipes with select_pipes
+    disabled = (
+        nlp.select_pipes(disable=disable)
+        if hasattr(nlp, "select_pipes")
+        else nlp.disable_pipes(*disable)
+    )
+
+    with disabled:
+        return [
+            func(doc)
+            for doc in nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        ]
+
 
 def textblob_features(
     x_train, x_test, feature, list_of_cols=[], new_col_name="_postagged",
@@ -60,13 +131,19 @@ def textblob_features(
 
 
 def spacy_feature_postag(
-    x_train, x_test=None, list_of_cols=[], new_col_name="_postagged", method="s"
+    x_train,
+    x_test=None,
+    list_of_cols=[],
+    new_col_name="_postagged",
+    method="s",
+    batch_size=1000,
+    n_process=None,
 ):
     """
     Part of Speech tag the text data provided. Used to tag each word as a Noun, Adjective,
     Verbs, etc.
 
-    This utilizes the spacy NLP engine.
+    This utilizes the spacy NLP engine, with the components that are not needed for tagging disabled.
     
     Parameters
     ----------
@@ -84,6 +161,12 @@ def spacy_feature_postag(
 
     method : str {'s', 'd'}, optional
         Spacey PoS tagging method either simple or detailed
+
+    batch_size : int, optional
+        Number of texts spaCy processes together, by default 1000
+
+    n_process : int, optional
+        Number of processes spaCy uses, -1 for one per CPU, by default the `n_jobs` option
     
     Returns
     -------
@@ -95,8 +178,6 @@ def spacy_feature_postag(
 
     list_of_cols = _get_columns(list_of_cols, x_train)
 
-    nlp = spacy.load("en_core_web_sm")
-
     if method == "s":
         func = lambda x: [(token, token.pos_) for token in x]
     else:
@@ -107,11 +188,21 @@ def spacy_feature_postag(
         if new_col_name.startswith("_"):
             new_col_name = col + new_col_name
 
-        transformed_text = map(nlp, x_train[col])
-        x_train[new_col_name] = pd.Series(map(func, transformed_text,))
+        x_train[new_col_name] = spacy_pipe(
+            x_train[col],
+            func,
+            disable=SPACY_POSTAG_DISABLE,
+            batch_size=batch_size,
+            n_process=n_process,
+        )
 
         if x_test is not None:
-            transformed_text = map(nlp, x_test[col])
-            x_test[new_col_name] = pd.Series(map(func, transformed_text,))
+            x_test[new_col_name] = spacy_pipe(
+                x_test[col],
+                func,
+                disable=SPACY_POSTAG_DISABLE,
+                batch_size=batch_size,
+                n_process=n_process,
+            )
 
     return x_train, x_test
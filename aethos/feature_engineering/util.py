@@ -42,3 +42,112 @@ def sklearn_dim_reduction(
         x_test.columns = map(str, x_test.columns)
 
     return x_train, x_test
+
+
+def encoded_frame(enc_data, columns=None, sparse=True):
+    """
+    Creates a DataFrame from the sparse matrix output of a sklearn encoder.
+
+    Parameters
+    ----------
+    enc_data : sp.spmatrix
+        Encoded data
+
+    columns : list, optional
+        Column names, by default the position of each column
+
+    sparse : bool, optional
+        True to store the data as pandas sparse columns, False to densify it, by default True
+
+    Returns
+    -------
+    Dataframe
+        Encoded data
+    """
+
+    if sparse:
+        # Zeros are the fill value of the columns, whatever the pandas version defaults to
+        return pd.DataFrame.sparse.from_spmatrix(enc_data, columns=columns).astype(
+            pd.SparseDtype(enc_data.dtype, 0)
+        )
+
+    return pd.DataFrame(enc_data.toarray(), columns=columns)
+
+
+def bucket_categories(
+    x_train,
+    x_test=None,
+    list_of_cols=[],
+    max_categories=None,
+    min_frequency=None,
+    other="infrequent",
+):
+    """
+    Replaces the infrequent categories of columns with a single category.
+
+    Frequencies are counted on the training data, categories of the testing data not in the training data are infrequent.
+    Missing values are counted as a category and are kept missing unless they are infrequent.
+
+    Parameters
+    ----------
+    x_train : DataFrame
+        Dataset
+
+    x_test : DataFrame
+        Testing dataset, by default None
+
+    list_of_cols : list
+        Categorical columns
+
+    max_categories : int, optional
+        Maximum number of categories per column, including the infrequent category, by default None
+
+    min_frequency : int or float, optional
+        Minimum count of a category, or minimum proportion of the rows if a float, by default None
+
+    other : str, optional
+        Name of the infrequent category, by default "infrequent"
+
+    Returns
+    -------
+    Dataframe, *Dataframe
+        Transformed dataframe with the bucketed columns
+
+    Returns 2 Dataframes if x_test is provided.
+    """
+
+    if max_categories is not None and max_categories < 2:
+        raise ValueError("max_categories must be at least 2.")
+
+    x_train = x_train.copy()
+    x_test = x_test.copy() if x_test is not None else None
+
+    for col in list_of_cols:
+        counts = x_train[col].value_counts(dropna=False)
+        frequent = counts
+
+        if min_frequency is not None:
+            threshold = (
+                min_frequency * len(x_train)
+                if isinstance(min_frequency, float)
+                else min_frequency
+            )
+            frequent = frequent[frequent >= threshold]
+
+        if max_categories is not None and len(counts) > max_categories:
+            frequent = frequent.iloc[: max_categories - 1]
+
+        # Categories are made strings so the infrequent category does not mix types
+        for df in (x_train, x_test):
+            if df is not None:
+                df[col] = (
+                    df[col]
+                    .astype(object)
+                    .where(df[col].isin(frequent.index), other)
+                    .map(str, na_action="ignore")
+                )
+
+    if x_test is not None:
+        return x_train, x_test
+
+    return x_train
@@ -9,12 +9,12 @@ from sklearn import metrics
 from aethos.config import IMAGE_DIR
 from aethos.config.config import _global_config
 from .model_analysis import SupervisedModelAnalysis
-from aethos.modelling.util import track_artifacts
+from aethos.modelling.util import to_model_input, track_artifacts
 
 
 class ClassificationModelAnalysis(SupervisedModelAnalysis):
     def __init__(
-        self, model, x_train, x_test, target, model_name,
+        self, model, x_train, x_test, target, model_name, explain=True,
     ):
         """
         Class to analyze Classification models through metrics, global/local interpretation and visualizations.
@@ -35,6 +35,9 @@ class ClassificationModelAnalysis(SupervisedModelAnalysis):
 
         model_name : str
             Name of the model for saving images and model tracking purposes
+
+        explain : bool, optional
+            False to disable the SHAP and Interpret model explanations, by default True
         """
 
         # TODO: Add check for pickle file
@@ -46,6 +49,7 @@ class ClassificationModelAnalysis(SupervisedModelAnalysis):
             x_train[target],
             x_test[target],
             model_name,
+            explain=explain,
         )
 
         self.multiclass = len(np.unique(list(self.y_train) + list(self.y_test))) > 2
@@ -54,6 +58,21 @@ class ClassificationModelAnalysis(SupervisedModelAnalysis):
             str(item) for item in np.unique(list(self.y_train) + list(self.y_test))
         ]
 
+        self._decision_scores = None
+        # Metric values for each positive label
+        self._metric_values = {}
+
+    @property
+    def decision_scores(self):
+        """Decision function scores of the test data, None if the model does not have a decision function."""
+
+        if self._decision_scores is None and hasattr(self.model, "decision_function"):
+            self._decision_scores = self.model.decision_function(
+                to_model_input(self.model, self.x_test[self.features])
+            )
+
+        return self._decision_scores
+
     def accuracy(self, **kwargs):
         """
         It measures how many observations, both positive and negative, were correctly classified.
@@ -107,9 +126,9 @@ class ClassificationModelAnalysis(SupervisedModelAnalysis):
         >>> m.average_precision()
         """
 
-        if hasattr(self.model, "decision_function"):
+        if self.decision_scores is not None:
             return metrics.average_precision_score(
-                self.y_test, self.model.decision_function(self.x_test), **kwargs
+                self.y_test, self.decision_scores, **kwargs
             )
         else:
             return np.nan
@@ -137,9 +156,9 @@ class ClassificationModelAnalysis(SupervisedModelAnalysis):
                 self.y_test, self.probabilities, multi_class=multi_class, **kwargs
             )
         else:
-            if hasattr(self.model, "decision_function"):
+            if self.decision_scores is not None:
                 roc_auc = metrics.roc_auc_score(
-                    self.y_test, self.model.decision_function(self.x_test), **kwargs
+                    self.y_test, self.decision_scores, **kwargs
                 )
             else:
                 roc_auc = np.nan
@@ -304,10 +323,8 @@ class ClassificationModelAnalysis(SupervisedModelAnalysis):
         >>> m.hinge_loss()
         """
 
-        if hasattr(self.model, "decision_function"):
-            return metrics.hinge_loss(
-                self.y_test, self.model.decision_function(self.x_test), **kwargs
-            )
+        if self.decision_scores is not None:
+            return metrics.hinge_loss(self.y_test, self.decision_scores, **kwargs)
         else:
             return np.nan
 
@@ -432,11 +449,12 @@ class ClassificationModelAnalysis(SupervisedModelAnalysis):
 
         return metrics.brier_score_loss(self.y_test, self.y_pred, **kwargs)
 
-    def metrics(self, *metrics):
+    def metrics(self, *metrics, pos_label=1):
         """
         Measures how well your model performed against certain metrics.
 
         For multiclassification problems, the 'macro' average is used.
+        For binary problems, precision, recall, F1, F-Beta, Jaccard and average precision are computed for `pos_label`.
 
         If a project metrics has been specified, it will display those metrics, otherwise it will display the specified metrics or all metrics.
 
@@ -481,33 +499,23 @@ class ClassificationModelAnalysis(SupervisedModelAnalysis):
         metrics : str(s), optional
             Specific type of metrics to view
 
+        pos_label : str or int, optional
+            Positive label of binary problems, by default 1
+
         Examples
         --------
         >>> m = model.LogisticRegression()
         >>> m.metrics()
         >>> m.metrics('F1', 'F-Beta')
+        >>> m.metrics(pos_label='spam')
         """
 
         from aethos.model_analysis.constants import CLASS_METRICS_DESC
 
-        metric_list = {
-            "Accuracy": self.accuracy(),
-            "Balanced Accuracy": self.balanced_accuracy(),
-            "Average Precision": self.average_precision(),
-            "ROC AUC": self.roc_auc(),
-            "Zero One Loss": self.zero_one_loss(),
-            "Precision": self.precision(),
-            "Recall": self.recall(),
-            "Matthews Correlation Coefficient": self.matthews_corr_coef(),
-            "Log Loss": self.log_loss(),
-            "Jaccard": self.jaccard(),
-            "Hinge Loss": self.hinge_loss(),
-            "Hamming Loss": self.hamming_loss(),
-            "F-Beta": self.fbeta(),
-            "F1": self.f1(),
-            "Cohen Kappa": self.cohen_kappa(),
-            "Brier Loss": self.brier_loss(),
-        }
+        if pos_label not in self._metric_values:
+            self._metric_values[pos_label] = self._compute_metrics(pos_label)
+
+        metric_list = self._metric_values[pos_label]
 
         metric_table = pd.DataFrame(
             index=metric_list.keys(),
@@ -527,6 +535,58 @@ class ClassificationModelAnalysis(SupervisedModelAnalysis):
 
         return metric_table.loc[filt_metrics, :].round(3)
 
+    def _compute_metrics(self, pos_label=1):
+        """
+        Computes every metric in one pass over the test data.
+
+        Label metrics are derived from the confusion matrix and binary ranking metrics from a single sort of the decision scores.
+
+        Parameters
+        ----------
+        pos_label : str or int, optional
+            Positive label of binary problems, by default 1
+
+        Returns
+        -------
+        dict
+            Metric name and value
+        """
+
+        y_true = np.asarray(self.y_test)
+        y_pred = np.asarray(self.y_pred)
+
+        label_metrics = _confusion_matrix_metrics(
+            y_true, y_pred, self.multiclass, beta=0.5, pos_label=pos_label
+        )
+
+        if self.multiclass or self.decision_scores is None:
+            average_precision = self.average_precision()
+            roc_auc = self.roc_auc()
+            hinge_loss = self.hinge_loss()
+        else:
+            average_precision, roc_auc, hinge_loss = _ranking_metrics(
+                y_true, self.decision_scores, pos_label=pos_label
+            )
+
+        return {
+            "Accuracy": label_metrics["accuracy"],
+            "Balanced Accuracy": label_metrics["balanced_accuracy"],
+            "Average Precision": average_precision,
+            "ROC AUC": roc_auc,
+            "Zero One Loss": 1 - label_metrics["accuracy"],
+            "Precision": label_metrics["precision"],
+            "Recall": label_metrics["recall"],
+            "Matthews Correlation Coefficient": label_metrics["mcc"],
+            "Log Loss": self.log_loss(),
+            "Jaccard": label_metrics["jaccard"],
+            "Hinge Loss": hinge_loss,
+            "Hamming Loss": 1 - label_metrics["accuracy"],
+            "F-Beta": label_metrics["fbeta"],
+            "F1": label_metrics["f1"],
+            "Cohen Kappa": label_metrics["cohen_kappa"],
+            "Brier Loss": self.brier_loss(),
+        }
+
     def confusion_matrix(
         self,
         title=None,
@@ -659,7 +719,7 @@ class ClassificationModelAnalysis(SupervisedModelAnalysis):
             )
 
         if _global_config["track_experiments"]:  # pragma: no cover
-            track_artifacts(self.run_id, self.model_name)
+            track_artifacts(self._run_id, self.model_name)
 
     def roc_curve(self, title=True, output_file=""):
         """
@@ -701,7 +761,7 @@ class ClassificationModelAnalysis(SupervisedModelAnalysis):
             )
 
         if _global_config["track_experiments"]:  # pragma: no cover
-            track_artifacts(self.run_id, self.model_name)
+            track_artifacts(self._run_id, self.model_name)
 
         return roc_plot
 
@@ -739,6 +799,7 @@ class ClassificationModelAnalysis(SupervisedModelAnalysis):
         score="accuracy",
         n_splits=5,
         shuffle=False,
+        n_jobs=-1,
         **kwargs
     ):
         """
@@ -777,9 +838,14 @@ class ClassificationModelAnalysis(SupervisedModelAnalysis):
 
         shuffle : bool, optional
             True to shuffle the data, by default False
+
+        n_jobs : int, optional
+            Number of folds and learning curve sizes to fit in parallel, -1 uses all the CPUs, by default -1
         """
 
-        super()._cross_validate(cv_type, score, n_splits, shuffle, **kwargs)
+        super()._cross_validate(
+            cv_type, score, n_splits, shuffle, n_jobs=n_jobs, **kwargs
+        )
 
     def decision_boundary(self, x=None, y=None, title="Decisioun Boundary"):
         """
@@ -817,3 +883,179 @@ class ClassificationModelAnalysis(SupervisedModelAnalysis):
         viz.fit(self.x_train[features].values, self.y_train.values)
         viz.draw(self.x_test[features].values, self.y_test.values)
         viz.show()
+
+
+def _confusion_matrix_metrics(
+    y_true, y_pred, multiclass: bool, beta=0.5, pos_label=1
+) -> dict:
+    """
+    Computes label based classification metrics from a single confusion matrix.
+
+    Matches the scikit-learn defaults, binary metrics are computed for `pos_label`
+    and multiclass metrics are macro averaged.
+
+    Parameters
+    ----------
+    y_true : np.ndarray
+        True labels
+
+    y_pred : np.ndarray
+        Predicted labels
+
+    multiclass : bool
+        True if the problem is a multiclass problem
+
+    beta : float, optional
+        Weight of precision in the F-Beta score, by default 0.5
+
+    pos_label : str or int, optional
+        Positive label of binary problems, by default 1
+
+    Returns
+    -------
+    dict
+        accuracy, balanced_accuracy, precision, recall, fbeta, f1, jaccard, mcc and cohen_kappa
+    """
+
+    labels, encoded = np.unique(np.concatenate([y_true, y_pred]), return_inverse=True)
+    n_labels = len(labels)
+    n_samples = len(y_true)
+
+    cm = np.bincount(
+        encoded[:n_samples] * n_labels + encoded[n_samples:],
+        minlength=n_labels ** 2,
+    ).reshape(n_labels, n_labels)
+
+    tp = np.diag(cm).astype(float)
+    true_sum = cm.sum(axis=1).astype(float)
+    pred_sum = cm.sum(axis=0).astype(float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = np.where(pred_sum > 0, tp / pred_sum, 0.0)
+        recall = np.where(true_sum > 0, tp / true_sum, 0.0)
+        fbeta = _fbeta(tp, true_sum, pred_sum, beta)
+        f1 = _fbeta(tp, true_sum, pred_sum, 1)
+        union = true_sum + pred_sum - tp
+        jaccard = np.where(union > 0, tp / union, 0.0)
+        balanced_accuracy = np.nanmean(np.where(true_sum > 0, tp / true_sum, np.nan))
+
+    if multiclass:
+        label_scores = {
+            "precision": precision.mean(),
+            "recall": recall.mean(),
+            "fbeta": fbeta.mean(),
+            "f1": f1.mean(),
+            "jaccard": jaccard.mean(),
+        }
+    else:
+        positive = np.flatnonzero(labels == pos_label)
+
+        if not len(positive) and n_labels > 1:
+            raise ValueError(
+                f"pos_label={pos_label} is not a valid label. It should be one of {labels.tolist()}"
+            )
+
+        scores = dict(
+            precision=precision, recall=recall, fbeta=fbeta, f1=f1, jaccard=jaccard
+        )
+
+        label_scores = {
+            name: score[positive[0]] if len(positive) else 0.0
+            for name, score in scores.items()
+        }
+
+    # Matthews correlation coefficient
+    cov_ytyp = tp.sum() * n_samples - np.dot(true_sum, pred_sum)
+    cov_ypyp = n_samples ** 2 - np.dot(pred_sum, pred_sum)
+    cov_ytyt = n_samples ** 2 - np.dot(true_sum, true_sum)
+
+    if cov_ypyp * cov_ytyt == 0:
+        mcc = 0.0
+    else:
+        mcc = cov_ytyp / np.sqrt(cov_ytyt * cov_ypyp)
+
+    # Cohen kappa
+    expected = np.outer(pred_sum, true_sum) / n_samples
+    weights = np.ones((n_labels, n_labels)) - np.eye(n_labels)
+    cohen_kappa = 1 - np.sum(weights * cm) / np.sum(weights * expected)
+
+    return {
+        "accuracy": tp.sum() / n_samples,
+        "balanced_accuracy": balanced_accuracy,
+        "mcc": mcc,
+        "cohen_kappa": cohen_kappa,
+        **label_scores,
+    }
+
+
+def _fbeta(tp, true_sum, pred_sum, beta):
+    """Per label F-Beta score from the true positives and the true and predicted label counts."""
+
+    beta2 = beta ** 2
+    denom = beta2 * true_sum + pred_sum
+
+    return np.where(denom > 0, (1 + beta2) * tp / denom, 0.0)
+
+
+def _ranking_metrics(y_true, scores, pos_label=1):
+    """
+    Computes binary average precision, ROC AUC and hinge loss from a single sort of the decision scores.
+
+    Parameters
+    ----------
+    y_true : np.ndarray
+        True labels
+
+    scores : np.ndarray
+        Decision function scores
+
+    pos_label : str or int, optional
+        Positive label of the average precision, by default 1
+
+    Returns
+    -------
+    float, float, float
+        Average precision, ROC AUC and hinge loss
+    """
+
+    classes = np.unique(y_true)
+
+    if len(classes) == 2 and pos_label not in classes:
+        raise ValueError(
+            f"pos_label={pos_label} is not a valid label. It should be one of {classes.tolist()}"
+        )
+
+    # Average precision is computed for pos_label, ROC AUC and hinge loss use the greater label as positive
+    positive = y_true == pos_label
+    greater = y_true == classes[-1]
+
+    margin = np.where(greater, 1, -1) * scores
+    hinge_loss = np.mean(np.clip(1 - margin, 0, None))
+
+    order = np.argsort(scores, kind="mergesort")[::-1]
+    sorted_scores = scores[order]
+
+    # Last index of every distinct threshold
+    thresholds = np.r_[np.flatnonzero(np.diff(sorted_scores)), len(sorted_scores) - 1]
+
+    tps = np.cumsum(greater[order])[thresholds]
+    fps = thresholds + 1 - tps
+
+    if tps[-1] == 0 or fps[-1] == 0:
+        roc_auc = np.nan
+    else:
+        tpr = np.r_[0, tps / tps[-1]]
+        fpr = np.r_[0, fps / fps[-1]]
+        roc_auc = np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1]) / 2)
+
+    tps = np.cumsum(positive[order])[thresholds]
+    fps = thresholds + 1 - tps
+
+    if tps[-1] == 0:
+        average_precision = np.nan
+    else:
+        precision = tps / (tps + fps)
+        recall = tps / tps[-1]
+        average_precision = np.sum(np.diff(np.r_[0, recall]) * precision)
+
+    return average_precision, roc_auc, hinge_loss
@@ -0,0 +1,660 @@
+"""
+Array backed tree ensembles for fast inference.
+
+Fitted DecisionTree, RandomForest, ExtraTrees, GradientBoosting, XGBoost and LightGBM models are flattened into node arrays
+that are traversed for all rows and all trees at once with NumPy.
+
+This module is copied as is into generated services, it must only depend on NumPy at import time.
+"""
+
+import json
+from functools import partial
+
+import numpy as np
+
+
+class CompiledTreeEnsemble(object):
+    """
+    Tree ensemble stored as flat node arrays.
+
+    Leaves point to themselves, so every row walks down every tree for `max_depth` steps without branching.
+
+    Parameters
+    ----------
+    feature : np.ndarray
+        Feature index of each node
+
+    threshold : np.ndarray
+        Split threshold of each node
+
+    left : np.ndarray
+        Index of the left child of each node, the node itself for leaves
+
+    right : np.ndarray
+        Index of the right child of each node, the node itself for leaves
+
+    default_left : np.ndarray
+        Whether missing values go to the left child of each node
+
+    value : np.ndarray
+        Value of each node, of shape (n_nodes, n_outputs) or (n_nodes, 1) when each tree contributes to a single output
+
+    roots : np.ndarray
+        Index of the root node of each tree
+
+    tree_output : np.ndarray
+        Output each tree contributes to when the value of a node is a single number
+
+    offset : np.ndarray
+        Constant added to the raw score of each output
+
+    classes : np.ndarray, optional
+        Class labels of a classifier, by default None
+
+    link : str, optional
+        Function mapping raw scores to predictions, 'identity', 'proba', 'sigmoid' or 'softmax', by default 'identity'
+
+    average : bool, optional
+        Whether tree values are averaged rather than summed, by default False
+
+    strict : bool, optional
+        Whether rows go left when the feature is strictly less than the threshold rather than less or equal, by default False
+
+    float32 : bool, optional
+        Whether features are compared as 32 bit floats, by default False
+
+    allow_nan : bool, optional
+        Whether missing values are routed with `default_left` rather than rejected, by default True
+    """
+
+    def __init__(
+        self,
+        feature,
+        threshold,
+        left,
+        right,
+        default_left,
+        value,
+        roots,
+        tree_output,
+        offset,
+        classes=None,
+        link="identity",
+        average=False,
+        strict=False,
+        float32=False,
+        allow_nan=True,
+    ):
+
+        self.feature = np.asarray(feature, dtype=np.int32)
+        self.threshold = np.asarray(threshold, dtype=np.float64)
+        self.left = np.asarray(left, dtype=np.int32)
+        self.right = np.asarray(right, dtype=np.int32)
+        self.default_left = np.asarray(default_left, dtype=bool)
+        self.value = np.asarray(value, dtype=np.float64)
+        self.roots = np.asarray(roots, dtype=np.int32)
+        self.tree_output = np.asarray(tree_output, dtype=np.int32)
+        self.offset = np.asarray(offset, dtype=np.float64)
+        self.classes = None if classes is None else np.asarray(classes)
+        self.link = link
+        self.average = average
+        self.strict = strict
+        self.float32 = float32
+        self.allow_nan = allow_nan
+        self.max_depth = self._max_depth()
+
+    def _max_depth(self) -> int:
+        """Number of steps needed for every row to reach a leaf."""
+
+        depth = 0
+        node = self.roots
+
+        while True:
+            children = np.concatenate([self.left[node], self.right[node]])
+            children = np.unique(children[np.not_equal(children, np.tile(node, 2))])
+
+            if not len(children):
+                return depth
+
+            depth += 1
+            node = children
+
+    def apply(self, X) -> np.ndarray:
+        """
+        Leaf reached by each row in each tree.
+
+        Parameters
+        ----------
+        X : array-like
+            Data of shape (n_rows, n_features)
+
+        Returns
+        -------
+        np.ndarray
+            Leaf indices of shape (n_rows, n_trees)
+        """
+
+        X = np.asarray(X, dtype=np.float32 if self.float32 else np.float64)
+
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+
+        if not self.allow_nan and np.isnan(X).any():
+            raise ValueError(
+                "Input contains NaN, the compiled model does not support missing values."
+            )
+
+        rows = np.arange(X.shape[0])[:, None]
+        node = np.repeat(self.roots[None, :], X.shape[0], axis=0)
+
+        for _ in range(self.max_depth):
+            x = X[rows, self.feature[node]]
+            threshold = self.threshold[node]
+
+            go_left = x < threshold if self.strict else x <= threshold
+            go_left = np.where(np.isnan(x), self.default_left[node], go_left)
+
+            node = np.where(go_left, self.left[node], self.right[node])
+
+        return node
+
+    def decision_function(self, X) -> np.ndarray:
+        """
+        Raw score of each output, before the link function.
+
+        Parameters
+        ----------
+        X : array-like
+            Data of shape (n_rows, n_features)
+
+        Returns
+        -------
+        np.ndarray
+            Raw scores of shape (n_rows, n_outputs)
+        """
+
+        leaf_values = self.value[self.apply(X)]
+
+        if self.value.shape[1] == 1 and len(self.offset) > 1:
+            raw = np.stack(
+                [
+                    leaf_values[:, self.tree_output == output, 0].sum(axis=1)
+                    for output in range(len(self.offset))
+                ],
+                axis=1,
+            )
+        elif self.average:
+            raw = leaf_values.mean(axis=1)
+        else:
+            raw = leaf_values.sum(axis=1)
+
+        return raw + self.offset
+
+    def predict_proba(self, X) -> np.ndarray:
+        """
+        Class probabilities of a classifier.
+
+        Parameters
+        ----------
+        X : array-like
+            Data of shape (n_rows, n_features)
+
+        Returns
+        -------
+        np.ndarray
+            Probabilities of shape (n_rows, n_classes)
+        """
+
+        if self.classes is None:
+            raise ValueError("Probabilities can only be predicted for classifiers.")
+
+        raw = self.decision_function(X)
+
+        if self.link == "sigmoid":
+            positive = 1 / (1 + np.exp(-raw[:, 0]))
+
+            return np.stack([1 - positive, positive], axis=1)
+        elif self.link == "softmax":
+            exp = np.exp(raw - raw.max(axis=1, keepdims=True))
+
+            return exp / exp.sum(axis=1, keepdims=True)
+
+        return raw
+
+    def predict(self, X) -> np.ndarray:
+        """
+        Predicts classes of a classifier or values of a regressor.
+
+        Parameters
+        ----------
+        X : array-like
+            Data of shape (n_rows, n_features)
+
+        Returns
+        -------
+        np.ndarray
+            Predictions
+        """
+
+        if self.classes is not None:
+            return self.classes[self.predict_proba(X).argmax(axis=1)]
+
+        raw = self.decision_function(X)
+
+        return raw[:, 0] if raw.shape[1] == 1 else raw
+
+    def save(self, path: str):
+        """
+        Writes the ensemble to a .npz file.
+
+        Parameters
+        ----------
+        path : str
+            File path
+        """
+
+        arrays = {
+            "feature": self.feature,
+            "threshold": self.threshold,
+            "left": self.left,
+            "right": self.right,
+            "default_left": self.default_left,
+            "value": self.value,
+            "roots": self.roots,
+            "tree_output": self.tree_output,
+            "offset": self.offset,
+            "meta": np.array(
+                json.dumps(
+                    {
+                        "link": self.link,
+                        "average": self.average,
+                        "strict": self.strict,
+                        "float32": self.float32,
+                        "allow_nan": self.allow_nan,
+                    }
+                )
+            ),
+        }
+
+        if self.classes is not None:
+            classes = self.classes
+            arrays["classes"] = (
+                classes.astype(str) if classes.dtype == object else classes
+            )
+
+        with open(path, "wb") as f:
+            np.savez_compressed(f, **arrays)
+
+    @classmethod
+    def load(cls, path: str):
+        """
+        Reads an ensemble written with `save`.
+
+        Parameters
+        ----------
+        path : str
+            File path
+
+        Returns
+        -------
+        CompiledTreeEnsemble
+            Compiled ensemble
+        """
+
+        with np.load(path, allow_pickle=False) as arrays:
+            meta = json.loads(str(arrays["meta"]))
+
+            return cls(
+                arrays["feature"],
+                arrays["threshold"],
+                arrays["left"],
+                arrays["right"],
+                arrays["default_left"],
+                arrays["value"],
+                arrays["roots"],
+                arrays["tree_output"],
+                arrays["offset"],
+                classes=arrays["classes"] if "classes" in arrays else None,
+                **meta,
+            )
+
+
+class _TreeBuilder(object):
+    """Accumulates trees into flat node arrays."""
+
+    def __init__(self):
+
+        self.feature = []
+        self.threshold = []
+        self.left = []
+        self.right = []
+        self.default_left = []
+        self.value = []
+        self.roots = []
+        self.tree_output = []
+
+    def add_node(self, feature=0, threshold=0.0, default_left=False, value=0.0):
+        """Adds a node, as a leaf until its children are set, and returns its index."""
+
+        index = len(self.feature)
+
+        self.feature.append(feature)
+        self.threshold.append(threshold)
+        self.left.append(index)
+        self.right.append(index)
+        self.default_left.append(default_left)
+        self.value.append(np.atleast_1d(value))
+
+        return index
+
+    def add_tree(self, root: int, output=0):
+
+        self.roots.append(root)
+        self.tree_output.append(output)
+
+    def build(self, offset, **kwargs) -> CompiledTreeEnsemble:
+
+        return CompiledTreeEnsemble(
+            self.feature,
+            self.threshold,
+            self.left,
+            self.right,
+            self.default_left,
+            np.stack(self.value),
+            self.roots,
+            self.tree_output,
+            offset,
+            **kwargs,
+        )
+
+
+def _add_sklearn_tree(builder: _TreeBuilder, tree, values, output=0):
+    """Adds a fitted sklearn `Tree` with the given node values."""
+
+    start = len(builder.feature)
+    # Trees of sklearn < 1.3 do not support missing values
+    missing_go_to_left = getattr(tree, "missing_go_to_left", None)
+
+    for node in range(tree.node_count):
+        builder.add_node(
+            feature=max(tree.feature[node], 0),
+            threshold=tree.threshold[node],
+            default_left=bool(missing_go_to_left[node])
+            if missing_go_to_left is not None
+            else False,
+            value=values[node],
+        )
+
+        if tree.children_left[node] != -1:
+            builder.left[start + node] = start + tree.children_left[node]
+            builder.right[start + node] = start + tree.children_right[node]
+
+    builder.add_tree(start, output)
+
+
+def _sklearn_allow_nan(model) -> bool:
+    """Whether a sklearn model accepts missing values."""
+
+    if hasattr(model, "__sklearn_tags__"):
+        return model.__sklearn_tags__().input_tags.allow_nan
+
+    return model._get_tags().get("allow_nan", False)
+
+
+def _compile_sklearn(model) -> CompiledTreeEnsemble:
+    """Compiles sklearn decision trees, forests and gradient boosting models."""
+
+    from sklearn.base import is_classifier
+    from sklearn.ensemble import (
+        ExtraTreesClassifier,
+        ExtraTreesRegressor,
+        GradientBoostingClassifier,
+        GradientBoostingRegressor,
+        RandomForestClassifier,
+        RandomForestRegressor,
+    )
+    from sklearn.tree import BaseDecisionTree
+
+    builder = _TreeBuilder()
+    classifier = is_classifier(model)
+
+    if isinstance(model, (GradientBoostingClassifier, GradientBoostingRegressor)):
+        for stage in model.estimators_:
+            for output, estimator in enumerate(stage):
+                _add_sklearn_tree(
+                    builder,
+                    estimator.tree_,
+                    estimator.tree_.value[:, 0, :] * model.learning_rate,
+                    output,
+                )
+
+        n_outputs = model.estimators_.shape[1]
+        ensemble = builder.build(
+            np.zeros(n_outputs),
+            classes=model.classes_ if classifier else None,
+            link=("softmax" if n_outputs > 1 else "sigmoid")
+            if classifier
+            else "identity",
+            float32=True,
+            allow_nan=_sklearn_allow_nan(model),
+        )
+
+        return ensemble
+
+    if isinstance(model, BaseDecisionTree):
+        estimators = [model]
+    elif isinstance(
+        model,
+        (
+            RandomForestClassifier,
+            RandomForestRegressor,
+            ExtraTreesClassifier,
+            ExtraTreesRegressor,
+        ),
+    ):
+        estimators = model.estimators_
+    else:
+        raise ValueError(f"Model {type(model).__name__} cannot be compiled.")
+
+    if getattr(model, "n_outputs_", 1) > 1 and classifier:
+        raise ValueError("Multi-output classifiers cannot be compiled.")
+
+    for estimator in estimators:
+        if classifier:
+            values = estimator.tree_.value[:, 0, :]
+            values = values / values.sum(axis=1, keepdims=True)
+        else:
+            values = estimator.tree_.value[:, :, 0]
+
+        _add_sklearn_tree(builder, estimator.tree_, values)
+
+    n_outputs = builder.value[0].shape[0]
+
+    return builder.build(
+        np.zeros(n_outputs),
+        classes=model.classes_ if classifier else None,
+        link="proba" if classifier else "identity",
+        average=True,
+        float32=True,
+        allow_nan=_sklearn_allow_nan(model),
+    )
+
+
+def _compile_xgboost(model) -> CompiledTreeEnsemble:
+    """Compiles XGBoost models from their json dump."""
+
+    booster = model.get_booster()
+    feature_names = booster.feature_names
+    classifier = hasattr(model, "classes_")
+    n_outputs = model.n_classes_ if classifier and model.n_classes_ > 2 else 1
+    parallel_trees = model.get_params().get("num_parallel_tree") or 1
+    builder = _TreeBuilder()
+
+    def feature_index(name):
+        return feature_names.index(name) if feature_names else int(name[1:])
+
+    def add(node):
+        if "leaf" in node:
+            return builder.add_node(value=node["leaf"])
+
+        if "split_condition" not in node:
+            raise ValueError("XGBoost models with categorical splits cannot be compiled.")
+
+        index = builder.add_node(
+            feature=feature_index(node["split"]),
+            threshold=np.float32(node["split_condition"]),
+            default_left=node["missing"] == node["yes"],
+        )
+        children = {child["nodeid"]: add(child) for child in node["children"]}
+
+        builder.left[index] = children[node["yes"]]
+        builder.right[index] = children[node["no"]]
+
+        return index
+
+    for i, tree in enumerate(booster.get_dump(dump_format="json")):
+        builder.add_tree(add(json.loads(tree)), (i // parallel_trees) % n_outputs)
+
+    return builder.build(
+        np.zeros(n_outputs),
+        classes=model.classes_ if classifier else None,
+        link=("softmax" if n_outputs > 1 else "sigmoid") if classifier else "identity",
+        strict=True,
+        float32=True,
+    )
+
+
+def _compile_lightgbm(model) -> CompiledTreeEnsemble:
+    """Compiles LightGBM models from their json dump."""
+
+    dump = model.booster_.dump_model()
+    n_outputs = dump["num_tree_per_iteration"]
+    classifier = hasattr(model, "classes_")
+    builder = _TreeBuilder()
+
+    def add(node):
+        if "leaf_value" in node:
+            return builder.add_node(value=node["leaf_value"])
+
+        if node["decision_type"] != "<=" or node["missing_type"] == "Zero":
+            raise ValueError(
+                "LightGBM models with categorical splits or zero as missing cannot be compiled."
+            )
+
+        threshold = node["threshold"]
+        index = builder.add_node(
+            feature=node["split_feature"],
+            threshold=threshold,
+            # Without missing values in training, missing values are treated as zero
+            default_left=node["default_left"]
+            if node["missing_type"] == "NaN"
+            else 0 <= threshold,
+        )
+
+        builder.left[index] = add(node["left_child"])
+        builder.right[index] = add(node["right_child"])
+
+        return index
+
+    for i, tree in enumerate(dump["tree_info"]):
+        builder.add_tree(add(tree["tree_structure"]), i % n_outputs)
+
+    return builder.build(
+        np.zeros(n_outputs),
+        classes=model.classes_ if classifier else None,
+        link=("softmax" if n_outputs > 1 else "sigmoid") if classifier else "identity",
+    )
+
+
+def _reference_rows(X, n_features: int, allow_nan: bool, n_rows=100) -> np.ndarray:
+    """
+    Rows a compiled model is checked against: a row of zeros, the first rows of `X`
+    and the first of its rows with missing values, unless the model does not accept them.
+    """
+
+    rows = [np.zeros((1, n_features))]
+
+    if X is not None:
+        X = np.asarray(X, dtype=np.float64).reshape(-1, n_features)
+        missing = np.isnan(X).any(axis=1)
+
+        rows.append(X[~missing][:n_rows])
+
+        if allow_nan:
+            rows.append(X[missing][:n_rows])
+
+    return np.concatenate(rows)
+
+
+def compile_model(model, X=None) -> CompiledTreeEnsemble:
+    """
+    Compiles a fitted tree based model into a NumPy only `CompiledTreeEnsemble`.
+
+    Supports DecisionTree, RandomForest, ExtraTrees and GradientBoosting models from sklearn, XGBoost and LightGBM models.
+
+    Parameters
+    ----------
+    model : Model Object
+        Fitted model
+
+    X : array-like, optional
+        Data the model was trained on, the compiled model is checked against the model on its first rows, by default None
+
+    Returns
+    -------
+    CompiledTreeEnsemble
+        Compiled model
+
+    Examples
+    --------
+    >>> compiled = compile_model(m.model, x_train[features])
+    >>> compiled.predict(x_test.values)
+    """
+
+    model_module = type(model).__module__.split(".")[0]
+
+    if model_module == "xgboost":
+        ensemble = _compile_xgboost(model)
+        n_features = model.get_booster().num_features()
+        dtype = np.float32
+        raw_score = partial(model.predict, output_margin=True)
+    elif model_module == "lightgbm":
+        ensemble = _compile_lightgbm(model)
+        n_features = model.booster_.num_feature()
+        dtype = np.float64
+        raw_score = partial(model.predict, raw_score=True)
+    elif model_module == "sklearn":
+        ensemble = _compile_sklearn(model)
+        n_features = model.n_features_in_
+        dtype = np.float32
+        raw_score = (
+            model.decision_function
+            if ensemble.link in ("sigmoid", "softmax")
+            else model.predict_proba
+            if ensemble.link == "proba"
+            else model.predict
+        )
+    else:
+        raise ValueError(f"Model {type(model).__name__} cannot be compiled.")
+
+    X = _reference_rows(X, n_features, ensemble.allow_nan).astype(dtype)
+
+    # Base scores are learnt differently by each library, the offset is recovered from a reference prediction
+    if ensemble.link != "proba":
+        ensemble.offset = (
+            np.reshape(raw_score(X[:1]), -1) - ensemble.decision_function(X[:1])[0]
+        )
+
+    # Libraries sum tree values as 32 bit floats, regression predictions only agree up to rounding
+    equal = (
+        np.array_equal
+        if ensemble.classes is not None
+        else partial(np.allclose, rtol=1e-4, atol=1e-5)
+    )
+
+    if not equal(ensemble.predict(X), model.predict(X)):
+        raise ValueError(
+            f"Model {type(model).__name__} cannot be compiled, its objective or missing value handling is not supported."
+        )
+
+    return ensemble
@@ -3,6 +3,7 @@ import math
 import os
 import warnings
 from collections import OrderedDict
+from concurrent.futures import Future
 from itertools import compress
 
 import xgboost as xgb
@@ -13,8 +14,10 @@ from IPython.display import HTML, SVG, display
 
 from aethos.config.config import _global_config
 from aethos.feature_engineering.util import sklearn_dim_reduction
+from aethos.model_analysis.compiled_model import compile_model
 from aethos.model_analysis.model_explanation import MSFTInterpret, Shap
 from aethos.modelling.util import (
+    to_model_input,
     to_pickle,
     track_artifacts,
     _get_cv_type,
@@ -42,6 +45,22 @@ class ModelAnalysisBase(Visualizations, Stats):
 
         return data
 
+    @property
+    def run_id(self):
+        """MLFlow run id of the model, waits for the model to be logged when it is tracked in the background."""
+
+        run_id = self._run_id
+
+        if isinstance(run_id, Future):
+            run_id = run_id.result()
+
+        return run_id
+
+    @run_id.setter
+    def run_id(self, run_id):
+
+        self._run_id = run_id
+
     @property
     def train_results(self):
 
@@ -74,33 +93,146 @@ class ModelAnalysisBase(Visualizations, Stats):
 
         to_pickle(self.model, self.model_name)
 
-    def to_service(self, project_name: str):
+    def to_service(
+        self,
+        project_name: str,
+        compiled=False,
+        workers=None,
+        max_batch_size=64,
+        max_wait_ms=5,
+    ):
         """
         Creates an app.py, requirements.txt and Dockerfile in `~/.aethos/projects` and the necessary folder structure
         to run the model as a microservice.
+
+        Tree based models (DecisionTree, RandomForest, ExtraTrees, GradientBoosting, XGBoost and LightGBM) can be compiled into
+        flat NumPy arrays, the service then predicts with NumPy only and does not need the library the model was trained with.
         
         Parameters
         ----------
         project_name : str
             Name of the project that you want to create.
 
+        compiled : bool, optional
+            Whether to serve a compiled tree based model, by default False
+
+        workers : int, optional
+            Number of worker processes serving the model, by default picked from the number of cores
+
+        max_batch_size : int, optional
+            Maximum number of concurrent single row requests predicted together, by default 64
+
+        max_wait_ms : int, optional
+            Maximum time in milliseconds a single row request waits to be batched with others, by default 5
+
         Examples
         --------
         >>> m = Model(df)
         >>> m_results = m.LogisticRegression()
         >>> m_results.to_service('your_proj_name')
+        >>> m_results = m.RandomForestClassification()
+        >>> m_results.to_service('your_proj_name', compiled=True)
         """
 
-        to_pickle(self.model, self.model_name, project=True, project_name=project_name)
-        tg.generate_service(project_name, f"{self.model_name}.pkl", self.model)
+        if compiled:
+            tg.generate_service(
+                project_name,
+                f"{self.model_name}.npz",
+                compile_model(
+                    self.model,
+                    self.x_train[self.features] if hasattr(self, "features") else None,
+                ),
+                compiled=True,
+                workers=workers,
+                max_batch_size=max_batch_size,
+                max_wait_ms=max_wait_ms,
+                features=getattr(self, "features", None),
+            )
+        else:
+            to_pickle(
+                self.model, self.model_name, project=True, project_name=project_name
+            )
+            tg.generate_service(
+                project_name,
+                f"{self.model_name}.pkl",
+                self.model,
+                workers=workers,
+                max_batch_size=max_batch_size,
+                max_wait_ms=max_wait_ms,
+                features=getattr(self, "features", None),
+            )
 
         print("To run:")
         print("\tdocker build -t `image_name` ./")
         print("\tdocker run -d --name `container_name` -p `port_num`:80 `image_name`")
 
+    def benchmark_service(
+        self,
+        project_name: str,
+        concurrency=16,
+        n_requests=1000,
+        batch_size=64,
+        in_process=False,
+        workers=1,
+    ):
+        """
+        Load tests the service created with `to_service` by replaying rows of the test data, or training data for unsupervised models,
+        against its single row `/predict` and `/predict_batch` endpoints.
+
+        The service is started locally with uvicorn, in a subprocess or in a thread of this process.
+        
+        Parameters
+        ----------
+        project_name : str
+            Name of the project the service was created in.
+
+        concurrency : int, optional
+            Number of requests in flight at once, by default 16
+
+        n_requests : int, optional
+            Number of requests sent to each endpoint, by default 1000
+
+        batch_size : int, optional
+            Number of rows in each `/predict_batch` request, by default 64
+
+        in_process : bool, optional
+            Whether to run the service in a thread of this process rather than in a uvicorn subprocess, by default False
+
+        workers : int, optional
+            Number of uvicorn workers when running the service in a subprocess, by default 1
+
+        Returns
+        -------
+        pd.DataFrame
+            Requests, rows, error rate, throughput and p50/p95/p99 latency in ms of each endpoint
+
+        Examples
+        --------
+        >>> m = model.XGBoostClassification()
+        >>> m.to_service('your_proj_name', compiled=True)
+        >>> m.benchmark_service('your_proj_name', concurrency=32)
+        """
+
+        from aethos.templates.benchmark import benchmark_service
+
+        if hasattr(self, "x_test"):
+            data = self.x_test[self.features]
+        else:
+            data = self.x_train.drop(columns=self.cluster_col, errors="ignore")
+
+        return benchmark_service(
+            os.path.join(tg.project_dir, project_name, "app"),
+            data,
+            concurrency=concurrency,
+            n_requests=n_requests,
+            batch_size=batch_size,
+            in_process=in_process,
+            workers=workers,
+        )
+
 
 class SupervisedModelAnalysis(ModelAnalysisBase):
-    def __init__(self, model, x_train, x_test, y_train, y_test, model_name):
+    def __init__(self, model, x_train, x_test, y_train, y_test, model_name, explain=True):
 
         self.model = model
         self.model_name = model_name
@@ -110,29 +242,148 @@ class SupervisedModelAnalysis(ModelAnalysisBase):
         self.y_test = y_test
         self.features = x_test.columns
         self.y_pred = self.model.predict(
-            self.x_test[self.features]
+            to_model_input(model, self.x_test[self.features])
         )  # Specifying columns for XGBoost
         self.run_id = None
+        self.explain = explain
 
         if hasattr(model, "predict_proba"):
-            self.probabilities = self.model.predict_proba(self.x_test[self.features])
+            self.probabilities = self.model.predict_proba(
+                to_model_input(model, self.x_test[self.features])
+            )
 
-        self.shap = Shap(
-            self.model,
-            self.model_name,
-            self.x_train,
-            self.x_test,
-            self.y_test,
-            SHAP_LEARNERS[type(self.model)],
-        )
-        self.interpret = MSFTInterpret(
-            self.model,
-            self.x_train,
-            self.x_test,
-            self.y_train,
-            self.y_test,
-            PROBLEM_TYPE[type(self.model)],
-        )
+        # Explainers are expensive to build, they are created on first use.
+        # SHAP explainers are cached per explanation budget.
+        self._shap = {}
+        self._interpret = None
+        self._compiled = None
+
+    @property
+    def shap(self):
+        """SHAP explainer of the model with the default explanation budget, built the first time it is needed."""
+
+        return self._get_shap()
+
+    @property
+    def interpret(self):
+        """MSFT Interpret explainer of the model, built the first time it is needed."""
+
+        if self._interpret is None:
+            self._check_explain()
+
+            self._interpret = MSFTInterpret(
+                self.model,
+                self.x_train,
+                self.x_test,
+                self.y_train,
+                self.y_test,
+                PROBLEM_TYPE[type(self.model)],
+            )
+
+        return self._interpret
+
+    def _get_shap(self, background_size=None, max_rows=None):
+        """
+        Returns the SHAP explainer for an explanation budget, building it if needed.
+
+        The budget only applies to models explained with the KernelExplainer.
+
+        Parameters
+        ----------
+        background_size : int, optional
+            Number of k-means summarized training samples used as background data, 0 to use every training sample,
+            by default the `shap_background_size` option
+
+        max_rows : int, optional
+            Maximum number of test samples to explain, 0 to explain every test sample, by default the `shap_max_rows` option
+
+        Returns
+        -------
+        Shap
+            SHAP explainer of the model
+        """
+
+        learner = SHAP_LEARNERS[type(self.model)]
+
+        if learner == "kernel":
+            budget = (
+                _global_config["shap_background_size"]
+                if background_size is None
+                else background_size,
+                _global_config["shap_max_rows"] if max_rows is None else max_rows,
+            )
+        else:
+            budget = (None, None)
+
+        if budget not in self._shap:
+            self._check_explain()
+
+            self._shap[budget] = Shap(
+                self.model,
+                self.model_name,
+                self.x_train,
+                self.x_test,
+                self.y_test,
+                learner,
+                background_size=budget[0],
+                max_rows=budget[1],
+            )
+
+        return self._shap[budget]
+
+    @property
+    def compiled_model(self):
+        """Tree based model compiled into flat NumPy arrays, built the first time it is needed."""
+
+        if self._compiled is None:
+            self._compiled = compile_model(self.model, self.x_train[self.features])
+
+        return self._compiled
+
+    def compiled_predict(self, data=None, proba=False):
+        """
+        Predicts with the model compiled into flat NumPy arrays, all trees are traversed for all rows at once.
+
+        Much faster than the model's own predict for small batches and single rows.
+        Supports DecisionTree, RandomForest, ExtraTrees, GradientBoosting, XGBoost and LightGBM models.
+
+        Parameters
+        ----------
+        data : pd.DataFrame or np.ndarray, optional
+            Data to predict, by default the test data
+
+        proba : bool, optional
+            Whether to predict class probabilities instead of classes, by default False
+
+        Returns
+        -------
+        np.ndarray
+            Predictions
+
+        Examples
+        --------
+        >>> m = model.RandomForestClassification()
+        >>> m.compiled_predict()
+        >>> m.compiled_predict(df.iloc[[0]], proba=True)
+        """
+
+        data = self.x_test if data is None else data
+
+        if isinstance(data, pd.DataFrame):
+            data = data[self.features].to_numpy()
+
+        if proba:
+            return self.compiled_model.predict_proba(data)
+
+        return self.compiled_model.predict(data)
+
+    def _check_explain(self):
+        """Raises an error if model explanations have been disabled for this model."""
+
+        if not self.explain:
+            raise ValueError(
+                f"Model explanations are disabled for {self.model_name}. Rerun the model with `explain=True` to use them."
+            )
 
     def model_weights(self):
         """
@@ -171,7 +422,9 @@ class SupervisedModelAnalysis(ModelAnalysisBase):
 
             print(report_string.strip())
 
-    def summary_plot(self, output_file="", **summaryplot_kwargs):
+    def summary_plot(
+        self, output_file="", background_size=None, max_rows=None, **summaryplot_kwargs
+    ):
         """
         Create a SHAP summary plot, colored by feature values when they are provided.
 
@@ -182,6 +435,14 @@ class SupervisedModelAnalysis(ModelAnalysisBase):
         output_file: str
             Output file name including extension (.png, .jpg, etc.) to save image as.
 
+        background_size : int, optional
+            Number of k-means summarized training samples used as background data when explaining with the KernelExplainer,
+            by default the `shap_background_size` option
+
+        max_rows : int, optional
+            Maximum number of test samples, sampled stratified on the target, explained by the KernelExplainer,
+            by default the `shap_max_rows` option
+
         max_display : int
             How many top features to include in the plot (default is 20, or 7 for interaction plots), by default None
             
@@ -224,15 +485,12 @@ class SupervisedModelAnalysis(ModelAnalysisBase):
         >>> m.summary_plot()
         """
 
-        if self.shap is None:
-            raise NotImplementedError(
-                f"SHAP is not implemented yet for {str(type(self))}"
-            )
+        explainer = self._get_shap(background_size, max_rows)
 
-        self.shap.summary_plot(output_file=output_file, **summaryplot_kwargs)
+        explainer.summary_plot(output_file=output_file, **summaryplot_kwargs)
 
         if _global_config["track_experiments"]:  # pragma: no cover
-            track_artifacts(self.run_id, self.model_name)
+            track_artifacts(self._run_id, self.model_name)
 
     def decision_plot(
         self,
@@ -240,6 +498,8 @@ class SupervisedModelAnalysis(ModelAnalysisBase):
         sample_no=None,
         highlight_misclassified=False,
         output_file="",
+        background_size=None,
+        max_rows=None,
         **decisionplot_kwargs,
     ):
         """
@@ -296,6 +556,14 @@ class SupervisedModelAnalysis(ModelAnalysisBase):
         highlight_misclassified : bool, optional
             True to highlight the misclassified results, by default False
 
+        background_size : int, optional
+            Number of k-means summarized training samples used as background data when explaining with the KernelExplainer,
+            by default the `shap_background_size` option
+
+        max_rows : int, optional
+            Maximum number of test samples, sampled stratified on the target, explained by the KernelExplainer,
+            by default the `shap_max_rows` option
+
         feature_order : str or None or list or numpy.ndarray
             Any of "importance" (the default), "hclust" (hierarchical clustering), "none", or a list/array of indices.
             hclust is useful for finding outliers.
@@ -364,28 +632,31 @@ class SupervisedModelAnalysis(ModelAnalysisBase):
         >>> m.decision_plot(no_sample=42, feature_order=r.feature_idx, xlim=r.xlim)
         """
 
-        if self.shap is None:
-            raise NotImplementedError(
-                f"SHAP is not implemented yet for {str(type(self))}"
-            )
+        explainer = self._get_shap(background_size, max_rows)
 
         if highlight_misclassified:
-            if not any(self.shap.misclassified_values):
+            if not any(explainer.misclassified_values):
                 raise AttributeError("There are no misclassified values!")
 
-            decisionplot_kwargs["highlight"] = self.shap.misclassified_values
+            decisionplot_kwargs["highlight"] = explainer.misclassified_values
 
-        dp = self.shap.decision_plot(
+        dp = explainer.decision_plot(
             num_samples, sample_no, output_file=output_file, **decisionplot_kwargs
         )
 
         if _global_config["track_experiments"]:  # pragma: no cover
-            track_artifacts(self.run_id, self.model_name)
+            track_artifacts(self._run_id, self.model_name)
 
         return dp
 
     def force_plot(
-        self, sample_no=None, misclassified=False, output_file="", **forceplot_kwargs
+        self,
+        sample_no=None,
+        misclassified=False,
+        output_file="",
+        background_size=None,
+        max_rows=None,
+        **forceplot_kwargs,
     ):
         """
         Visualize the given SHAP values with an additive force layout
@@ -401,6 +672,14 @@ class SupervisedModelAnalysis(ModelAnalysisBase):
         output_file: str
             Output file name including extension (.png, .jpg, etc.) to save image as.
 
+        background_size : int, optional
+            Number of k-means summarized training samples used as background data when explaining with the KernelExplainer,
+            by default the `shap_background_size` option
+
+        max_rows : int, optional
+            Maximum number of test samples, sampled stratified on the target, explained by the KernelExplainer,
+            by default the `shap_max_rows` option
+
         link : "identity" or "logit"
             The transformation used when drawing the tick mark labels. Using logit will change log-odds numbers
             into probabilities. 
@@ -416,30 +695,33 @@ class SupervisedModelAnalysis(ModelAnalysisBase):
         >>> m.forceplot(no_sample=1, misclassified=True) # Analyze the first misclassified result
         """
 
-        if self.shap is None:
-            raise NotImplementedError(
-                f"SHAP is not implemented yet for {str(type(self))}"
-            )
+        explainer = self._get_shap(background_size, max_rows)
 
         if misclassified:
-            if not any(self.shap.misclassified_values):
+            if not any(explainer.misclassified_values):
                 raise AttributeError("There are no misclassified values!")
 
-            forceplot_kwargs["shap_values"] = self.shap.shap_values[
-                self.shap.misclassified_values
+            forceplot_kwargs["shap_values"] = explainer.shap_values[
+                explainer.misclassified_values
             ]
 
-        fp = self.shap.force_plot(
+        fp = explainer.force_plot(
             sample_no, output_file=output_file, **forceplot_kwargs
         )
 
         if _global_config["track_experiments"]:  # pragma: no cover
-            track_artifacts(self.run_id, self.model_name)
+            track_artifacts(self._run_id, self.model_name)
 
         return fp
 
     def dependence_plot(
-        self, feature: str, interaction="auto", output_file="", **dependenceplot_kwargs
+        self,
+        feature: str,
+        interaction="auto",
+        output_file="",
+        background_size=None,
+        max_rows=None,
+        **dependenceplot_kwargs,
     ):
         """
         A dependence plot is a scatter plot that shows the effect a single feature has on the predictions made by the mode.
@@ -466,6 +748,14 @@ class SupervisedModelAnalysis(ModelAnalysisBase):
         output_file: str
             Output file name including extension (.png, .jpg, etc.) to save image as.
 
+        background_size : int, optional
+            Number of k-means summarized training samples used as background data when explaining with the KernelExplainer,
+            by default the `shap_background_size` option
+
+        max_rows : int, optional
+            Maximum number of test samples, sampled stratified on the target, explained by the KernelExplainer,
+            by default the `shap_max_rows` option
+
         x_jitter : float (0 - 1)
             Adds random jitter to feature values. May increase plot readability when feature is discrete.
 
@@ -490,17 +780,14 @@ class SupervisedModelAnalysis(ModelAnalysisBase):
         >>> m.dependence_plot()
         """
 
-        if self.shap is None:
-            raise NotImplementedError(
-                f"SHAP is not implemented yet for {str(type(self))}"
-            )
+        explainer = self._get_shap(background_size, max_rows)
 
-        dp = self.shap.dependence_plot(
+        dp = explainer.dependence_plot(
             feature, interaction, output_file=output_file, **dependenceplot_kwargs
         )
 
         if _global_config["track_experiments"]:  # pragma: no cover
-            track_artifacts(self.run_id, self.model_name)
+            track_artifacts(self._run_id, self.model_name)
 
         return dp
 
@@ -521,6 +808,10 @@ class SupervisedModelAnalysis(ModelAnalysisBase):
             )
         )
 
+        # Only a sample of the test data is explained on large test sets
+        if self.shap.rows is not None:
+            sample_list = self.shap.rows[sample_list].tolist()
+
         return sample_list
 
     def interpret_model(self, show=True):  # pragma: no cover
@@ -804,7 +1095,7 @@ class SupervisedModelAnalysis(ModelAnalysisBase):
                 f"Model {str(self.model)} cannot be viewed as a tree"
             )
 
-    def _cross_validate(self, cv_type, score, n_splits, shuffle, **kwargs):
+    def _cross_validate(self, cv_type, score, n_splits, shuffle, n_jobs=-1, **kwargs):
         """Runs crossvalidation on a model"""
 
         cv = _get_cv_type(cv_type, n_splits, shuffle, **kwargs)
@@ -816,4 +1107,5 @@ class SupervisedModelAnalysis(ModelAnalysisBase):
             cv=cv,
             scoring=score,
             model_name=self.model_name,
+            n_jobs=n_jobs,
         )
@@ -11,9 +11,18 @@ warnings.simplefilter("ignore", UserWarning)
 
 
 class Shap(object):
-    def __init__(self, model, model_name, x_train, x_test, y_test, learner: str):
+    def __init__(
+        self,
+        model,
+        model_name,
+        x_train,
+        x_test,
+        y_test,
+        learner: str,
+        background_size=None,
+        max_rows=None,
+    ):
 
-        import lightgbm as lgb
         import shap
 
         self.model = model
@@ -21,6 +30,9 @@ class Shap(object):
         self.x_train = x_train
         self.x_test = x_test
         self.y_test = y_test
+        # Positions in x_test of the explained rows, None when every row is explained
+        self.rows = None
+        self._x_test_full = x_test
 
         if learner == "linear":
             self.explainer = shap.LinearExplainer(
@@ -34,19 +46,24 @@ class Shap(object):
             else:
                 func = self.model.predict
 
-            self.explainer = shap.KernelExplainer(func, self.x_train)
+            # The cost of the KernelExplainer grows with the size of the background data times
+            # the number of rows explained, so both are kept within budget.
+            if background_size and len(self.x_train) > background_size:
+                background = shap.kmeans(self.x_train, background_size)
+            else:
+                background = self.x_train
+
+            if max_rows and len(self.x_test) > max_rows:
+                self.rows = _stratified_sample(self.y_test, max_rows)
+                self.x_test = self.x_test.iloc[self.rows]
+                self.y_test = self.y_test.iloc[self.rows]
+
+            self.explainer = shap.KernelExplainer(func, background)
         else:
             raise ValueError(f"Learner: {learner} is not supported yet.")
 
         self.expected_value = self.explainer.expected_value
-        self.shap_values = np.array(self.explainer.shap_values(self.x_test)).astype(
-            float
-        )
-
-        if isinstance(self.model, lgb.sklearn.LGBMClassifier) and isinstance(
-            self.expected_value, np.float
-        ):
-            self.shap_values = self.shap_values[1]
+        self.shap_values = self._shap_values(self.x_test)
 
         # Calculate misclassified values
         self.misclassified_values = self._calculate_misclassified()
@@ -54,6 +71,46 @@ class Shap(object):
         # As per SHAP guidelines, test data needs to be dense for plotting functions
         self.x_test_array = self.x_test.values
 
+    def _shap_values(self, x) -> np.ndarray:
+        """SHAP values of the rows of x."""
+
+        import lightgbm as lgb
+
+        shap_values = np.array(self.explainer.shap_values(x)).astype(float)
+
+        if isinstance(self.model, lgb.sklearn.LGBMClassifier) and isinstance(
+            self.expected_value, np.float
+        ):
+            shap_values = shap_values[1]
+
+        return shap_values
+
+    def _sample(self, sample_no: int):
+        """
+        SHAP values of a row of the test data, numbered from 1, and its slice of the explained rows.
+
+        Rows left out of the explained rows are explained on their own and have no slice.
+        """
+
+        if sample_no < 1 or not isinstance(sample_no, int):
+            raise ValueError("Sample number must be greater than 1.")
+
+        position = sample_no - 1
+
+        if self.rows is None:
+            samples = slice(position, sample_no)
+
+            return self.shap_values[samples], samples
+
+        i = np.searchsorted(self.rows, position)
+
+        if i < len(self.rows) and self.rows[i] == position:
+            samples = slice(i, i + 1)
+
+            return self.shap_values[samples], samples
+
+        return self._shap_values(self._x_test_full.iloc[[position]]), None
+
     def summary_plot(self, output_file="", **summaryplot_kwargs):
         """
         Plots a SHAP summary plot.
@@ -104,10 +161,7 @@ class Shap(object):
         highlight = decisionplot_kwargs.pop("highlight", None)
 
         if sample_no is not None:
-            if sample_no < 1 or not isinstance(sample_no, int):
-                raise ValueError("Sample number must be greater than 1.")
-
-            samples = slice(sample_no - 1, sample_no)
+            shap_values, samples = self._sample(sample_no)
         else:
             if num_samples == "all":
                 samples = slice(0, len(self.x_test_array))
@@ -120,12 +174,14 @@ class Shap(object):
             else:
                 samples = slice(0, num_samples)
 
+            shap_values = self.shap_values[samples]
+
         if highlight is not None:
-            highlight = highlight[samples]
+            highlight = highlight[samples] if samples is not None else None
 
         s = shap.decision_plot(
             self.expected_value,
-            self.shap_values[samples],
+            shap_values,
             self.x_train.columns,
             return_objects=return_objects,
             highlight=highlight,
@@ -145,19 +201,23 @@ class Shap(object):
 
         import shap
 
-        shap_values = forceplot_kwargs.pop("shap_values", self.shap_values)
+        shap_values = forceplot_kwargs.pop("shap_values", None)
 
-        if sample_no is not None:
+        # Sample numbers refer to rows of the test data, or to the given SHAP values
+        if shap_values is None:
+            if sample_no is not None:
+                shap_values, _ = self._sample(sample_no)
+            else:
+                shap_values = self.shap_values
+        elif sample_no is not None:
             if sample_no < 1 or not isinstance(sample_no, int):
                 raise ValueError("Sample number must be greater than 1.")
 
-            samples = slice(sample_no - 1, sample_no)
-        else:
-            samples = slice(0, len(shap_values))
+            shap_values = shap_values[sample_no - 1 : sample_no]
 
         s = shap.force_plot(
             self.expected_value,
-            shap_values[samples],
+            shap_values,
             self.x_train.columns,
             **forceplot_kwargs,
         )
@@ -212,6 +272,39 @@ class Shap(object):
         return misclassified
 
 
+def _stratified_sample(y, n_rows):
+    """
+    Samples `n_rows` rows, stratified on y when possible.
+
+    Parameters
+    ----------
+    y : pd.Series
+        Labels used to stratify the sample
+
+    n_rows : int
+        Number of rows to sample
+
+    Returns
+    -------
+    np.ndarray
+        Positions of the sampled rows, in their original order
+    """
+
+    from sklearn.model_selection import train_test_split
+
+    positions = np.arange(len(y))
+
+    try:
+        sample, _ = train_test_split(
+            positions, train_size=n_rows, stratify=y, random_state=42
+        )
+    except ValueError:
+        # Continuous or sparse labels can't be stratified on
+        sample, _ = train_test_split(positions, train_size=n_rows, random_state=42)
+
+    return np.sort(sample)
+
+
 class MSFTInterpret(object):
     def __init__(self, model, x_train, x_test, y_train, y_test, problem):
 
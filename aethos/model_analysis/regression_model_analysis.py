@@ -10,7 +10,7 @@ from .model_analysis import SupervisedModelAnalysis
 
 class RegressionModelAnalysis(SupervisedModelAnalysis):
     def __init__(
-        self, model, x_train, x_test, target, model_name,
+        self, model, x_train, x_test, target, model_name, explain=True,
     ):
         """
         Class to analyze Regression models through metrics, global/local interpretation and visualizations.
@@ -31,6 +31,9 @@ class RegressionModelAnalysis(SupervisedModelAnalysis):
 
         model_name : str
             Name of the model for saving images and model tracking purposes
+
+        explain : bool, optional
+            False to disable the SHAP and Interpret model explanations, by default True
         """
 
         # TODO: Add check for pickle file
@@ -42,8 +45,11 @@ class RegressionModelAnalysis(SupervisedModelAnalysis):
             x_train[target],
             x_test[target],
             model_name,
+            explain=explain,
         )
 
+        self._metric_values = None
+
     def plot_predicted_actual(self, output_file="", **scatterplot_kwargs):
         """
         Plots the actual data vs. predictions
@@ -301,17 +307,12 @@ class RegressionModelAnalysis(SupervisedModelAnalysis):
 
         from aethos.model_analysis.constants import REG_METRICS_DESC
 
-        metric_list = {
-            "Explained Variance": self.explained_variance(),
-            "Max Error": self.max_error(),
-            "Mean Absolute Error": self.mean_abs_error(),
-            "Mean Squared Error": self.mean_sq_error(),
-            "Root Mean Sqaured Error": self.root_mean_sq_error(),
-            "Mean Squared Log Error": self.mean_sq_log_error(),
-            "Median Absolute Error": self.median_abs_error(),
-            "R2": self.r2(),
-            "SMAPE": self.smape(),
-        }
+        if self._metric_values is None:
+            self._metric_values = _residual_metrics(
+                np.asarray(self.y_test, dtype=float), np.asarray(self.y_pred, dtype=float)
+            )
+
+        metric_list = self._metric_values
 
         metric_table = pd.DataFrame(
             index=metric_list.keys(),
@@ -335,6 +336,7 @@ class RegressionModelAnalysis(SupervisedModelAnalysis):
         score="neg_root_mean_squared_error",
         n_splits=5,
         shuffle=False,
+        n_jobs=-1,
         **kwargs
     ):
         """
@@ -364,6 +366,63 @@ class RegressionModelAnalysis(SupervisedModelAnalysis):
 
         shuffle : bool, optional
             True to shuffle the data, by default False
+
+        n_jobs : int, optional
+            Number of folds and learning curve sizes to fit in parallel, -1 uses all the CPUs, by default -1
         """
 
-        super()._cross_validate(cv_type, score, n_splits, shuffle, **kwargs)
+        super()._cross_validate(
+            cv_type, score, n_splits, shuffle, n_jobs=n_jobs, **kwargs
+        )
+
+
+def _residual_metrics(y_true, y_pred) -> dict:
+    """
+    Computes every regression metric from a single residual vector.
+
+    Parameters
+    ----------
+    y_true : np.ndarray
+        True values
+
+    y_pred : np.ndarray
+        Predicted values
+
+    Returns
+    -------
+    dict
+        Metric name and value
+    """
+
+    residuals = y_true - y_pred
+    abs_residuals = np.abs(residuals)
+    mse = np.mean(residuals ** 2)
+    total_var = np.var(y_true)
+
+    if (y_true < 0).any() or (y_pred < 0).any():
+        warnings.warn(
+            "Mean Squared Logarithmic Error cannot be used when targets contain negative values."
+        )
+        msle = -999
+    else:
+        msle = np.mean((np.log1p(y_true) - np.log1p(y_pred)) ** 2)
+
+    # Constant targets, as scikit-learn scores are 1 for a perfect fit and 0 otherwise
+    if total_var == 0:
+        explained_variance = 1.0 if np.var(residuals) == 0 else 0.0
+        r2 = 1.0 if mse == 0 else 0.0
+    else:
+        explained_variance = 1 - np.var(residuals) / total_var
+        r2 = 1 - mse / total_var
+
+    return {
+        "Explained Variance": explained_variance,
+        "Max Error": abs_residuals.max(),
+        "Mean Absolute Error": abs_residuals.mean(),
+        "Mean Squared Error": mse,
+        "Root Mean Sqaured Error": math.sqrt(mse),
+        "Mean Squared Log Error": msle,
+        "Median Absolute Error": np.median(abs_residuals),
+        "R2": r2,
+        "SMAPE": np.mean(2 * abs_residuals / (np.abs(y_true) + np.abs(y_pred))),
+    }
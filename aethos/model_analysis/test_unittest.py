@@ -31,5 +31,162 @@ class TestModelAnalysis(unittest.TestCase):
 
         self.assertTrue(True)
 
+    def test_classification_metrics_single_pass(self):
+
+        data = np.random.randint(0, 2, size=(500, 3))
+
+        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+
+        model = Classification(x_train=data, target="col3", test_split_percentage=0.5,)
+        m = model.LogisticRegression(model_name="l1", run=True)
+
+        metrics = m.metrics()
+
+        self.assertAlmostEqual(metrics.loc["Accuracy", "l1"], round(m.accuracy(), 3))
+        self.assertAlmostEqual(metrics.loc["F-Beta", "l1"], round(m.fbeta(), 3))
+        self.assertAlmostEqual(metrics.loc["ROC AUC", "l1"], round(m.roc_auc(), 3))
+        self.assertAlmostEqual(
+            metrics.loc["Cohen Kappa", "l1"], round(m.cohen_kappa(), 3)
+        )
+
+    def test_classification_metrics_pos_label(self):
+
+        data = np.random.randint(0, 2, size=(500, 3))
+
+        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+        data["col3"] = data["col3"].map({0: "no", 1: "yes"})
+
+        model = Classification(x_train=data, target="col3", test_split_percentage=0.5,)
+        m = model.LogisticRegression(model_name="l1", run=True)
+
+        metrics = m.metrics(pos_label="yes")
+
+        self.assertRaises(ValueError, m.metrics)
+        self.assertAlmostEqual(
+            metrics.loc["Precision", "l1"], round(m.precision(pos_label="yes"), 3)
+        )
+        self.assertAlmostEqual(
+            metrics.loc["Average Precision", "l1"],
+            round(m.average_precision(pos_label="yes"), 3),
+        )
+
+    def test_regression_metrics_single_pass(self):
+
+        data = np.random.randint(0, 10, size=(500, 3))
+
+        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+
+        model = Regression(x_train=data, target="col3", test_split_percentage=0.5,)
+        m = model.LinearRegression(model_name="l1", run=True)
+
+        metrics = m.metrics()
+
+        self.assertAlmostEqual(metrics.loc["R2", "l1"], round(m.r2(), 3))
+        self.assertAlmostEqual(
+            metrics.loc["Mean Absolute Error", "l1"], round(m.mean_abs_error(), 3)
+        )
+
+    def test_explainers_lazy(self):
+
+        data = np.random.randint(0, 2, size=(500, 3))
+
+        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+
+        model = Classification(x_train=data, target="col3", test_split_percentage=0.5,)
+        m = model.LogisticRegression(model_name="l1", run=True)
+
+        self.assertFalse(m._shap)
+        self.assertIsNone(m._interpret)
+
+        m.summary_plot()
+
+        self.assertTrue(m._shap)
+        self.assertIsNone(m._interpret)
+
+    def test_explain_disabled(self):
+
+        data = np.random.randint(0, 2, size=(500, 3))
+
+        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+
+        model = Classification(x_train=data, target="col3", test_split_percentage=0.5,)
+        m = model.LogisticRegression(model_name="l1", explain=False, run=True)
+
+        self.assertRaises(ValueError, m.summary_plot)
+
+    def test_kernel_explainer_budget(self):
+
+        data = np.random.randint(0, 2, size=(500, 3))
+
+        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+
+        model = Classification(x_train=data, target="col3", test_split_percentage=0.5,)
+        m = model.SVC(model_name="l1", run=True)
+
+        m.summary_plot(background_size=10, max_rows=50)
+
+        self.assertEqual(m._get_shap(10, 50).x_test.shape[0], 50)
+
+    def test_kernel_explainer_sample_no(self):
+
+        data = np.random.randint(0, 2, size=(500, 3))
+
+        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+
+        model = Classification(x_train=data, target="col3", test_split_percentage=0.5,)
+        m = model.SVC(model_name="l1", run=True)
+
+        explainer = m._get_shap(10, 50)
+        explained = int(explainer.rows[0])
+        left_out = int(np.setdiff1d(np.arange(len(m.x_test)), explainer.rows)[0])
+
+        shap_values, samples = explainer._sample(explained + 1)
+        np.testing.assert_array_equal(shap_values, explainer.shap_values[:1])
+        self.assertEqual(samples, slice(0, 1))
+
+        shap_values, samples = explainer._sample(left_out + 1)
+        self.assertIsNone(samples)
+        self.assertEqual(shap_values.shape[-1], explainer.shap_values.shape[-1])
+
+    def test_compiled_predict(self):
+
+        data = np.random.randint(0, 5, size=(500, 4))
+
+        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3", "col4"])
+
+        model = Classification(x_train=data, target="col4", test_split_percentage=0.5,)
+        rf = model.RandomForestClassification(model_name="rf", n_estimators=10, run=True)
+        xgb = model.XGBoostClassification(model_name="xgb", run=True)
+
+        np.testing.assert_array_equal(rf.compiled_predict(), rf.y_pred)
+        np.testing.assert_array_equal(xgb.compiled_predict(), xgb.y_pred)
+        np.testing.assert_allclose(
+            rf.compiled_predict(proba=True), rf.probabilities, atol=1e-6
+        )
+
+    def test_compiled_predict_missing_values(self):
+
+        data = np.random.rand(500, 3)
+        data[np.random.rand(500, 3) < 0.2] = np.nan
+
+        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+        data["col4"] = np.random.randint(0, 2, size=500)
+
+        model = Classification(x_train=data, target="col4", test_split_percentage=0.5,)
+        dt = model.DecisionTreeClassification(model_name="dt", run=True)
+
+        np.testing.assert_array_equal(dt.compiled_predict(), dt.y_pred)
+
+    def test_compiled_predict_unsupported(self):
+
+        data = np.random.randint(0, 2, size=(500, 3))
+
+        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+
+        model = Classification(x_train=data, target="col3", test_split_percentage=0.5,)
+        m = model.LogisticRegression(model_name="l1", run=True)
+
+        self.assertRaises(ValueError, m.compiled_predict)
+
 if __name__ == "__main__":
     unittest.main()
@@ -33,6 +33,8 @@ class TextModelAnalysis(ModelAnalysisBase):
         # LDA dependant variables
         self.corpus = kwargs.pop("corpus", None)
         self.id2word = kwargs.pop("id2word", None)
+        # Coherence scores by column and measure, they are expensive to compute
+        self._coherence = {}
 
     def view(self, original_text, model_output):
         """
@@ -139,32 +141,49 @@ class TextModelAnalysis(ModelAnalysisBase):
 
         return pyLDAvis.gensim.prepare(self.model, self.corpus, self.id2word, **kwargs)
 
-    def coherence_score(self, col_name):
+    def coherence_score(self, col_name, coherence="c_v", processes=-1):
         """
         Displays the coherence score of the topic model.
 
         For more info on topic coherence: https://rare-technologies.com/what-is-topic-coherence/ 
+
+        The score is computed once per column and measure.
         
         Parameters
         ----------
         col_name : str
             Column name that was used as input for the LDA model
 
+        coherence : str, optional
+            Coherence measure, one of 'u_mass', 'c_v', 'c_uci' or 'c_npmi', by default 'c_v'
+
+        processes : int, optional
+            Number of processes to compute the score with, less than 1 for one per CPU but one, by default -1
+
         Examples
         --------
         >>> m = model.LDA()
-        >>> m.coherence_score()
+        >>> m.coherence_score('col1')
+        >>> m.coherence_score('col1', coherence='u_mass')
         """
 
         import gensim
         import plotly.graph_objects as go
 
-        texts = self.x_train[col_name].tolist()
+        if (col_name, coherence) not in self._coherence:
+            texts = self.x_train[col_name].tolist()
 
-        coherence_model_lda = gensim.models.CoherenceModel(
-            model=self.model, texts=texts, dictionary=self.id2word, coherence="c_v"
-        )
-        coherence_lda = coherence_model_lda.get_coherence()
+            coherence_model_lda = gensim.models.CoherenceModel(
+                model=self.model,
+                texts=texts,
+                corpus=self.corpus,
+                dictionary=self.id2word,
+                coherence=coherence,
+                processes=processes,
+            )
+            self._coherence[(col_name, coherence)] = coherence_model_lda.get_coherence()
+
+        coherence_lda = self._coherence[(col_name, coherence)]
 
         fig = go.Figure(
             go.Indicator(
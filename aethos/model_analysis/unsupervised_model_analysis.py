@@ -1,12 +1,15 @@
 import os
 
+import pandas as pd
+
 from aethos.config.config import _global_config
 from aethos.modelling.util import track_artifacts
+from aethos.util import _iter_chunks
 from .model_analysis import ModelAnalysisBase
 
 
 class UnsupervisedModelAnalysis(ModelAnalysisBase):
-    def __init__(self, model, data, model_name):
+    def __init__(self, model, data, model_name, chunks=None, chunk_size=100000):
         """
         Class to analyze Unsupervised models through metrics and visualizations.
 
@@ -20,12 +23,21 @@ class UnsupervisedModelAnalysis(ModelAnalysisBase):
 
         model_name : str
             Name of the model for saving images and model tracking purposes
+
+        chunks : str, callable or iterable, optional
+            Chunks of data the model was trained on, clusters are assigned to them chunk by chunk with `assign_clusters`, by default None
+
+        chunk_size : int, optional
+            Number of rows per chunk when reading chunks from a file, by default 100000
         """
 
         self.model = model
         self.x_train = data
         self.model_name = model_name
         self.cluster_col = "predicted"
+        self.chunks = chunks
+        self.chunk_size = chunk_size
+        self.run_id = None
 
         if hasattr(self.model, "predict"):
             self.y_pred = self.model.predict(self.x_train)
@@ -34,6 +46,75 @@ class UnsupervisedModelAnalysis(ModelAnalysisBase):
 
         self.x_train[self.cluster_col] = self.y_pred
 
+    def predict_chunks(self, chunks=None):
+        """
+        Assigns clusters to data chunk by chunk.
+        
+        Parameters
+        ----------
+        chunks : str, callable or iterable, optional
+            Path to a csv or parquet file, a function returning an iterable of DataFrames or an iterable of DataFrames,
+            by default the chunks the model was trained on
+
+        Yields
+        ------
+        pd.DataFrame
+            Chunk of data with its cluster in the 'predicted' column
+
+        Examples
+        --------
+        >>> for chunk in m.predict_chunks('events.csv'):
+        >>>     chunk.to_parquet(...)
+        """
+
+        chunks = chunks if chunks is not None else self.chunks
+
+        if chunks is None:
+            raise ValueError("There are no chunks of data to assign clusters to.")
+
+        features = [col for col in self.x_train.columns if col != self.cluster_col]
+
+        for chunk in _iter_chunks(chunks, self.chunk_size):
+            yield chunk.assign(
+                **{self.cluster_col: self.model.predict(chunk[features])}
+            )
+
+    def assign_clusters(self, chunks=None, output_file=""):
+        """
+        Assigns clusters to data chunk by chunk, so memory stays bounded no matter the size of the data.
+        
+        Parameters
+        ----------
+        chunks : str, callable or iterable, optional
+            Path to a csv or parquet file, a function returning an iterable of DataFrames or an iterable of DataFrames,
+            by default the chunks the model was trained on
+
+        output_file : str, optional
+            Csv file to write the data with its clusters to, by default ""
+
+        Returns
+        -------
+        pd.Series
+            Number of rows in each cluster
+
+        Examples
+        --------
+        >>> m = model.MiniBatchKMeans(n_clusters=8, chunks='events.csv')
+        >>> m.assign_clusters(output_file='events_clusters.csv')
+        """
+
+        sizes = pd.Series(dtype=float)
+
+        for i, chunk in enumerate(self.predict_chunks(chunks)):
+            if output_file:
+                chunk.to_csv(
+                    output_file, mode="w" if i == 0 else "a", header=i == 0, index=False
+                )
+
+            sizes = sizes.add(chunk[self.cluster_col].value_counts(), fill_value=0)
+
+        return sizes.astype(int).sort_index()
+
     def filter_cluster(self, cluster_no: int):
         """
         Filters data by a cluster number for analysis.
@@ -102,4 +183,4 @@ class UnsupervisedModelAnalysis(ModelAnalysisBase):
         )
 
         if _global_config["track_experiments"]:  # pragma: no cover
-            track_artifacts(self.run_id, self.model_name)
+            track_artifacts(self._run_id, self.model_name)
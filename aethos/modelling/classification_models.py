@@ -100,6 +100,12 @@ class Classification(
         gridsearch : dict, optional
             Parameters to gridsearch, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default 'accuracy'
 
@@ -208,6 +214,12 @@ class Classification(
         gridsearch : dict, optional
             Parameters to gridsearch, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default 'accuracy'
 
@@ -320,6 +332,12 @@ class Classification(
         gridsearch : dict, optional
             Parameters to gridsearch, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default 'accuracy'
         
@@ -493,6 +511,12 @@ class Classification(
         gridsearch : dict, optional
             Parameters to gridsearch, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default 'accuracy'
 
@@ -599,6 +623,12 @@ class Classification(
         gridsearch : dict, optional
             Parameters to gridsearch, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default 'accuracy'
 
@@ -721,6 +751,12 @@ class Classification(
         gridsearch : int, Crossvalidation Generator, optional
             Cross validation method, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default 'accuracy'
 
@@ -888,6 +924,12 @@ class Classification(
         gridsearch : int, Crossvalidation Generator, optional
             Cross validation method, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default 'accuracy'
 
@@ -1056,6 +1098,12 @@ class Classification(
         gridsearch : int, Crossvalidation Generator, optional
             Cross validation method, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default 'accuracy'
 
@@ -1158,6 +1206,12 @@ class Classification(
         gridsearch : int, Crossvalidation Generator, optional
             Cross validation method, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default 'accuracy'
 
@@ -1258,6 +1312,12 @@ class Classification(
         gridsearch : int, Crossvalidation Generator, optional
             Cross validation method, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default 'accuracy'
 
@@ -1357,6 +1417,12 @@ class Classification(
         gridsearch : int, Crossvalidation Generator, optional
             Cross validation method, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default 'accuracy'
 
@@ -1534,6 +1600,12 @@ class Classification(
         gridsearch : int, Crossvalidation Generator, optional
             Cross validation method, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default 'accuracy'
 
@@ -1673,6 +1745,12 @@ class Classification(
         gridsearch : int, Crossvalidation Generator, optional
             Cross validation method, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default 'accuracy'
 
@@ -1813,6 +1891,12 @@ class Classification(
         gridsearch : int, Crossvalidation Generator, optional
             Cross validation method, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default 'accuracy'
 
@@ -1991,6 +2075,12 @@ class Classification(
         gridsearch : int, Crossvalidation Generator, optional
             Cross validation method, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default 'accuracy'
 
@@ -13,21 +13,36 @@ from ipywidgets.widgets.widget_layout import Layout
 
 from aethos.config import shell
 from aethos.config.config import _global_config
+from aethos.model_analysis.compiled_model import compile_model
 from aethos.model_analysis.unsupervised_model_analysis import UnsupervisedModelAnalysis
 from aethos.model_analysis.text_model_analysis import TextModelAnalysis
 from aethos.modelling import text
+from aethos.modelling.pretrained import run_pipeline
 from aethos.modelling.util import (
+    _data_digest,
+    _fit_cache_key,
     _get_cv_type,
     _make_img_project_dir,
     _run_models_parallel,
+    _run_models_series,
     add_to_queue,
+    cache_fit,
+    load_cached_fit,
     run_crossvalidation,
     run_gridsearch,
+    to_model_input,
     to_pickle,
     track_model,
 )
 from aethos.templates.template_generator import TemplateGenerator as tg
-from aethos.util import _input_columns, split_data, _get_attr_, _get_item_
+from aethos.util import (
+    _input_columns,
+    _is_reiterable,
+    _iter_chunks,
+    split_data,
+    _get_attr_,
+    _get_item_,
+)
 
 warnings.simplefilter("ignore", FutureWarning)
 
@@ -44,6 +59,8 @@ class ModelBase(object):
 
         self._models = {}
         self._queued_models = {}
+        self._fit_pool = None
+        self._data_digest = None
         self.exp_name = exp_name
 
         problem = "c" if type(self).__name__ == "Classification" else "r"
@@ -240,36 +257,53 @@ class ModelBase(object):
 
         display(tab)
 
-    def run_models(self, method="parallel"):
+    def run_models(self, method="parallel", stream=False):
         """
         Runs all queued models.
 
         The models can either be run one after the other ('series') or at the same time in parallel.
 
+        When run in parallel, the training data is shared with the worker processes instead of being copied to each of them.
+        Each model gets a thread budget and the most expensive models are started first, see the `max_workers` and
+        `threads_per_model` options.
+
+        Models are registered as soon as they are trained, so `compare_models` can be used on the finished models
+        while the rest are still training.
+
+        When experiments are tracked, models are logged to MLFlow in the background while the next ones train
+        and the logging is waited for once all models are trained.
+
         Parameters
         ----------
         method : str, optional
             How to run models, can either be in 'series' or in 'parallel', by default 'parallel'
 
+        stream : bool, optional
+            True to return a generator yielding each model as soon as it is trained, by default False
+
+        Returns
+        -------
+        list or generator
+            Trained models, in the order they finished
+
         Examples
         --------
         >>> model.run_models()
         >>> model.run_models(method='series')
+        >>> for m in model.run_models(stream=True):
+        >>>     m.metrics()
         """
 
-        models = []
-
         if method == "parallel":
             models = _run_models_parallel(self)
         elif method == "series":
-            for model in self._queued_models:
-                models.append(self._queued_models[model]())
+            models = _run_models_series(self)
         else:
             raise ValueError(
                 'Invalid run method, accepted run methods are either "parallel" or "series".'
             )
 
-        return models
+        return models if stream else list(models)
 
     def list_models(self):
         """
@@ -337,8 +371,9 @@ class ModelBase(object):
 
         results = []
 
-        for model in self._models:
-            results.append(self._models[model].metrics())
+        # Models can be registered while queued models are still running
+        for model in list(self._models.values()):
+            results.append(model.metrics())
 
         results_table = pd.concat(results, axis=1, join="inner")
         results_table = results_table.loc[:, ~results_table.columns.duplicated()]
@@ -369,7 +404,15 @@ class ModelBase(object):
 
         to_pickle(model_obj.model, model_obj.model_name)
 
-    def to_service(self, model_name: str, project_name: str):
+    def to_service(
+        self,
+        model_name: str,
+        project_name: str,
+        compiled=False,
+        workers=None,
+        max_batch_size=64,
+        max_wait_ms=5,
+    ):
         """
         Creates an app.py, requirements.txt and Dockerfile in `~/.aethos/projects` and the necessary folder structure
         to run the model as a microservice.
@@ -382,24 +425,61 @@ class ModelBase(object):
         project_name : str
             Name of the project that you want to create.
 
+        compiled : bool, optional
+            Whether to serve a tree based model compiled into NumPy arrays, without the library it was trained with, by default False
+
+        workers : int, optional
+            Number of worker processes serving the model, by default picked from the number of cores
+
+        max_batch_size : int, optional
+            Maximum number of concurrent single row requests predicted together, by default 64
+
+        max_wait_ms : int, optional
+            Maximum time in milliseconds a single row request waits to be batched with others, by default 5
+
         Examples
         --------
         >>> m = Model(df)
         >>> m.LogisticRegression()
         >>> m.to_service('log_reg', 'your_proj_name')
+        >>> m.XGBoostClassification()
+        >>> m.to_service('xgb_cls', 'your_proj_name', compiled=True)
         """
 
         model_obj = self._models[model_name]
 
-        to_pickle(
-            model_obj.model,
-            model_obj.model_name,
-            project=True,
-            project_name=project_name,
-        )
-        tg.generate_service(
-            project_name, f"{model_obj.model_name}.pkl", model_obj.model
-        )
+        if compiled:
+            tg.generate_service(
+                project_name,
+                f"{model_obj.model_name}.npz",
+                compile_model(
+                    model_obj.model,
+                    model_obj.x_train[model_obj.features]
+                    if hasattr(model_obj, "features")
+                    else None,
+                ),
+                compiled=True,
+                workers=workers,
+                max_batch_size=max_batch_size,
+                max_wait_ms=max_wait_ms,
+                features=getattr(model_obj, "features", None),
+            )
+        else:
+            to_pickle(
+                model_obj.model,
+                model_obj.model_name,
+                project=True,
+                project_name=project_name,
+            )
+            tg.generate_service(
+                project_name,
+                f"{model_obj.model_name}.pkl",
+                model_obj.model,
+                workers=workers,
+                max_batch_size=max_batch_size,
+                max_wait_ms=max_wait_ms,
+                features=getattr(model_obj, "features", None),
+            )
 
         print("To run:")
         print("\tdocker build -t `image_name` ./")
@@ -577,6 +657,10 @@ class ModelBase(object):
         run : bool, optional
             Whether to train the model or just initialize it with parameters (useful when wanting to test multiple models at once) , by default False
 
+        corpus_file : str, optional
+            Path to write the tokenized text to, so it is tokenized once and streamed from disk on every training pass
+            instead of being held in memory, by default None
+
         size : int, optional
             Dimensionality of the word vectors.
 
@@ -586,8 +670,8 @@ class ModelBase(object):
         min_count : int, optional
             Ignores all words with total frequency lower than this.
 
-        workers int, optional
-            Use these many worker threads to train the model (=faster training with multicore machines).
+        workers : int, optional
+            Use these many worker threads to train the model (=faster training with multicore machines), by default one per CPU.
 
         sg : {0, 1}, optional
             Training algorithm: 1 for skip-gram; otherwise CBOW.
@@ -632,7 +716,7 @@ class ModelBase(object):
             Hash function to use to randomly initialize weights, for increased training reproducibility.
 
         workers : int, optional
-            Use these many worker threads to train the model (=faster training with multicore machines).
+            Use these many worker threads to train the model (=faster training with multicore machines), by default one per CPU.
 
         iter : int, optional
             Number of iterations (epochs) over the corpus.
@@ -712,6 +796,10 @@ class ModelBase(object):
         run : bool, optional
             Whether to train the model or just initialize it with parameters (useful when wanting to test multiple models at once) , by default False
 
+        corpus_file : str, optional
+            Path to write the tokenized text to, so it is tokenized once and streamed from disk on every training pass
+            instead of being held in memory, by default None
+
         dm : {1,0}, optional
             Defines the training algorithm.
             If dm=1, ‘distributed memory’ (PV-DM) is used.
@@ -742,7 +830,7 @@ class ModelBase(object):
             The threshold for configuring which higher-frequency words are randomly downsampled, useful range is (0, 1e-5).
 
         workers : int, optional
-            Use these many worker threads to train the model (=faster training with multicore machines).
+            Use these many worker threads to train the model (=faster training with multicore machines), by default one per CPU.
 
         epochs : int, optional
             Number of iterations (epochs) over the corpus.
@@ -839,6 +927,25 @@ class ModelBase(object):
         run : bool, optional
             Whether to train the model or just initialize it with parameters (useful when wanting to test multiple models at once) , by default False
 
+        workers : int, optional
+            Number of processes to train the model with, using gensim's LdaMulticore, -1 for one per CPU, by default the `n_jobs` option
+
+        no_below : int, optional
+            Removes words in fewer than `no_below` documents from the vocabulary, by default None
+
+        no_above : float, optional
+            Removes words in more than `no_above` of the documents from the vocabulary, by default None
+
+        keep_n : int, optional
+            Keeps only the `keep_n` most frequent words in the vocabulary, by default None
+
+        corpus_file : str, optional
+            Path to serialize the bag of words corpus to. The corpus is then streamed from disk instead of being held in memory,
+            for corpora that don't fit in memory, by default None
+
+        topic_distribution : bool, optional
+            True to add the probability of every topic to the data as sparse `topic_N` columns, by default False
+
         num_topics: (int, optional)
             The number of requested latent topics to be extracted from the training corpus.
 
@@ -909,6 +1016,7 @@ class ModelBase(object):
         Examples
         --------
         >>> model.LDA('col1', prep=True)
+        >>> model.LDA('col1', workers=-1, no_below=5, no_above=0.5, corpus_file='corpus.mm')
         >>> model.LDA('col1', run=False) # Add model to the queue
         """
         # endregion
@@ -930,7 +1038,15 @@ class ModelBase(object):
     ################## PRE TRAINED MODELS #######################
 
     def pretrained_sentiment_analysis(
-        self, col: str, model_type=None, new_col_name="sent_score", run=True
+        self,
+        col: str,
+        model_type=None,
+        new_col_name="sent_score",
+        batch_size=32,
+        n_threads=1,
+        cache=True,
+        verbose=False,
+        run=True,
     ):
         # region
         """
@@ -1019,7 +1135,18 @@ class ModelBase(object):
         new_col_name : str, optional
             New column name for the sentiment scores, by default "sent_score"
 
-        
+        batch_size : int, optional
+            Number of texts run through the model at once, texts of similar length are batched together, by default 32
+
+        n_threads : int, optional
+            Number of batches run at once, by default 1
+
+        cache : bool, optional
+            True to cache the results on disk so unchanged texts are not run again, by default True
+
+        verbose : bool, optional
+            True to show a progress bar, by default False
+
         Returns
         -------
         TF or PyTorch of model
@@ -1032,18 +1159,29 @@ class ModelBase(object):
         # endregion
 
         try:
-            from transformers import pipeline
+            from transformers import __version__ as transformers_version, pipeline
         except ModuleNotFoundError as e:
             raise EnvironmentError(
                 "Pre trained model dependencies have not been installed. Please run pip install aethos[ptmodels]"
             )
 
         nlp = pipeline("sentiment-analysis", model=model_type)
+        run_kwargs = dict(
+            batch_size=batch_size,
+            n_threads=n_threads,
+            cache=cache,
+            verbose=verbose,
+            # The default model depends on the transformers version
+            name=f"sentiment-analysis-{model_type or 'default-' + transformers_version}",
+        )
 
-        self.x_train[new_col_name] = pd.Series(map(nlp, self.x_train[col].tolist()))
+        # Scores are wrapped in a list, as when the pipeline is run on a single text
+        scores = run_pipeline(nlp, self.x_train[col].tolist(), **run_kwargs)
+        self.x_train[new_col_name] = pd.Series([[score] for score in scores])
 
         if self.x_test is not None:
-            self.x_test[new_col_name] = pd.Series(map(nlp, self.x_test[col].tolist()))
+            scores = run_pipeline(nlp, self.x_test[col].tolist(), **run_kwargs)
+            self.x_test[new_col_name] = pd.Series([[score] for score in scores])
 
         return nlp.model
 
@@ -1053,6 +1191,10 @@ class ModelBase(object):
         question_col: str,
         model_type=None,
         new_col_name="qa",
+        batch_size=32,
+        n_threads=1,
+        cache=True,
+        verbose=False,
         run=True,
     ):
         # region
@@ -1145,7 +1287,19 @@ class ModelBase(object):
 
         new_col_name : str, optional
             New column name for the sentiment scores, by default "sent_score"
-        
+
+        batch_size : int, optional
+            Number of questions run through the model at once, questions with contexts of similar length are batched together, by default 32
+
+        n_threads : int, optional
+            Number of batches run at once, by default 1
+
+        cache : bool, optional
+            True to cache the results on disk so unchanged questions are not run again, by default True
+
+        verbose : bool, optional
+            True to show a progress bar, by default False
+
         Returns
         -------
         TF or PyTorch of model
@@ -1158,32 +1312,47 @@ class ModelBase(object):
         # endregion
 
         try:
-            from transformers import pipeline
+            from transformers import __version__ as transformers_version, pipeline
         except ModuleNotFoundError as e:
             raise EnvironmentError(
                 "Pre trained model dependencies have not been installed. Please run pip install aethos[ptmodels]"
             )
 
         nlp = pipeline("question-answering", model=model_type)
-        q_and_a = lambda c, q: nlp({"question": q, "context": c})
+        run_kwargs = dict(
+            batch_size=batch_size,
+            n_threads=n_threads,
+            cache=cache,
+            verbose=verbose,
+            length=lambda x: len(x["context"]) + len(x["question"]),
+            name=f"question-answering-{model_type or 'default-' + transformers_version}",
+        )
 
         self.x_train[new_col_name] = pd.Series(
-            [
-                q_and_a(context, question)
-                for context, question in zip(
-                    self.x_train[context_col], self.x_train[question_col],
-                )
-            ]
+            run_pipeline(
+                nlp,
+                [
+                    {"question": question, "context": context}
+                    for context, question in zip(
+                        self.x_train[context_col], self.x_train[question_col],
+                    )
+                ],
+                **run_kwargs,
+            )
         )
 
         if self.x_test is not None:
             self.x_test[new_col_name] = pd.Series(
-                [
-                    q_and_a(context, question)
-                    for context, question in zip(
-                        self.x_test[context_col], self.x_test[question_col],
-                    )
-                ]
+                run_pipeline(
+                    nlp,
+                    [
+                        {"question": question, "context": context}
+                        for context, question in zip(
+                            self.x_test[context_col], self.x_test[question_col],
+                        )
+                    ],
+                    **run_kwargs,
+                )
             )
 
         return nlp.model
@@ -1219,6 +1388,11 @@ class ModelBase(object):
         ):
             random_state = 42
 
+        explain = kwargs.pop("explain", _global_config["explain_models"])
+        search = kwargs.pop("search", "grid")
+        # Some models, such as BayesianRidge, have their own n_iter parameter
+        n_iter = kwargs.pop("n_iter", 10) if search == "random" else 10
+
         run_id = None
 
         _make_img_project_dir(model_name)
@@ -1239,14 +1413,42 @@ class ModelBase(object):
         if gridsearch:
             grid_cv = _get_cv_type(cv_type, 5, False) if cv_type is not None else 5
 
-            model = run_gridsearch(model, gridsearch, grid_cv, score, verbose=verbose)
+            model = run_gridsearch(
+                model,
+                gridsearch,
+                grid_cv,
+                score,
+                search=search,
+                n_iter=n_iter,
+                verbose=verbose,
+            )
 
         #############################################################
         ###################### Train Model ##########################
         #############################################################
 
-        # Train a model and predict on the test test.
-        model.fit(self.train_data, self.y_train)
+        # Train a model and predict on the test test, unless the same fit is cached.
+        cache_key = None
+        cached_model = None
+
+        if _global_config["fit_cache"]:
+            # Models run together share the digest of their training data
+            data_digest = self._data_digest or _data_digest(
+                self.train_data, self.y_train
+            )
+            cache_key = _fit_cache_key(model, data_digest)
+            cached_model = load_cached_fit(cache_key)
+
+        if cached_model is not None:
+            if verbose:
+                print(f"Loaded {model_name} from the fit cache.")
+
+            model = cached_model
+        else:
+            model = self._fit_model(model, supervised=True)
+
+            if cache_key is not None:
+                cache_fit(cache_key, model)
 
         #############################################################
         ############### Initialize Model Analysis ###################
@@ -1256,7 +1458,7 @@ class ModelBase(object):
             model = model.best_estimator_
 
         self._models[model_name] = model_type(
-            model, self.x_train, self.x_test, self.target, model_name,
+            model, self.x_train, self.x_test, self.target, model_name, explain=explain,
         )
 
         #############################################################
@@ -1267,24 +1469,45 @@ class ModelBase(object):
             if random_state is not None:
                 kwargs["random_state"] = random_state
 
-            run_id = track_model(
+            # Logged in the background, `run_id` waits for the run to be created when it is read
+            self._models[model_name].run_id = track_model(
                 self.exp_name,
                 model,
                 model_name,
                 kwargs,
-                self.compare_models()[model_name].to_dict(),
+                self._models[model_name].metrics()[model_name].to_dict(),
             )
-            self._models[model_name].run_id = run_id
 
         print(model)
 
         return self._models[model_name]
 
+    def _fit_model(self, model, supervised=True):
+        """
+        Fits a model on the training data.
+
+        When queued models are run in parallel, the model is fit by a worker process on the shared training data.
+        Sparse features are passed as a sparse matrix to models that train on them.
+        """
+
+        if self._fit_pool is not None:
+            return self._fit_pool.fit(model, supervised=supervised)
+
+        if supervised:
+            model.fit(to_model_input(model, self.train_data), self.y_train)
+        else:
+            model.fit(self.train_data)
+
+        return model
+
     def _run_unsupervised_model(
         self, model, model_name, run=True, **kwargs,
     ):
         """
         Helper function that generalizes model orchestration.
+
+        Models with `partial_fit` can be trained with bounded memory on `chunks` of data, either a path to a csv or parquet file,
+        a function returning an iterable of DataFrames or an iterable of DataFrames.
         """
 
         #############################################################
@@ -1300,6 +1523,9 @@ class ModelBase(object):
         ):
             random_state = 42
 
+        chunks = kwargs.pop("chunks", None)
+        chunk_size = kwargs.pop("chunk_size", 100000)
+
         _make_img_project_dir(model_name)
 
         #############################################################
@@ -1315,14 +1541,28 @@ class ModelBase(object):
         ###################### Train Model ##########################
         #############################################################
 
-        model.fit(self.train_data)
+        if chunks is not None:
+            if not hasattr(model, "partial_fit"):
+                raise ValueError(
+                    f"{type(model).__name__} can't be trained on chunks of data, use a model with `partial_fit` such as MiniBatchKMeans or Birch."
+                )
+
+            for chunk in _iter_chunks(chunks, chunk_size):
+                model.partial_fit(chunk[self.features])
+        else:
+            model = self._fit_model(model, supervised=False)
 
         #############################################################
         ############### Initialize Model Analysis ###################
         #############################################################
 
+        # The analysis adds its cluster labels to its data, models must not share it.
         self._models[model_name] = UnsupervisedModelAnalysis(
-            model, self.x_train, model_name
+            model,
+            self.x_train.copy(),
+            model_name,
+            chunks=chunks if chunks is not None and _is_reiterable(chunks) else None,
+            chunk_size=chunk_size,
         )
 
         #############################################################
@@ -1333,7 +1573,9 @@ class ModelBase(object):
             if random_state is not None:
                 kwargs["random_state"] = random_state
 
-            track_model(self.exp_name, model, model_name, kwargs)
+            self._models[model_name].run_id = track_model(
+                self.exp_name, model, model_name, kwargs
+            )
 
         print(model)
 
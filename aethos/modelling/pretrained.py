@@ -0,0 +1,247 @@
+import hashlib
+import os
+import pickle
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from aethos.config import DEFAULT_CACHE_DIR
+from aethos.config.config import _global_config
+from aethos.util import _make_dir
+
+
+def _cache_key(name: str, inputs) -> str:
+    """Cache key of a pipeline input."""
+
+    return hashlib.sha1(repr((name, inputs)).encode()).hexdigest()
+
+
+class PipelineCache(object):
+    """
+    On disk cache of pretrained pipeline results, keyed by a hash of the task, model and input.
+
+    The least recently used results are evicted when the cache is larger than `max_size`.
+
+    Parameters
+    ----------
+    path : str, optional
+        Path of the cache database, by default `pretrained.db` in the aethos cache directory
+
+    max_size : int, optional
+        Maximum size of the cached results in MB, by default the `pretrained_cache_size` option
+
+    Examples
+    --------
+    >>> PipelineCache().clear()
+    """
+
+    def __init__(self, path=None, max_size=None):
+
+        self.path = path or os.path.join(DEFAULT_CACHE_DIR, "pretrained.db")
+        self.max_size = (
+            _global_config["pretrained_cache_size"] if max_size is None else max_size
+        )
+
+        _make_dir(os.path.dirname(self.path))
+
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, result BLOB, size INTEGER, used REAL)"
+            )
+
+    @contextmanager
+    def _connect(self):
+        """Connection to the cache database, committed and closed on exit."""
+
+        conn = sqlite3.connect(self.path)
+
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, keys: list) -> dict:
+        """
+        Cached results of the given keys.
+
+        Parameters
+        ----------
+        keys : list
+            Cache keys
+
+        Returns
+        -------
+        dict
+            Result of each cached key
+        """
+
+        results = {}
+
+        with self._connect() as conn:
+            # Stay below SQLite's limit on the number of query parameters
+            for i in range(0, len(keys), 500):
+                batch = keys[i : i + 500]
+                rows = conn.execute(
+                    f"SELECT key, result FROM results WHERE key IN ({','.join('?' * len(batch))})",
+                    batch,
+                ).fetchall()
+                results.update((key, pickle.loads(result)) for key, result in rows)
+
+                # Mark as recently used
+                conn.executemany(
+                    "UPDATE results SET used = ? WHERE key = ?",
+                    [(time.time(), key) for key, _ in rows],
+                )
+
+        return results
+
+    def set(self, results: dict):
+        """
+        Writes results to the cache.
+
+        Parameters
+        ----------
+        results : dict
+            Result of each cache key
+        """
+
+        now = time.time()
+        rows = []
+
+        for key, result in results.items():
+            result = pickle.dumps(result)
+            rows.append((key, result, len(result), now))
+
+        with self._connect() as conn:
+            conn.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)", rows)
+
+            # Evict the least recently used results beyond the size limit
+            conn.execute(
+                """
+                DELETE FROM results WHERE key IN (
+                    SELECT key FROM (
+                        SELECT key, SUM(size) OVER (ORDER BY used DESC, rowid DESC) AS total
+                        FROM results
+                    )
+                    WHERE total > ?
+                )
+                """,
+                (self.max_size * 1024 ** 2,),
+            )
+
+    def clear(self):
+        """Removes every cached result."""
+
+        with self._connect() as conn:
+            conn.execute("DELETE FROM results")
+
+        # Give the freed space back to the file system
+        conn = sqlite3.connect(self.path)
+
+        try:
+            conn.execute("VACUUM")
+        finally:
+            conn.close()
+
+
+def run_pipeline(
+    nlp,
+    inputs: list,
+    batch_size=32,
+    n_threads=1,
+    cache=True,
+    verbose=False,
+    length=len,
+    name=None,
+) -> list:
+    """
+    Runs a Huggingface pipeline on batches of inputs.
+
+    Inputs are sorted by length before being batched, so inputs in the same batch need little padding,
+    and the results are returned in the order of the inputs. Identical inputs are only run once and results
+    are cached on disk, so running the pipeline again on unchanged inputs is free.
+
+    Parameters
+    ----------
+    nlp : Pipeline
+        Huggingface pipeline
+
+    inputs : list
+        Inputs of the pipeline, text for most tasks
+
+    batch_size : int, optional
+        Number of inputs run through the pipeline at once, by default 32
+
+    n_threads : int, optional
+        Number of batches run at once, by default 1
+
+    cache : bool, optional
+        True to cache the results on disk, by default True
+
+    verbose : bool, optional
+        True to show a progress bar, by default False
+
+    length : callable, optional
+        Length of an input, by default len
+
+    name : str, optional
+        Name of the task and model of the pipeline, results are cached per name, required when caching, by default None
+
+    Returns
+    -------
+    list
+        Result of each input
+
+    Examples
+    --------
+    >>> run_pipeline(pipeline('sentiment-analysis'), df['text'].tolist(), batch_size=64, name='sentiment-analysis-default')
+    """
+
+    if cache and name is None:
+        raise ValueError("A name is required to cache the results of a pipeline.")
+
+    store = PipelineCache() if cache else None
+    keys = [_cache_key(name, x) for x in inputs]
+    results = store.get(list(set(keys))) if store is not None else {}
+
+    # Each uncached input is run once, shortest first
+    todo = {}
+    for key, x in zip(keys, inputs):
+        if key not in results:
+            todo.setdefault(key, x)
+
+    todo = sorted(todo.items(), key=lambda item: length(item[1]))
+    batches = [todo[i : i + batch_size] for i in range(0, len(todo), batch_size)]
+
+    def run_batch(batch):
+        output = nlp([x for _, x in batch])
+
+        # Pipelines return a single result for a single input
+        if len(batch) == 1 and not isinstance(output, list):
+            output = [output]
+
+        return {key: result for (key, _), result in zip(batch, output)}
+
+    progress = None
+
+    if verbose:
+        from tqdm import tqdm
+
+        progress = tqdm(total=len(todo))
+
+    with ThreadPoolExecutor(max_workers=n_threads) as pool:
+        for batch_results in pool.map(run_batch, batches):
+            results.update(batch_results)
+
+            if store is not None:
+                store.set(batch_results)
+
+            if progress is not None:
+                progress.update(len(batch_results))
+
+    if progress is not None:
+        progress.close()
+
+    return [results[key] for key in keys]
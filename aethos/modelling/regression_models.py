@@ -90,6 +90,12 @@ class Regression(
         gridsearch : int, Crossvalidation Generator, optional
             Cross validation method, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default ‘neg_mean_squared_error’
 
@@ -182,6 +188,12 @@ class Regression(
         gridsearch : int, Crossvalidation Generator, optional
             Cross validation method, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default ‘neg_mean_squared_error’
 
@@ -295,6 +307,12 @@ class Regression(
         gridsearch : int, Crossvalidation Generator, optional
             Cross validation method, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default ‘neg_mean_squared_error’
 
@@ -420,6 +438,12 @@ class Regression(
         gridsearch : int, Crossvalidation Generator, optional
             Cross validation method, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default ‘neg_mean_squared_error’
 
@@ -536,6 +560,12 @@ class Regression(
         gridsearch : int, Crossvalidation Generator, optional
             Cross validation method, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default ‘neg_mean_squared_error’
 
@@ -647,6 +677,12 @@ class Regression(
         gridsearch : int, Crossvalidation Generator, optional
             Cross validation method, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default ‘neg_mean_squared_error’
 
@@ -820,6 +856,12 @@ class Regression(
         gridsearch : dict, optional
             Parameters to gridsearch, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default ‘neg_mean_squared_error’
 
@@ -922,6 +964,12 @@ class Regression(
         gridsearch : dict, optional
             Parameters to gridsearch, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default ‘neg_mean_squared_error’
 
@@ -1036,6 +1084,12 @@ class Regression(
         gridsearch : int, Crossvalidation Generator, optional
             Cross validation method, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default 'neg_mean_squared_error'
 
@@ -1204,6 +1258,12 @@ class Regression(
         gridsearch : int, Crossvalidation Generator, optional
             Cross validation method, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default 'neg_mean_squared_error'
 
@@ -1350,6 +1410,12 @@ class Regression(
         gridsearch : int, Crossvalidation Generator, optional
             Cross validation method, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default 'neg_mean_squared_error'
 
@@ -1507,6 +1573,12 @@ class Regression(
         gridsearch : int, Crossvalidation Generator, optional
             Cross validation method, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default 'neg_mean_squared_error’
 
@@ -1626,6 +1698,12 @@ class Regression(
         gridsearch : int, Crossvalidation Generator, optional
             Cross validation method, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default 'neg_mean_squared_error'
 
@@ -1750,6 +1828,12 @@ class Regression(
         gridsearch : int, Crossvalidation Generator, optional
             Cross validation method, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default 'neg_mean_squared_error'
 
@@ -1915,6 +1999,12 @@ class Regression(
         gridsearch : int, Crossvalidation Generator, optional
             Cross validation method, by default None
 
+        search : {grid, random, halving}, optional
+            How to search the gridsearch parameters, see `run_gridsearch`, by default 'grid'
+
+        n_iter : int, optional
+            Number of candidates sampled by the 'random' search, by default 10
+
         score : str, optional
             Scoring metric to evaluate models, by default 'neg_mean_squared_error'
 
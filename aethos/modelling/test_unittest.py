@@ -1,5 +1,6 @@
 import os
 import shutil
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -114,6 +115,26 @@ class TestModelling(unittest.TestCase):
 
         self.assertTrue(validate)
 
+    def test_text_gensim_lda_multicore_streaming(self):
+
+        text_data = [
+            "Hi my name is aethos. Please split me.",
+            "This function is going to split by sentence. Automation is great.",
+        ]
+
+        data = pd.DataFrame(data=text_data, columns=["data"])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            corpus_file = os.path.join(tmp, "lda_corpus.mm")
+
+            model = Unsupervised(x_train=data)
+            model.LDA("data", prep=True, workers=2, no_below=1, corpus_file=corpus_file)
+            validate = model.lda.model.__class__.__name__ == "LdaMulticore" and len(
+                model.lda.corpus
+            ) == len(text_data)
+
+        self.assertTrue(validate)
+
     def test_text_view_topics(self):
 
         text_data = [
@@ -163,6 +184,43 @@ class TestModelling(unittest.TestCase):
 
         self.assertTrue(True)
 
+    def test_text_coherence_score_cached(self):
+
+        text_data = [
+            "Hi my name is aethos. Please split me.",
+            "This function is going to split by sentence. Automation is great.",
+        ]
+
+        data = pd.DataFrame(data=text_data, columns=["data"])
+        data["prep"] = pd.Series([text.split() for text in text_data])
+
+        model = Unsupervised(x_train=data)
+        l = model.LDA("prep")
+        l.coherence_score("prep", coherence="u_mass", processes=1)
+        l.coherence_score("prep", coherence="u_mass", processes=1)
+
+        self.assertListEqual(list(l._coherence), [("prep", "u_mass")])
+
+    def test_text_gensim_lda_topic_distribution(self):
+
+        text_data = [
+            "Hi my name is aethos. Please split me.",
+            "This function is going to split by sentence. Automation is great.",
+        ]
+
+        data = pd.DataFrame(data=text_data, columns=["data"])
+        data["prep"] = pd.Series([text.split() for text in text_data])
+
+        model = Unsupervised(x_train=data)
+        model.LDA("prep", num_topics=2, topic_distribution=True)
+        validate = np.allclose(
+            model.x_train[["topic_0", "topic_1"]].sparse.to_dense().sum(axis=1),
+            1,
+            atol=0.02,
+        )
+
+        self.assertTrue(validate)
+
     def test_text_w2vprep(self):
 
         text_data = [
@@ -194,6 +252,30 @@ class TestModelling(unittest.TestCase):
 
         self.assertTrue(validate)
 
+    def test_text_d2v_corpus_file(self):
+
+        from aethos.modelling.text import TokenFile
+
+        text_data = [
+            "Hi my name is aethos. Please split me.",
+            "This function is going to split by sentence. Automation is great.",
+        ]
+
+        data = pd.DataFrame(data=text_data, columns=["data"])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            corpus_file = os.path.join(tmp, "d2v_corpus.txt")
+
+            model = Unsupervised(x_train=data)
+            model.Doc2Vec(
+                "data", prep=True, run=True, min_count=1, corpus_file=corpus_file
+            )
+            validate = model.d2v is not None and len(
+                list(TokenFile(corpus_file))
+            ) == len(text_data)
+
+        self.assertTrue(validate)
+
     def test_text_d2vprep(self):
 
         text_data = [
@@ -263,6 +345,31 @@ class TestModelling(unittest.TestCase):
 
         self.assertTrue(validate)
 
+    def test_model_kmeans_nok_sampled(self):
+
+        data, _ = make_blobs(n_samples=1000, n_features=12, centers=8, random_state=42)
+        data = pd.DataFrame(data=data)
+
+        model = Unsupervised(x_train=data,)
+        model.KMeans(k_range=(2, 10), sample_size=500, n_workers=2, run=True)
+
+        self.assertListEqual(model.km.k_search["k"].tolist(), list(range(2, 10)))
+        self.assertIn(model.km.model.n_clusters, range(2, 10))
+
+    def test_model_minibatchkmeans_chunks(self):
+
+        data, _ = make_blobs(n_samples=1000, n_features=4, centers=3, random_state=42)
+        data = pd.DataFrame(data=data, columns=["a", "b", "c", "d"])
+
+        model = Unsupervised(x_train=data.iloc[:200],)
+        model.MiniBatchKMeans(
+            n_clusters=3, chunks=[data.iloc[:500], data.iloc[500:]], run=True
+        )
+        sizes = model.mbkm.assign_clusters()
+
+        self.assertEqual(sizes.sum(), 1000)
+        self.assertEqual(model.mbkm.model.n_clusters, 3)
+
     def test_model_dbscan(self):
 
         data = [[1, 2], [2, 2], [2, 3], [8, 7], [8, 8], [25, 80]]
@@ -313,6 +420,102 @@ class TestModelling(unittest.TestCase):
 
         self.assertTrue(True)
 
+    def test_model_gridsearch_random(self):
+
+        data = np.random.randint(0, 2, size=(500, 3))
+
+        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+
+        model = Classification(x_train=data, target="col3",)
+
+        model.LogisticRegression(
+            gridsearch={"C": [0.1, 0.2, 1]}, search="random", n_iter=2, run=True
+        )
+
+        self.assertTrue(True)
+
+    def test_run_gridsearch_random_n_iter(self):
+
+        from sklearn.linear_model import LogisticRegression
+        from aethos.modelling.util import run_gridsearch
+
+        search = run_gridsearch(
+            LogisticRegression(), {"C": [0.1, 0.2, 1]}, search="random", n_iter=2
+        )
+
+        self.assertEqual(search.n_iter, 2)
+
+    def test_model_gridsearch_halving(self):
+
+        data = np.random.randint(0, 2, size=(500, 3))
+
+        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+
+        model = Regression(x_train=data, target="col3",)
+
+        model.RandomForestRegression(
+            gridsearch={"max_depth": [2, 4, 8]}, search="halving", run=True
+        )
+
+        self.assertTrue(True)
+
+    def test_fit_cache(self):
+
+        from sklearn.linear_model import LogisticRegression
+        from aethos.modelling.util import (
+            _data_digest,
+            _fit_cache_key,
+            cache_fit,
+            load_cached_fit,
+        )
+
+        data = np.random.randint(0, 2, size=(500, 3))
+
+        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+
+        digest = _data_digest(data[["col1", "col2"]], data["col3"])
+        key = _fit_cache_key(LogisticRegression(), digest)
+        model = LogisticRegression().fit(data[["col1", "col2"]], data["col3"])
+
+        cache_fit(key, model)
+
+        self.assertTrue(np.array_equal(load_cached_fit(key).coef_, model.coef_))
+        self.assertNotEqual(key, _fit_cache_key(LogisticRegression(C=0.1), digest))
+
+    def test_fit_cache_key_array_params(self):
+
+        from sklearn.preprocessing import OneHotEncoder
+        from aethos.modelling.util import _fit_cache_key
+
+        categories = np.arange(2000)
+        changed = categories.copy()
+        changed[1000] = -1
+
+        self.assertNotEqual(
+            _fit_cache_key(OneHotEncoder(categories=[categories]), "digest"),
+            _fit_cache_key(OneHotEncoder(categories=[changed]), "digest"),
+        )
+
+    def test_fit_cache_skips_refit(self):
+
+        from unittest import mock
+
+        data = np.random.randint(0, 2, size=(500, 3))
+
+        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+        train, test = data.iloc[:400], data.iloc[400:].reset_index(drop=True)
+
+        model = Classification(x_train=train, x_test=test, target="col3")
+        model.LogisticRegression(random_state=2, run=True)
+
+        model = Classification(x_train=train, x_test=test, target="col3")
+
+        with mock.patch.object(model, "_fit_model") as fit_model:
+            model.LogisticRegression(random_state=2, run=True)
+
+        fit_model.assert_not_called()
+        self.assertIsNotNone(model.log_reg.y_pred)
+
     def test_model_logisticregression(self):
 
         data = np.random.randint(0, 2, size=(500, 3))
@@ -325,6 +528,57 @@ class TestModelling(unittest.TestCase):
 
         self.assertTrue(validate)
 
+    def test_model_logisticregression_sparse(self):
+
+        data = pd.DataFrame(
+            {
+                "text": ["good movie", "bad movie", "great film", "awful film"] * 25,
+                "col1": np.random.randint(0, 2, size=100),
+                "col2": [1, 0, 1, 0] * 25,
+            }
+        )
+
+        model = Classification(x_train=data, target="col2")
+        model.tfidf("text", keep_col=False, sparse=True)
+        model.LogisticRegression(random_state=2, run=True)
+        validate = (model.log_reg.y_pred == model.y_test).all()
+
+        self.assertTrue(validate)
+
+    def test_model_dense_only_sparse_tfidf(self):
+
+        data = pd.DataFrame(
+            {
+                "text": ["good movie", "bad movie", "great film", "awful film"] * 25,
+                "col2": [1, 0, 1, 0] * 25,
+            }
+        )
+
+        model = Classification(x_train=data, target="col2")
+        model.tfidf("text", keep_col=False, sparse=True)
+        model.SVC(run=True)
+        validate = (model.svc_cls.y_pred == model.y_test).all()
+
+        self.assertTrue(validate)
+
+    def test_model_dense_only_sparse_onehot(self):
+
+        data = pd.DataFrame(
+            {
+                "a": np.random.choice(["x", "y", "z"], size=200),
+                "b": np.random.choice(["u", "v"], size=200),
+                "col3": np.random.randint(0, 2, size=200),
+            }
+        )
+
+        model = Classification(x_train=data, target="col3")
+        model.onehot_encode("a", "b", keep_col=False, sparse=True)
+        model.GaussianClassification(run=True)
+        model.SVC(run=True)
+
+        self.assertIsNotNone(model.gauss.y_pred)
+        self.assertIsNotNone(model.svc_cls.y_pred)
+
     def test_model_confusionmatrix(self):
 
         data = np.random.randint(0, 2, size=(500, 3))
@@ -521,6 +775,40 @@ class TestModelling(unittest.TestCase):
 
         self.assertTrue(len(model._models) == 3 and len(model._queued_models) == 0)
 
+    def test_xgboost_parallelprocessing(self):
+
+        data = np.random.randint(0, 2, size=(500, 3))
+
+        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+
+        model = Classification(x_train=data, target="col3", test_split_percentage=0.5,)
+        model.LogisticRegression(model_name="l1", run=False)
+        model.XGBoostClassification(model_name="l2", run=False)
+
+        model.run_models()
+
+        self.assertTrue(len(model._models) == 2 and len(model._queued_models) == 0)
+
+    def test_stream_parallelprocessing(self):
+
+        data = np.random.randint(0, 2, size=(500, 3))
+
+        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+
+        model = Classification(x_train=data, target="col3", test_split_percentage=0.5,)
+        model.LogisticRegression(model_name="l1", run=False)
+        model.LogisticRegression(model_name="l2", run=False)
+
+        models = model.run_models(stream=True)
+        first = next(models)
+
+        self.assertIn(first.model_name, model._models)
+        self.assertNotIn(first.model_name, model._queued_models)
+
+        list(models)
+
+        self.assertTrue(len(model._models) == 2 and len(model._queued_models) == 0)
+
     def test_local_seriesprocessing(self):
 
         data = np.random.randint(0, 2, size=(500, 3))
@@ -700,6 +988,71 @@ class TestModelling(unittest.TestCase):
 
         self.assertTrue(True)
 
+    def test_run_crossvalidation_scores(self):
+
+        from sklearn.linear_model import LogisticRegression
+        from sklearn.model_selection import StratifiedKFold, cross_val_score
+        from aethos.modelling.util import run_crossvalidation
+
+        data = np.random.randint(0, 2, size=(500, 3))
+
+        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+
+        scores = run_crossvalidation(
+            LogisticRegression(),
+            data[["col1", "col2"]],
+            data["col3"],
+            cv=StratifiedKFold(5),
+            n_jobs=2,
+        )
+
+        self.assertTrue(
+            np.allclose(
+                scores,
+                cross_val_score(
+                    LogisticRegression(),
+                    data[["col1", "col2"]],
+                    data["col3"],
+                    cv=StratifiedKFold(5),
+                ),
+            )
+        )
+
+    def test_run_crossvalidation_uneven_folds(self):
+
+        from sklearn.linear_model import LinearRegression
+        from sklearn.model_selection import KFold, cross_val_score
+        from aethos.modelling.util import run_crossvalidation
+
+        data = pd.DataFrame(
+            {
+                "col1": np.arange(23),
+                "col2": np.random.rand(23),
+                "col3": np.random.rand(23),
+            }
+        )
+
+        scores = run_crossvalidation(
+            LinearRegression(),
+            data[["col1", "col2"]],
+            data["col3"],
+            cv=KFold(5),
+            scoring="r2",
+            n_jobs=1,
+        )
+
+        self.assertTrue(
+            np.allclose(
+                scores,
+                cross_val_score(
+                    LinearRegression(),
+                    data[["col1", "col2"]],
+                    data["col3"],
+                    cv=KFold(5),
+                ),
+            )
+        )
+
     def test_del_model(self):
 
         data = np.random.randint(0, 2, size=(500, 3))
@@ -1314,6 +1667,162 @@ class TestModelling(unittest.TestCase):
 
         self.assertTrue(True)
 
+    def test_model_analysis_create_compiled_service(self):
+
+        data = np.random.randint(0, 2, size=(500, 3))
+
+        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+
+        model = Classification(x_train=data, target="col3")
+        m = model.DecisionTreeClassification(model_name="dt")
+
+        m.to_service("test_compiled", compiled=True)
+
+        validate = os.path.exists(
+            str(Path.home()) + "/.aethos/projects/test_compiled/app/dt.npz"
+        )
+
+        self.assertTrue(validate)
+
+    def test_model_create_batching_service(self):
+
+        data = np.random.randint(0, 2, size=(500, 3))
+
+        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+
+        model = Classification(x_train=data, target="col3")
+        model.LogisticRegression(random_state=2, run=True)
+
+        model.to_service("log_reg", "test_batching", workers=2, max_batch_size=32)
+
+        project_dir = str(Path.home()) + "/.aethos/projects/test_batching"
+
+        with open(project_dir + "/app/main.py") as f:
+            main = f.read()
+
+        with open(project_dir + "/Dockerfile") as f:
+            dockerfile = f.read()
+
+        self.assertIn('"/predict_batch"', main)
+        self.assertIn("FEATURES = ['col1', 'col2']", main)
+        self.assertIn("ENV WEB_CONCURRENCY=2", dockerfile)
+        self.assertIn("ENV MAX_BATCH_SIZE=32", dockerfile)
+
+    def test_model_batching_service_reordered_columns(self):
+
+        import http.client
+        import json
+        from aethos.templates.benchmark import _free_port, _in_process_service
+
+        data = np.random.randint(0, 2, size=(500, 3))
+
+        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+
+        model = Classification(x_train=data, target="col3")
+        model.LogisticRegression(random_state=2, run=True)
+        model.to_service("log_reg", "test_reordered")
+
+        port = _free_port()
+        bodies = [
+            {"col1": [0, 1, 1], "col2": [1, 0, 1]},
+            {"col2": [1, 0, 1], "col1": [0, 1, 1]},
+            {"col1": [0, 1, 1], "col2": [1, 0]},
+            {"col1": [0, 1, 1], "col2": [1, "a", 1]},
+            {"col1": [0, 1, 1]},
+        ]
+        responses = []
+
+        with _in_process_service(
+            str(Path.home()) + "/.aethos/projects/test_reordered/app", port
+        ):
+            for body in bodies:
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+                conn.request(
+                    "POST",
+                    "/predict_batch",
+                    json.dumps(body),
+                    {"Content-Type": "application/json"},
+                )
+                response = conn.getresponse()
+                responses.append((response.status, json.loads(response.read())))
+                conn.close()
+
+        self.assertListEqual(
+            [status for status, _ in responses], [200, 200, 422, 422, 422]
+        )
+        self.assertListEqual(
+            responses[0][1]["predictions"],
+            model.log_reg.model.predict(
+                pd.DataFrame(bodies[0], columns=["col1", "col2"])
+            ).tolist(),
+        )
+        self.assertEqual(responses[0][1], responses[1][1])
+
+    def test_model_analysis_benchmark_no_service(self):
+
+        data = np.random.randint(0, 2, size=(500, 3))
+
+        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+
+        model = Classification(x_train=data, target="col3")
+        m = model.LogisticRegression(random_state=2)
+
+        self.assertRaises(ValueError, m.benchmark_service, "no_service_project")
+
+    def test_model_analysis_benchmark_in_process(self):
+
+        data = np.random.randint(0, 2, size=(500, 3))
+
+        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+
+        model = Classification(x_train=data, target="col3")
+        m = model.LogisticRegression(random_state=2)
+
+        m.to_service("test_benchmark")
+        report = m.benchmark_service(
+            "test_benchmark",
+            concurrency=4,
+            n_requests=20,
+            batch_size=8,
+            in_process=True,
+        )
+
+        self.assertListEqual(report.index.tolist(), ["/predict", "/predict_batch"])
+        self.assertListEqual(report["Rows"].tolist(), [20, 160])
+        self.assertEqual(report["Error Rate"].sum(), 0)
+        self.assertTrue((report["Requests/s"] > 0).all())
+
+    def test_tracking_queue_flush(self):
+
+        from aethos.modelling.util import _TrackingQueue
+
+        queue = _TrackingQueue(max_jobs=2)
+        logged = []
+
+        for i in range(10):
+            queue.submit(logged.append, i)
+
+        queue.flush()
+
+        self.assertListEqual(logged, list(range(10)))
+
+    def test_tracking_run_id_future(self):
+
+        from concurrent.futures import Future
+
+        data = np.random.randint(0, 2, size=(500, 3))
+
+        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+
+        model = Classification(x_train=data, target="col3", test_split_percentage=0.5,)
+        m = model.LogisticRegression(run=True)
+
+        run_id = Future()
+        run_id.set_result("run")
+        m.run_id = run_id
+
+        self.assertEqual(m.run_id, "run")
+
     def test_list_models_empty(self):
 
         data = np.random.randint(0, 2, size=(500, 3))
@@ -1409,6 +1918,45 @@ class TestModelling(unittest.TestCase):
 
         self.assertIsInstance(validate, dict)
 
+    def test_pretrained_run_pipeline_batches(self):
+
+        from aethos.modelling.pretrained import PipelineCache, run_pipeline
+
+        batches = []
+
+        def nlp(texts):
+            batches.append(texts)
+            return [len(text) for text in texts]
+
+        texts = ["ccc", "a", "bb", "a", "dddd"]
+        results = run_pipeline(nlp, texts, batch_size=2, cache=False)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = PipelineCache(path=os.path.join(tmp, "test.db"))
+            cache.set({"key": results})
+
+            cached = cache.get(["key", "missing"])
+
+        self.assertListEqual(results, [3, 1, 2, 1, 4])
+        self.assertListEqual(batches, [["a", "bb"], ["ccc", "dddd"]])
+        self.assertDictEqual(cached, {"key": results})
+        self.assertRaises(ValueError, run_pipeline, nlp, texts)
+
+
+    def test_pretrained_cache_size(self):
+
+        from aethos.modelling.pretrained import PipelineCache
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = PipelineCache(path=os.path.join(tmp, "test.db"), max_size=1)
+            cache.set({"a": b"0" * 600000})
+            cache.set({"b": b"1" * 600000})
+
+            cached = cache.get(["a", "b"])
+            cache.clear()
+
+            self.assertListEqual(list(cached), ["b"])
+            self.assertDictEqual(cache.get(["b"]), {})
 
 if __name__ == "__main__":
     unittest.main()
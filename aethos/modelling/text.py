@@ -1,11 +1,18 @@
+import os
+import sys
+
 import gensim
+import numpy as np
+import pandas as pd
 from gensim.models import Word2Vec
-from gensim.models.doc2vec import Doc2Vec, TaggedDocument
+from gensim.models.doc2vec import Doc2Vec, TaggedDocument, TaggedLineDocument
+from gensim.models.word2vec import LineSentence
 from gensim.summarization import keywords
 from gensim.summarization.summarizer import summarize
-from nltk.tokenize import word_tokenize
 
-from aethos.preprocessing.text import process_text
+from aethos.config.config import _global_config
+from aethos.feature_engineering.util import encoded_frame
+from aethos.preprocessing.text import TextNormalizer
 
 
 def gensim_textrank_summarizer(
@@ -105,7 +112,124 @@ def gensim_textrank_keywords(
     return x_train, x_test
 
 
-def gensim_word2vec(x_train, x_test=None, prep=False, col_name=None, **algo_kwargs):
+class DocumentStream(object):
+    """
+    Restartable iterable over the tokens of every document of a column.
+
+    Documents are tokenized lazily on every pass, so the tokens of the whole column are never held in memory at once.
+
+    Parameters
+    ----------
+    texts : iterable
+        Documents
+
+    tokenize : callable, optional
+        Function tokenizing a document, by default None for documents that are already tokenized
+    """
+
+    def __init__(self, texts, tokenize=None):
+
+        self.texts = texts
+        self.tokenize = tokenize
+
+    def __iter__(self):
+
+        for text in self.texts:
+            yield self.tokenize(text) if self.tokenize is not None else text
+
+
+class TokenFile(object):
+    """
+    Restartable iterable over the tokens of a file written by `TokenFile.write`, one document per line.
+
+    The file is read back with gensim's `LineSentence`, empty documents are skipped.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file
+    """
+
+    def __init__(self, path: str):
+
+        self.path = path
+
+    @classmethod
+    def write(cls, path: str, documents):
+        """
+        Writes the tokens of every document to a file, one document per line.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file
+
+        documents : iterable
+            Tokens of every document
+
+        Returns
+        -------
+        TokenFile
+            Tokens of the written file
+        """
+
+        with open(path, "w", encoding="utf-8") as f:
+            for tokens in documents:
+                f.write(" ".join(tokens) + "\n")
+
+        return cls(path)
+
+    def __iter__(self):
+
+        # Long documents are not split into chunks
+        return iter(LineSentence(self.path, max_sentence_length=sys.maxsize))
+
+
+class TaggedDocumentStream(object):
+    """
+    Restartable iterable tagging every document with its position.
+
+    Documents of a `TokenFile` are read with gensim's `TaggedLineDocument`, so empty documents keep their position.
+
+    Parameters
+    ----------
+    documents : iterable
+        Tokens of every document, iterable more than once
+    """
+
+    def __init__(self, documents):
+
+        self.documents = documents
+
+    def __iter__(self):
+
+        if isinstance(self.documents, TokenFile):
+            for document in TaggedLineDocument(self.documents.path):
+                yield TaggedDocument(words=document.words, tags=[str(document.tags[0])])
+        else:
+            for i, words in enumerate(self.documents):
+                yield TaggedDocument(words=words, tags=[str(i)])
+
+
+def _training_corpus(texts, prep=False, corpus_file=None):
+    """
+    Restartable corpus of the tokens of every document, for models trained over multiple passes.
+
+    Documents are tokenized lazily on every pass, or once into `corpus_file` and then read from disk.
+    """
+
+    tokenize = TextNormalizer().tokenize if prep else None
+    documents = DocumentStream(texts, tokenize)
+
+    if corpus_file is not None:
+        documents = TokenFile.write(corpus_file, documents)
+
+    return documents
+
+
+def gensim_word2vec(
+    x_train, x_test=None, prep=False, col_name=None, corpus_file=None, **algo_kwargs
+):
     """
     Uses Gensim Text Rank summarize to extract keywords.
 
@@ -126,6 +250,9 @@ def gensim_word2vec(x_train, x_test=None, prep=False, col_name=None, **algo_kwar
 
     col_name : str, optional
         Column name of text data that you want to summarize
+
+    corpus_file : str, optional
+        Path to write the tokenized text to, so it is tokenized once and read from disk on every pass, by default None
         
     Returns
     -------
@@ -133,18 +260,18 @@ def gensim_word2vec(x_train, x_test=None, prep=False, col_name=None, **algo_kwar
         Word2Vec model
     """
 
-    if prep:
-        w2v = Word2Vec(
-            sentences=[word_tokenize(process_text(text)) for text in x_train[col_name]],
-            **algo_kwargs
-        )
-    else:
-        w2v = Word2Vec(sentences=x_train[col_name], **algo_kwargs)
+    algo_kwargs.setdefault("workers", os.cpu_count())
+
+    w2v = Word2Vec(
+        sentences=_training_corpus(x_train[col_name], prep, corpus_file), **algo_kwargs
+    )
 
     return w2v
 
 
-def gensim_doc2vec(x_train, x_test=None, prep=False, col_name=None, **algo_kwargs):
+def gensim_doc2vec(
+    x_train, x_test=None, prep=False, col_name=None, corpus_file=None, **algo_kwargs
+):
     """
     Uses Gensim Text Rank summarize to extract keywords.
 
@@ -165,6 +292,9 @@ def gensim_doc2vec(x_train, x_test=None, prep=False, col_name=None, **algo_kwarg
 
     col_name : str, optional
         Column name of text data that you want to summarize
+
+    corpus_file : str, optional
+        Path to write the tokenized text to, so it is tokenized once and read from disk on every pass, by default None
     
     Returns
     -------
@@ -172,24 +302,31 @@ def gensim_doc2vec(x_train, x_test=None, prep=False, col_name=None, **algo_kwarg
         Doc2Vec Model
     """
 
-    if prep:
-        tagged_data = [
-            TaggedDocument(words=word_tokenize(process_text(text)), tags=[str(i)])
-            for i, text in enumerate(x_train[col_name])
-        ]
-    else:
-        tagged_data = [
-            TaggedDocument(words=text, tags=[str(i)])
-            for i, text in enumerate(x_train[col_name])
-        ]
+    algo_kwargs.setdefault("workers", os.cpu_count())
+
+    tagged_data = TaggedDocumentStream(
+        _training_corpus(x_train[col_name], prep, corpus_file)
+    )
 
-    d2v = Doc2Vec(tagged_data, **algo_kwargs)
+    d2v = Doc2Vec(documents=tagged_data, **algo_kwargs)
     d2v.delete_temporary_training_data(keep_doctags_vectors=True, keep_inference=True)
 
     return d2v
 
 
-def gensim_lda(x_train, x_test=None, prep=False, col_name=None, **algo_kwargs):
+def gensim_lda(
+    x_train,
+    x_test=None,
+    prep=False,
+    col_name=None,
+    workers=None,
+    no_below=None,
+    no_above=None,
+    keep_n=None,
+    corpus_file=None,
+    topic_distribution=False,
+    **algo_kwargs
+):
     """
     Runs Gensim LDA model and assigns topics to documents.
     
@@ -208,6 +345,25 @@ def gensim_lda(x_train, x_test=None, prep=False, col_name=None, **algo_kwargs):
 
     col_name : str, optional
         Column name of text data that you want to summarize
+
+    workers : int, optional
+        Number of processes to train the model with, -1 for one per CPU, by default the `n_jobs` option
+
+    no_below : int, optional
+        Removes words in fewer than `no_below` documents from the vocabulary, by default None
+
+    no_above : float, optional
+        Removes words in more than `no_above` of the documents from the vocabulary, by default None
+
+    keep_n : int, optional
+        Keeps only the `keep_n` most frequent words in the vocabulary, by default None
+
+    corpus_file : str, optional
+        Path to serialize the bag of words corpus to in the Matrix Market format.
+        The corpus is then streamed from disk instead of being held in memory, by default None
+
+    topic_distribution : bool, optional
+        True to add the probability of every topic as sparse `topic_N` columns, by default False
     
     Returns
     -------
@@ -217,71 +373,133 @@ def gensim_lda(x_train, x_test=None, prep=False, col_name=None, **algo_kwargs):
     Returns 2 Dataframes if x_test is provided. 
     """
 
-    texts = x_train[col_name].tolist()
-
     if prep:
-        texts = [word_tokenize(process_text(text)) for text in texts]
-    elif isinstance(texts[0], str):
-        texts = [word_tokenize(process_text(text, stemmer=False)) for text in texts]
+        tokenize = TextNormalizer().tokenize
+    elif isinstance(x_train[col_name].iloc[0], str):
+        tokenize = TextNormalizer(stemmer=False).tokenize
+    else:
+        tokenize = None
+
+    texts = DocumentStream(x_train[col_name], tokenize)
+
+    # Documents are tokenized once when the corpus is held in memory
+    if corpus_file is None:
+        texts = list(texts)
 
     id2word = gensim.corpora.Dictionary(texts)
-    corpus = [id2word.doc2bow(text) for text in texts]
 
-    lda_model = gensim.models.LdaModel(corpus=corpus, id2word=id2word, **algo_kwargs)
+    if no_below is not None or no_above is not None or keep_n is not None:
+        id2word.filter_extremes(
+            no_below=no_below if no_below is not None else 1,
+            no_above=no_above if no_above is not None else 1.0,
+            keep_n=keep_n,
+        )
+
+    if corpus_file is None:
+        corpus = [id2word.doc2bow(text) for text in texts]
+    else:
+        gensim.corpora.MmCorpus.serialize(
+            corpus_file, (id2word.doc2bow(text) for text in texts), id2word=id2word
+        )
+        corpus = gensim.corpora.MmCorpus(corpus_file)
+
+    workers = _global_config["n_jobs"] if workers is None else workers
 
-    x_train["topics"] = _assign_topic_doc(lda_model, texts, corpus)
+    if workers == 1:
+        lda_model = gensim.models.LdaModel(
+            corpus=corpus, id2word=id2word, **algo_kwargs
+        )
+    else:
+        # With no workers given, gensim uses all CPUs but one
+        lda_model = gensim.models.LdaMulticore(
+            corpus=corpus,
+            id2word=id2word,
+            workers=workers if workers > 0 else None,
+            **algo_kwargs
+        )
 
-    if x_test is not None:
-        texts = x_test[col_name].tolist()
+    distribution = _topic_distribution(lda_model, corpus)
+    x_train["topics"] = _assign_topic_doc(lda_model, distribution)
 
-        if prep:
-            texts = [word_tokenize(process_text(text)) for text in texts]
-        elif isinstance(texts[0], str):
-            texts = [word_tokenize(text) for text in texts]
+    if topic_distribution:
+        x_train = pd.concat(
+            [x_train, _topic_frame(distribution, x_train.index)], axis=1
+        )
 
+    if x_test is not None:
+        texts = DocumentStream(x_test[col_name], tokenize)
         test_corpus = [id2word.doc2bow(text) for text in texts]
 
-        x_test["topics"] = _assign_topic_doc(lda_model, texts, test_corpus)
+        distribution = _topic_distribution(lda_model, test_corpus)
+        x_test["topics"] = _assign_topic_doc(lda_model, distribution)
+
+        if topic_distribution:
+            x_test = pd.concat(
+                [x_test, _topic_frame(distribution, x_test.index)], axis=1
+            )
 
     return x_train, x_test, lda_model, corpus, id2word
 
 
-def _assign_topic_doc(lda_model, texts, corpus):
+def _topic_distribution(lda_model, corpus):
+    """
+    Helper function to compute the topic distribution of every document
+
+    Parameters
+    ----------
+    lda_model : LDAModel
+        LDA Model
+
+    corpus : iterable
+        Corpus
+
+    Returns
+    -------
+    sp.csr_matrix
+        Documents by topics matrix of the topic probabilities, topics below the model's minimum probability are 0
+    """
+
+    return gensim.matutils.corpus2csc(
+        lda_model[corpus], num_terms=lda_model.num_topics
+    ).T.tocsr()
+
+
+def _assign_topic_doc(lda_model, distribution):
     """
     Helper function to assign the relevant topics to each document
-    
+
     Parameters
     ----------
     lda_model : LDAModel
         LDA Model
 
-    texts : [str]
-        List of text documents
+    distribution : sp.csr_matrix
+        Topic distribution of every document
 
-    corpus : list
-        Corpus list
-    
     Returns
     -------
     list
-        List of topics assigned to each document
+        Keywords of the dominant topic of each document, empty for documents without a topic
     """
 
-    keywords = []
+    topic_keywords = np.array(
+        [
+            ", ".join([word for word, prop in lda_model.show_topic(topic_num)])
+            for topic_num in range(lda_model.num_topics)
+        ],
+        dtype=object,
+    )
 
-    for i, row in enumerate(lda_model[corpus]):
+    dominant = np.asarray(distribution.argmax(axis=1)).ravel()
+    has_topic = distribution.getnnz(axis=1) > 0
 
-        if not row:
-            keywords.append("")
-        else:
-            row = sorted(row, key=lambda x: (x[1]), reverse=True)
+    return np.where(has_topic, topic_keywords[dominant], "").tolist()
 
-            for j, (topic_num, prop_topic) in enumerate(row):
-                if j == 0:
-                    wp = lda_model.show_topic(topic_num)
-                    topic_keywords = ", ".join([word for word, prop in wp])
-                    keywords.append(topic_keywords)
 
-                    break
+def _topic_frame(distribution, index):
+    """Topic distribution as sparse `topic_N` columns."""
 
-    return keywords
+    return encoded_frame(
+        distribution,
+        columns=[f"topic_{i}" for i in range(distribution.shape[1])],
+    ).set_index(index)
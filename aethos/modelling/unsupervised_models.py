@@ -9,7 +9,7 @@ from aethos.preprocessing.preprocess import Preprocess
 from aethos.feature_engineering.feature import Feature
 from aethos.visualizations.visualizations import Visualizations
 from aethos.stats.stats import Stats
-from aethos.modelling.util import add_to_queue
+from aethos.modelling.util import add_to_queue, find_optimal_k
 
 
 class Unsupervised(
@@ -36,11 +36,20 @@ class Unsupervised(
 
     @add_to_queue
     def KMeans(
-        self, model_name="km", run=True, verbose=1, **kwargs,
+        self,
+        model_name="km",
+        run=True,
+        verbose=1,
+        k_range=(4, 12),
+        sample_size=10000,
+        n_workers=-1,
+        **kwargs,
     ):
         # region
         """
         NOTE: If 'n_clusters' is not provided, k will automatically be determined using an elbow plot using distortion as the mteric to find the optimal number of clusters.
+        The candidate k values are fit in parallel on a sample of the data and only the optimal k is fit on all of the data.
+        The distortion and fit time of every candidate is available in the `k_search` attribute of the result.
 
         K-means clustering is one of the simplest and popular unsupervised machine learning algorithms.
 
@@ -64,6 +73,15 @@ class Unsupervised(
         verbose : int, optional
             Verbosity level of model output, the higher the number - the more verbose. By default, 1
 
+        k_range : tuple or list, optional
+            (start, stop) range of k values to try when finding the optimal k, stop excluded, or a list of k values, by default (4, 12)
+
+        sample_size : int, optional
+            Number of rows sampled to find the optimal k, by default 10000
+
+        n_workers : int, optional
+            Number of k values to try in parallel, -1 uses all the CPUs, by default -1
+
         n_clusters : int, optional, default: 8
             The number of clusters to form as well as the number of centroids to generate.
 
@@ -97,30 +115,24 @@ class Unsupervised(
         --------
         >>> model.KMeans()
         >>> model.KMeans(model_name='kmean_1, n_cluster=5)
+        >>> model.KMeans(k_range=(2, 20), sample_size=50000)
         >>> model.KMeans(run=False) # Add model to the queue
         """
         # endregion
 
         from sklearn.cluster import KMeans
 
-        def find_optk():
-
-            from yellowbrick.cluster import KElbowVisualizer
-
-            model = KMeans(**kwargs)
-
-            visualizer = KElbowVisualizer(model, k=(4, 12))
-            visualizer.fit(self.train_data)
-            visualizer.show()
-
-            print(f"Optimal number of clusters is {visualizer.elbow_value_}.")
-
-            return visualizer.elbow_value_
-
         n_clusters = kwargs.pop("n_clusters", None)
+        k_search = None
 
         if not n_clusters:
-            n_clusters = find_optk()
+            n_clusters, k_search = find_optimal_k(
+                self.train_data,
+                k_range=k_range,
+                sample_size=sample_size,
+                n_workers=n_workers,
+                **kwargs,
+            )
 
         model = KMeans
 
@@ -133,6 +145,140 @@ class Unsupervised(
             **kwargs,
         )
 
+        model.k_search = k_search
+
+        return model
+
+    @add_to_queue
+    def MiniBatchKMeans(
+        self, model_name="mbkm", run=True, verbose=1, **kwargs,
+    ):
+        # region
+        """
+        Mini Batch K-Means is a variant of K-Means that updates its centroids with small random batches of the data,
+        converging much faster than K-Means at the cost of slightly worse clusters.
+
+        It can be trained on data that does not fit in memory by passing `chunks`, an iterable of DataFrames or a path to a csv or parquet file.
+        The model is then trained chunk by chunk and clusters can be assigned to all of the data, chunk by chunk, with `assign_clusters`.
+        The data the Unsupervised object was created with is used as a sample for analysis.
+
+        For a list of all possible options for Mini Batch K-Means please visit: https://scikit-learn.org/stable/modules/generated/sklearn.cluster.MiniBatchKMeans.html
+
+        Parameters
+        ----------
+
+        model_name : str, optional
+            Name for this model, by default "mbkm"
+
+        run : bool, optional
+            Whether to train the model or just initialize it with parameters (useful when wanting to test multiple models at once) , by default False
+
+        verbose : int, optional
+            Verbosity level of model output, the higher the number - the more verbose. By default, 1
+
+        chunks : str, callable or iterable, optional
+            Path to a csv or parquet file, a function returning an iterable of DataFrames or an iterable of DataFrames to train on, by default None
+
+        chunk_size : int, optional
+            Number of rows per chunk when reading chunks from a file, by default 100000
+
+        n_clusters : int, optional, default: 8
+            The number of clusters to form as well as the number of centroids to generate.
+
+        init : {‘k-means++’, ‘random’ or an ndarray}, default: ‘k-means++’
+            Method for initialization.
+
+        max_iter : int, optional
+            Maximum number of iterations over the complete dataset before stopping independently of any early stopping criterion heuristics.
+
+        batch_size : int, optional, default: 100
+            Size of the mini batches.
+
+        random_state : int, RandomState instance or None (default)
+            Determines random number generation for centroid initialization and random reassignment.
+                    
+        Returns
+        -------
+        UnsupervisedModelAnalysis
+            UnsupervisedModelAnalysis object to view results and further analysis
+
+        Examples
+        --------
+        >>> model.MiniBatchKMeans(n_clusters=5)
+        >>> model.MiniBatchKMeans(n_clusters=5, chunks='events.csv', chunk_size=500000)
+        >>> model.MiniBatchKMeans(run=False) # Add model to the queue
+        """
+        # endregion
+
+        from sklearn.cluster import MiniBatchKMeans
+
+        model = MiniBatchKMeans
+
+        model = self._run_unsupervised_model(
+            model, model_name, run=run, verbose=verbose, **kwargs,
+        )
+
+        return model
+
+    @add_to_queue
+    def Birch(
+        self, model_name="birch", run=True, **kwargs,
+    ):
+        # region
+        """
+        Birch builds a tree of subclusters summarizing the data in a single pass, the leaves of the tree are then clustered
+        into the final clusters. It is memory efficient and well suited to large datasets.
+
+        It can be trained on data that does not fit in memory by passing `chunks`, an iterable of DataFrames or a path to a csv or parquet file.
+        The model is then trained chunk by chunk and clusters can be assigned to all of the data, chunk by chunk, with `assign_clusters`.
+        The data the Unsupervised object was created with is used as a sample for analysis.
+
+        For a list of all possible options for Birch please visit: https://scikit-learn.org/stable/modules/generated/sklearn.cluster.Birch.html
+
+        Parameters
+        ----------
+
+        model_name : str, optional
+            Name for this model, by default "birch"
+
+        run : bool, optional
+            Whether to train the model or just initialize it with parameters (useful when wanting to test multiple models at once) , by default False
+
+        chunks : str, callable or iterable, optional
+            Path to a csv or parquet file, a function returning an iterable of DataFrames or an iterable of DataFrames to train on, by default None
+
+        chunk_size : int, optional
+            Number of rows per chunk when reading chunks from a file, by default 100000
+
+        threshold : float, optional, default 0.5
+            The radius of the subcluster obtained by merging a new sample and the closest subcluster should be lesser than the threshold.
+            Otherwise a new subcluster is started.
+
+        branching_factor : int, optional, default 50
+            Maximum number of subclusters in each node.
+
+        n_clusters : int, instance of sklearn.cluster model, default 3
+            Number of clusters after the final clustering step, which treats the subclusters from the leaves as new samples.
+                    
+        Returns
+        -------
+        UnsupervisedModelAnalysis
+            UnsupervisedModelAnalysis object to view results and further analysis
+
+        Examples
+        --------
+        >>> model.Birch(n_clusters=5)
+        >>> model.Birch(n_clusters=5, chunks='events.parquet')
+        >>> model.Birch(run=False) # Add model to the queue
+        """
+        # endregion
+
+        from sklearn.cluster import Birch
+
+        model = Birch
+
+        model = self._run_unsupervised_model(model, model_name, run=run, **kwargs,)
+
         return model
 
     @add_to_queue
@@ -1,13 +1,26 @@
+import hashlib
 import inspect
+import itertools
 import multiprocessing as mp
 import os
 import pickle
+import shutil
+import sys
+import tempfile
+import threading
+import time
 import warnings
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from functools import partial, wraps
+from multiprocessing.pool import ThreadPool
 from pathlib import Path
 
 import lightgbm as lgb
 import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
 
 with warnings.catch_warnings():
     warnings.simplefilter("ignore", category=DeprecationWarning)
@@ -18,14 +31,72 @@ with warnings.catch_warnings():
     import mlflow.xgboost
 
 import xgboost as xgb
-from sklearn.model_selection import GridSearchCV, KFold, StratifiedKFold
-from yellowbrick.model_selection import CVScores, LearningCurve
-
-from aethos.config import EXP_DIR, DEFAULT_MODEL_DIR, IMAGE_DIR, cfg
+from sklearn.linear_model import LogisticRegression, SGDClassifier, SGDRegressor
+from sklearn.model_selection import (
+    GridSearchCV,
+    KFold,
+    RandomizedSearchCV,
+    StratifiedKFold,
+)
+from sklearn.naive_bayes import BernoulliNB, MultinomialNB
+from sklearn.svm import LinearSVC, LinearSVR
+
+from aethos.config import (
+    EXP_DIR,
+    DEFAULT_CACHE_DIR,
+    DEFAULT_MODEL_DIR,
+    IMAGE_DIR,
+    cfg,
+)
 from aethos.config.config import _global_config
 from aethos.util import _make_dir
 from pickle import dump
 
+# Relative cost of fitting a model, used to schedule queued models until their run times are known.
+MODEL_COSTS = {
+    "SVC": 10,
+    "SVR": 10,
+    "OneClassSVM": 10,
+    "AgglomerativeClustering": 10,
+    "MeanShift": 10,
+    "GradientBoostingClassification": 5,
+    "GradientBoostingRegression": 5,
+    "RandomForestClassification": 3,
+    "RandomForestRegression": 3,
+    "BaggingClassification": 3,
+    "BaggingRegression": 3,
+    "ADABoostClassification": 3,
+    "ADABoostRegression": 3,
+    "XGBoostClassification": 2,
+    "XGBoostRegression": 2,
+    "LightGBMClassification": 2,
+    "LightGBMRegression": 2,
+}
+
+# Models relying on OpenMP, which is not fork safe
+OPENMP_MODELS = {
+    "XGBoostClassification",
+    "XGBoostRegression",
+    "LightGBMClassification",
+    "LightGBMRegression",
+}
+
+# Models that train on scipy sparse matrices, sparse features are passed to them without being densified
+SPARSE_MODELS = (
+    LogisticRegression,
+    SGDClassifier,
+    SGDRegressor,
+    LinearSVC,
+    LinearSVR,
+    BernoulliNB,
+    MultinomialNB,
+    lgb.LGBMModel,
+    xgb.XGBModel,
+)
+
+# Past run time of a model in seconds per cell of training data, by model
+_run_times = {}
+
 
 def add_to_queue(model_function):
     @wraps(model_function)
@@ -42,15 +113,10 @@ def add_to_queue(model_function):
         if kwargs["run"]:
             return model_function(self, *args, **kwargs)
         else:
-            if "XGBoost" in model_function.__name__:
-                print(
-                    "XGBoost is not comptabile to be run in parallel. Please run it normally or in run all models in a series."
-                )
-            else:
-                kwargs["run"] = True
-                self._queued_models[kwargs["model_name"]] = partial(
-                    getattr(self, model_function.__name__), *args, **kwargs
-                )
+            kwargs["run"] = True
+            self._queued_models[kwargs["model_name"]] = partial(
+                getattr(self, model_function.__name__), *args, **kwargs
+            )
 
     return wrapper
 
@@ -69,9 +135,20 @@ def get_default_args(func):
     }
 
 
-def run_gridsearch(model, gridsearch, cv=5, scoring="accuracy", **gridsearch_kwargs):
+def run_gridsearch(
+    model,
+    gridsearch,
+    cv=5,
+    scoring="accuracy",
+    search="grid",
+    n_iter=10,
+    **gridsearch_kwargs,
+):
     """
     Runs Gridsearch on a model
+
+    The parameters can be searched exhaustively ('grid'), by sampling candidates ('random') or by successive halving ('halving'),
+    where every candidate is trained on a small share of the data and only the best candidates are retrained on more data.
     
     Parameters
     ----------
@@ -86,6 +163,12 @@ def run_gridsearch(model, gridsearch, cv=5, scoring="accuracy", **gridsearch_kwa
     
     scoring : str
         Scoring metric to use when evaluating models
+
+    search : str, optional
+        How to search the parameters, either 'grid', 'random' or 'halving', by default 'grid'
+
+    n_iter : int, optional
+        Number of candidates sampled by the 'random' search, by default 10
     
     Returns
     -------
@@ -99,18 +182,55 @@ def run_gridsearch(model, gridsearch, cv=5, scoring="accuracy", **gridsearch_kwa
     else:
         raise ValueError("Invalid Gridsearch input.")
 
-    model = GridSearchCV(
-        model, gridsearch_grid, cv=cv, scoring=scoring, **gridsearch_kwargs
-    )
+    if search == "grid":
+        model = GridSearchCV(
+            model, gridsearch_grid, cv=cv, scoring=scoring, **gridsearch_kwargs
+        )
+    elif search == "random":
+        model = RandomizedSearchCV(
+            model,
+            gridsearch_grid,
+            n_iter=n_iter,
+            cv=cv,
+            scoring=scoring,
+            random_state=42,
+            **gridsearch_kwargs,
+        )
+    elif search == "halving":
+        from sklearn.experimental import enable_halving_search_cv
+        from sklearn.model_selection import HalvingGridSearchCV
+
+        model = HalvingGridSearchCV(
+            model,
+            gridsearch_grid,
+            cv=cv,
+            scoring=scoring,
+            random_state=42,
+            **gridsearch_kwargs,
+        )
+    else:
+        raise ValueError(
+            'Invalid search method, accepted search methods are either "grid", "random" or "halving".'
+        )
 
     return model
 
 
 def run_crossvalidation(
-    model, x_train, y_train, cv=5, scoring="accuracy", model_name=None
+    model,
+    x_train,
+    y_train,
+    cv=5,
+    scoring="accuracy",
+    model_name=None,
+    n_jobs=-1,
+    train_sizes=np.linspace(0.1, 1.0, 5),
 ):
     """
     Runs cross validation on a certain model.
+
+    The folds are computed once and every fold and learning curve size is fit in parallel.
+    The full size fold fits are used for both the cross validation scores and the last point of the learning curve.
     
     Parameters
     ----------
@@ -128,55 +248,706 @@ def run_crossvalidation(
 
     scoring : str, optional
         Scoring method, by default 'accuracy'
+
+    model_name : str, optional
+        Name of the model for saving images, by default None
+
+    n_jobs : int, optional
+        Number of fits to run in parallel, -1 uses all the CPUs, by default -1
+
+    train_sizes : array-like, optional
+        Fractions of the training folds used for the learning curve, by default np.linspace(0.1, 1.0, 5)
+        The full training folds are always fit
+
+    Returns
+    -------
+    np.ndarray
+        Test score of every fold
     """
 
-    fig, axes = plt.subplots(nrows=1, ncols=2, figsize=(15, 5))
-    visualizer_scores = CVScores(model, cv=cv, scoring=scoring, ax=axes[0])
-    visualizer_scores.fit(x_train, y_train)
-    visualizer_scores.finalize()
+    from joblib import Parallel, delayed
+    from sklearn.base import clone, is_classifier
+    from sklearn.metrics import check_scoring
+    from sklearn.model_selection import check_cv
+
+    cv = check_cv(cv, y_train, classifier=is_classifier(model))
+    folds = list(cv.split(x_train, y_train))
+    scorer = check_scoring(model, scoring=scoring)
+
+    # Sizes relative to each training fold, the full folds give the cross validation scores
+    fractions = np.unique(np.append(np.asarray(train_sizes, dtype=float), 1.0))
+    sizes = np.asarray(
+        [
+            np.clip((fractions * len(train)).astype(int), 1, len(train))
+            for train, _ in folds
+        ]
+    )
 
-    visualizer_lcurve = LearningCurve(model, cv=cv, scoring=scoring, ax=axes[1])
-    visualizer_lcurve.fit(x_train, y_train)
-    visualizer_lcurve.finalize()
+    scores = Parallel(n_jobs=n_jobs)(
+        delayed(_fit_and_score)(
+            clone(model), x_train, y_train, train[:size], test, scorer
+        )
+        for (train, test), fold_sizes in zip(folds, sizes)
+        for size in fold_sizes
+    )
 
-    visualizer_scores.show()
-    visualizer_lcurve.show()
+    # Train and test scores of shape (sizes, folds)
+    scores = (
+        np.asarray(scores).reshape(len(folds), len(fractions), 2).transpose(1, 0, 2)
+    )
+    train_scores, test_scores = scores[..., 0], scores[..., 1]
+    fold_scores = test_scores[-1]
+    name = type(model).__name__
+
+    fig, axes = plt.subplots(nrows=1, ncols=2, figsize=(15, 5))
+
+    axes[0].bar(np.arange(len(fold_scores)), fold_scores, width=0.5)
+    axes[0].axhline(
+        fold_scores.mean(),
+        color="b",
+        linestyle="--",
+        label=f"Mean score = {fold_scores.mean():0.3f}",
+    )
+    axes[0].set_title(f"Cross Validation Scores for {name}")
+    axes[0].set_xticks(np.arange(len(fold_scores)))
+    axes[0].set_xlabel("Fold")
+    axes[0].set_ylabel("Score")
+    axes[0].legend(frameon=True, loc="best")
+
+    # Average number of training instances of each size over the folds
+    sizes = sizes.mean(axis=0)
+
+    for curve, label, color in [
+        (train_scores, "Training Score", "b"),
+        (test_scores, "Cross Validation Score", "g"),
+    ]:
+        mean, std = curve.mean(axis=1), curve.std(axis=1)
+        axes[1].fill_between(sizes, mean - std, mean + std, alpha=0.25, color=color)
+        axes[1].plot(sizes, mean, "o-", color=color, label=label)
+
+    axes[1].set_title(f"Learning Curve for {name}")
+    axes[1].set_xlabel("Training Instances")
+    axes[1].set_ylabel("Score")
+    axes[1].legend(frameon=True, loc="best")
+
+    plt.show()
 
     if _global_config["track_experiments"]:  # pragma: no cover
         fig.savefig(os.path.join(IMAGE_DIR, model_name, "cv.png"))
 
+    return fold_scores
+
+
+def _fit_and_score(model, x, y, train, test, scorer):
+    """
+    Fits a model on the training rows and scores it on both the training and test rows.
+
+    Returns
+    -------
+    float, float
+        Train score, test score
+    """
+
+    x_train, y_train = to_model_input(model, _take(x, train)), _take(y, train)
+    x_test, y_test = to_model_input(model, _take(x, test)), _take(y, test)
+
+    model.fit(x_train, y_train)
+
+    return scorer(model, x_train, y_train), scorer(model, x_test, y_test)
+
+
+def _take(data, rows):
+    """Selects rows of a DataFrame, Series or array by position."""
+
+    return data.iloc[rows] if hasattr(data, "iloc") else data[rows]
+
 
 def _run_models_parallel(model_obj):
     """
-    Runs queued models in parallel
+    Runs queued models in parallel, yielding each model as soon as it is trained.
+
+    The training data is published once to read only memory mapped files that every worker process attaches to.
+    Models are orchestrated by threads in the main process, only the unfitted estimators are sent to the workers
+    and only the fitted estimators are sent back.
+
+    Models are started from the most to the least expensive, estimated from their past run times when available,
+    and each one is given a thread budget so the workers don't oversubscribe the machine.
+    See the `max_workers` and `threads_per_model` options.
     
     Parameters
     ----------
     model_obj : Model
         Model object
+
+    Yields
+    ------
+    Model
+        Trained model
+    """
+
+    n_cells = len(model_obj.x_train) * len(model_obj.features)
+    queued_models = sorted(
+        model_obj._queued_models.values(),
+        key=lambda job: _estimate_cost(job, n_cells),
+        reverse=True,
+    )
+    n_workers, n_threads = _get_worker_budget(len(queued_models))
+
+    # OpenMP runtimes can deadlock in forked processes
+    if any(job.func.__name__ in OPENMP_MODELS for job in queued_models):
+        ctx = mp.get_context("spawn")
+    else:
+        ctx = mp.get_context()
+
+    with _hashed_data(model_obj), SharedData(
+        model_obj.x_train, model_obj.y_train, columns=model_obj.features
+    ) as shared:
+        with ctx.Pool(
+            n_workers, initializer=_attach_shared_data, initargs=(shared,)
+        ) as pool:
+            model_obj._fit_pool = WorkerPool(pool, n_threads)
+
+            try:
+                with ThreadPool(n_workers) as threads:
+                    runs = threads.imap_unordered(
+                        partial(_run_job, n_cells=n_cells), queued_models
+                    )
+
+                    yield from _collect_models(model_obj, runs, len(queued_models))
+            finally:
+                model_obj._fit_pool = None
+
+
+def _run_models_series(model_obj):
+    """
+    Runs queued models one after the other, yielding each model as soon as it is trained.
+
+    Parameters
+    ----------
+    model_obj : Model
+        Model object
+
+    Yields
+    ------
+    Model
+        Trained model
     """
 
-    with mp.Pool(mp.cpu_count()) as pool:
-        results = pool.map(_run, list(model_obj._queued_models.values()))
+    n_cells = len(model_obj.x_train) * len(model_obj.features)
+    queued_models = list(model_obj._queued_models.values())
+
+    runs = (_run_job(job, n_cells) for job in queued_models)
 
-    for result in results:
+    with _hashed_data(model_obj):
+        yield from _collect_models(model_obj, runs, len(queued_models))
+
+
+def _collect_models(model_obj, runs, n_models: int):
+    """
+    Registers trained models as they come in and reports the progress.
+
+    Parameters
+    ----------
+    model_obj : Model
+        Model object
+
+    runs : iterable
+        Trained models and their run times
+
+    n_models : int
+        Number of models being run
+
+    Yields
+    ------
+    Model
+        Trained model
+    """
+
+    start = time.perf_counter()
+
+    for i, (result, run_time) in enumerate(runs, 1):
         model_obj._models[result.model_name] = result
-        del model_obj._queued_models[result.model_name]
+        model_obj._queued_models.pop(result.model_name, None)
 
-    return results
+        print(
+            f"[{i}/{n_models}] {result.model_name} finished in {run_time:.2f}s, {time.perf_counter() - start:.2f}s elapsed."
+        )
 
+        yield result
 
-def _run(model):
+    # Tracking runs in the background, models are only reported done once they are logged
+    if _global_config["track_experiments"]:  # pragma: no cover
+        flush_tracking()
+
+
+def _get_worker_budget(n_models: int):
     """
-    Runs a model
-        
+    Number of worker processes and threads per model to run queued models with.
+
+    Parameters
+    ----------
+    n_models : int
+        Number of queued models
+
     Returns
     -------
-    Model
-        Trained model
+    int, int
+        Number of workers, number of threads per model
+    """
+
+    n_cpus = mp.cpu_count()
+
+    n_workers = min(_global_config["max_workers"] or n_cpus, max(n_models, 1))
+    n_threads = _global_config["threads_per_model"] or max(n_cpus // n_workers, 1)
+
+    return n_workers, n_threads
+
+
+def _estimate_cost(job, n_cells: int) -> float:
+    """
+    Estimates the cost of running a queued model.
+
+    Parameters
+    ----------
+    job : partial
+        Queued model
+
+    n_cells : int
+        Number of cells in the training data
+
+    Returns
+    -------
+    float
+        Estimated run time in seconds, or in relative units when no model has been timed yet
+    """
+
+    name = job.func.__name__
+
+    if name in _run_times:
+        return _run_times[name] * n_cells
+
+    # Scale the relative cost of the model to the run times seen so far
+    rates = [rate / MODEL_COSTS.get(model, 1) for model, rate in _run_times.items()]
+
+    return MODEL_COSTS.get(name, 1) * (np.mean(rates) if rates else 1) * n_cells
+
+
+def _run_job(job, n_cells: int):
+    """
+    Runs a queued model and records its run time.
+
+    Parameters
+    ----------
+    job : partial
+        Queued model
+
+    n_cells : int
+        Number of cells in the training data
+
+    Returns
+    -------
+    Model, float
+        Trained model and its run time in seconds
+    """
+
+    start = time.perf_counter()
+
+    result = job()
+
+    run_time = time.perf_counter() - start
+    _run_times[job.func.__name__] = run_time / max(n_cells, 1)
+
+    return result, run_time
+
+
+class WorkerPool(object):
+    """
+    Worker processes fitting models on the shared training data.
+
+    Parameters
+    ----------
+    pool : multiprocessing.Pool
+        Worker processes attached to the shared training data
+
+    n_threads : int
+        Number of threads a model can use
+    """
+
+    def __init__(self, pool, n_threads: int):
+
+        self.pool = pool
+        self.n_threads = n_threads
+
+    def fit(self, model, supervised=True):
+        """
+        Fits a model in a worker process.
+
+        Parameters
+        ----------
+        model : Model Object
+            Unfitted model
+
+        supervised : bool, optional
+            True to fit the model with the target, by default True
+
+        Returns
+        -------
+        Model Object
+            Fitted model
+        """
+
+        return self.pool.apply(_fit_shared, (model, supervised, self.n_threads))
+
+
+class SharedData(object):
+    """
+    Training data published once to memory mapped .npy files, so worker processes can attach to it read only
+    instead of receiving their own pickled copy.
+
+    Numeric features are stored as a single column major array. Data that can't be memory mapped
+    (object, categorical columns) falls back to being pickled to each worker once.
+
+    Parameters
+    ----------
+    x : pd.DataFrame
+        Data
+
+    y : pd.Series, optional
+        Target, by default None
+
+    columns : list, optional
+        Feature columns of x, by default all of them
+    """
+
+    def __init__(self, x, y=None, columns=None):
+
+        self.path = tempfile.mkdtemp(prefix="aethos-")
+        self.columns = columns if columns is not None else x.columns.tolist()
+        self.x = None
+        self.y = None
+        self.x_file = None
+        self.y_file = None
+        self.y_name = y.name if y is not None else None
+
+        dtypes = [x[col].dtype for col in self.columns]
+
+        if all(_is_mappable(dtype) for dtype in dtypes) and len(self.columns):
+            self.x_file = os.path.join(self.path, "x.npy")
+            arr = np.lib.format.open_memmap(
+                self.x_file,
+                mode="w+",
+                dtype=np.result_type(*dtypes),
+                shape=(len(x), len(self.columns)),
+                fortran_order=True,
+            )
+
+            # Copy column by column to avoid materializing the whole frame as one array
+            for i, col in enumerate(self.columns):
+                arr[:, i] = x[col].values
+
+            arr.flush()
+            del arr
+        else:
+            self.x = x[self.columns]
+
+        if y is not None and _is_mappable(y.dtype):
+            self.y_file = os.path.join(self.path, "y.npy")
+            np.save(self.y_file, y.values)
+        else:
+            self.y = y
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, *exc):
+
+        self.close()
+
+    def load(self):
+        """
+        Attaches to the shared data.
+
+        Returns
+        -------
+        pd.DataFrame, pd.Series
+            Features and target, the target is None if there is no target
+        """
+
+        x = self.x
+        y = self.y
+
+        if self.x_file is not None:
+            x = pd.DataFrame(
+                np.load(self.x_file, mmap_mode="r"), columns=self.columns, copy=False
+            )
+
+        if self.y_file is not None:
+            y = pd.Series(np.load(self.y_file, mmap_mode="r"), name=self.y_name)
+
+        return x, y
+
+    def close(self):
+        """Removes the shared data files."""
+
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+def _is_mappable(dtype) -> bool:
+    """Whether data of this dtype can be stored in a memory mapped numpy array."""
+
+    return isinstance(dtype, np.dtype) and (
+        np.issubdtype(dtype, np.number) or np.issubdtype(dtype, np.bool_)
+    )
+
+
+def _has_sparse_columns(x) -> bool:
+    """Whether a DataFrame has pandas sparse columns."""
+
+    return isinstance(x, pd.DataFrame) and any(
+        isinstance(dtype, pd.SparseDtype) for dtype in x.dtypes
+    )
+
+
+def to_model_input(model, x):
     """
+    Converts data with sparse columns to a CSR matrix for models that train on sparse matrices,
+    and densifies the sparse columns for every other model.
+
+    The columns keep their order, so the model can be used on the DataFrame or the matrix alike.
+    Data without sparse columns is returned as is.
+
+    Parameters
+    ----------
+    model : Model Object
+        Model, or a search over a model
+
+    x : pd.DataFrame
+        Data
+
+    Returns
+    -------
+    pd.DataFrame or sp.csr_matrix
+        Data the model is fit or predicts on
+    """
+
+    estimator = getattr(model, "estimator", model)
+
+    if not _has_sparse_columns(x):
+        return x
+
+    if not isinstance(estimator, SPARSE_MODELS):
+        return x.astype(
+            {
+                col: dtype.subtype
+                for col, dtype in x.dtypes.items()
+                if isinstance(dtype, pd.SparseDtype)
+            }
+        )
+
+    blocks = []
+    is_sparse = lambda col: isinstance(x[col].dtype, pd.SparseDtype)
+
+    # Consecutive sparse or dense columns are converted as one block
+    for sparse, cols in itertools.groupby(x.columns, key=is_sparse):
+        cols = list(cols)
+
+        if sparse:
+            blocks.append(x[cols].sparse.to_coo())
+        else:
+            blocks.append(sp.csr_matrix(x[cols].to_numpy(dtype=np.float64)))
+
+    return sp.hstack(blocks, format="csr")
+
 
-    return model()
+# Shared data attached to by a worker process
+_shared_data = None
+
+
+def _attach_shared_data(shared):
+    """
+    Worker process initializer, attaches to the shared training data.
+
+    Parameters
+    ----------
+    shared : SharedData
+        Shared training data
+    """
+
+    global _shared_data
+
+    _shared_data = shared.load()
+
+
+def _fit_shared(model, supervised=True, n_threads=None):
+    """
+    Fits a model on the shared training data of a worker process.
+
+    Parameters
+    ----------
+    model : Model Object
+        Unfitted model
+
+    supervised : bool, optional
+        True to fit the model with the target, by default True
+
+    n_threads : int, optional
+        Number of threads the model can use, by default None
+
+    Returns
+    -------
+    Model Object
+        Fitted model
+    """
+
+    from threadpoolctl import threadpool_limits
+
+    x, y = _shared_data
+
+    if n_threads:
+        _set_thread_budget(model, n_threads)
+
+    with threadpool_limits(limits=n_threads):
+        if supervised:
+            model.fit(to_model_input(model, x), y)
+        else:
+            model.fit(x)
+
+    return model
+
+
+def _set_thread_budget(model, n_threads: int):
+    """
+    Limits the number of threads a model uses when it was left to use all of them.
+
+    For searches only the searched estimator is limited, the search itself runs sequentially.
+
+    Parameters
+    ----------
+    model : Model Object
+        Unfitted model
+
+    n_threads : int
+        Number of threads the model can use
+    """
+
+    is_search = hasattr(model, "param_grid") or hasattr(model, "param_distributions")
+
+    budget = {
+        param: n_threads
+        for param, value in model.get_params().items()
+        if param.endswith("n_jobs")
+        and value in (None, -1)
+        and not (is_search and param == "n_jobs")
+    }
+
+    model.set_params(**budget)
+
+
+def find_optimal_k(
+    data, k_range=(4, 12), sample_size=10000, n_workers=-1, **kmeans_kwargs
+):
+    """
+    Finds the optimal number of clusters for KMeans with the elbow method.
+
+    Candidate k values are fit in parallel on a random sample of the data.
+    
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Data to cluster
+
+    k_range : tuple or list, optional
+        (start, stop) range of k values to try, stop excluded, or a list of k values, by default (4, 12)
+
+    sample_size : int, optional
+        Number of rows sampled to fit the candidates, by default 10000
+
+    n_workers : int, optional
+        Number of candidates to fit in parallel, -1 uses all the CPUs, by default -1
+
+    Returns
+    -------
+    int, pd.DataFrame
+        Optimal k and the distortion and fit time of every candidate
+    """
+
+    from joblib import Parallel, delayed
+
+    start = time.perf_counter()
+
+    if isinstance(k_range, tuple) and len(k_range) == 2:
+        k_values = list(range(*k_range))
+    else:
+        k_values = sorted(k_range)
+
+    if sample_size and len(data) > sample_size:
+        data = data.sample(n=sample_size, random_state=42)
+
+    kmeans_kwargs.setdefault("random_state", 42)
+
+    results = Parallel(n_jobs=n_workers)(
+        delayed(_fit_kmeans)(data, k, **kmeans_kwargs) for k in k_values
+    )
+    results = pd.DataFrame(results, columns=["k", "distortion", "fit_time"])
+
+    optimal_k = _elbow(results["k"].values, results["distortion"].values)
+
+    fig, ax = plt.subplots(figsize=(8, 5))
+    ax.plot(results["k"], results["distortion"], "o-")
+    ax.axvline(optimal_k, color="k", linestyle="--", label=f"elbow at k = {optimal_k}")
+    ax.set_title("Distortion Score Elbow for KMeans Clustering")
+    ax.set_xlabel("k")
+    ax.set_ylabel("Distortion Score")
+    ax.legend(frameon=True, loc="best")
+    plt.show()
+
+    print(
+        f"Optimal number of clusters is {optimal_k}, found in {time.perf_counter() - start:.2f}s "
+        f"({results['fit_time'].sum():.2f}s of fits on {len(data)} rows)."
+    )
+
+    return optimal_k, results
+
+
+def _fit_kmeans(data, k, **kmeans_kwargs):
+    """
+    Fits KMeans for a number of clusters.
+
+    Returns
+    -------
+    int, float, float
+        k, distortion and fit time
+    """
+
+    from sklearn.cluster import KMeans
+
+    start = time.perf_counter()
+    model = KMeans(n_clusters=k, **kmeans_kwargs).fit(data)
+
+    return k, model.inertia_, time.perf_counter() - start
+
+
+def _elbow(x, y) -> int:
+    """
+    Finds the elbow of a decreasing curve, the point furthest from the line between its first and last points.
+    """
+
+    if len(x) < 3:
+        return int(x[np.argmin(y)])
+
+    x_norm = (x - x.min()) / (x.max() - x.min())
+    y_norm = (y - y.min()) / max(y.max() - y.min(), np.finfo(float).eps)
+
+    # Distance to the line from the first to the last point, in normalized units
+    distance = np.abs(
+        (y_norm[-1] - y_norm[0]) * x_norm
+        - (x_norm[-1] - x_norm[0]) * y_norm
+        + x_norm[-1] * y_norm[0]
+        - y_norm[-1] * x_norm[0]
+    )
+
+    return int(x[np.argmax(distance)])
 
 
 def _get_cv_type(cv_type, n_splits, shuffle, **kwargs):
@@ -228,6 +999,218 @@ def to_pickle(model, name, project=False, project_name=None):
     pickle.dump(model, open(os.path.join(path, name + ".pkl"), "wb"))
 
 
+def _data_digest(x, y=None) -> str:
+    """
+    Fingerprint of the training data, hashed once and shared by the fit cache keys of every model trained on it.
+
+    Parameters
+    ----------
+    x : pd.DataFrame
+        Training data
+
+    y : pd.Series, optional
+        Target, by default None
+
+    Returns
+    -------
+    str
+        Data digest
+    """
+
+    digest = hashlib.sha1()
+
+    digest.update(pd.util.hash_pandas_object(x, index=False).values.tobytes())
+    digest.update(repr(x.columns.tolist()).encode())
+
+    if y is not None:
+        digest.update(pd.util.hash_pandas_object(y, index=False).values.tobytes())
+
+    return digest.hexdigest()
+
+
+def _hashable_param(value):
+    """
+    Representation of a model parameter for its fit cache key.
+
+    Arrays are represented by a hash of their values, since their repr abbreviates large arrays,
+    and nested estimators by their class and parameters.
+    """
+
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        return (
+            "ndarray",
+            value.dtype.str,
+            value.shape,
+            hashlib.sha1(np.ascontiguousarray(value).tobytes()).hexdigest(),
+        )
+
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return (
+            type(value).__name__,
+            hashlib.sha1(
+                pd.util.hash_pandas_object(value).values.tobytes()
+            ).hexdigest(),
+        )
+
+    if isinstance(value, np.ndarray):
+        return ("ndarray", value.shape, _hashable_param(value.tolist()))
+
+    if hasattr(value, "get_params") and not isinstance(value, type):
+        return (
+            type(value).__module__,
+            type(value).__name__,
+            _hashable_param(value.get_params(deep=False)),
+        )
+
+    if isinstance(value, dict):
+        return sorted(
+            ((repr(k), _hashable_param(v)) for k, v in value.items()),
+            key=lambda item: item[0],
+        )
+
+    if isinstance(value, (list, tuple)):
+        return type(value)(_hashable_param(v) for v in value)
+
+    return value
+
+
+def _fit_cache_key(model, data_digest: str) -> str:
+    """
+    Fingerprint of a model fit, from the training data, the model class, its parameters
+    and the versions of the libraries it comes from.
+
+    Parameters
+    ----------
+    model : Model Object
+        Unfitted model, including any gridsearch around it
+
+    data_digest : str
+        Digest of the training data, see `_data_digest`
+
+    Returns
+    -------
+    str
+        Cache key
+    """
+
+    import sklearn
+
+    key = hashlib.sha1(data_digest.encode())
+
+    params = sorted(model.get_params().items())
+
+    # A model fitted by another version of its library may not load or predict the same
+    estimators = [model] + [value for _, value in params if hasattr(value, "get_params")]
+    versions = sorted(
+        {
+            (package, getattr(sys.modules[package], "__version__", None))
+            for package in (type(est).__module__.split(".")[0] for est in estimators)
+        }
+    )
+
+    key.update(
+        repr(
+            (
+                type(model).__module__,
+                type(model).__name__,
+                [(name, _hashable_param(value)) for name, value in params],
+                versions,
+                sklearn.__version__,
+            )
+        ).encode()
+    )
+
+    return key.hexdigest()
+
+
+@contextmanager
+def _hashed_data(model_obj):
+    """Hashes the training data once for the fit cache keys of every model in a run."""
+
+    if _global_config["fit_cache"]:
+        model_obj._data_digest = _data_digest(model_obj.train_data, model_obj.y_train)
+
+    try:
+        yield
+    finally:
+        model_obj._data_digest = None
+
+
+def load_cached_fit(key: str):
+    """
+    Loads a fitted model from the fit cache.
+
+    Parameters
+    ----------
+    key : str
+        Cache key
+
+    Returns
+    -------
+    Model Object
+        Fitted model, None if it is not cached
+    """
+
+    path = os.path.join(DEFAULT_CACHE_DIR, "fits", key + ".pkl")
+
+    try:
+        with open(path, "rb") as f:
+            model = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+
+    # Mark as recently used
+    os.utime(path)
+
+    return model
+
+
+def cache_fit(key: str, model):
+    """
+    Writes a fitted model to the fit cache, evicting the least recently used models
+    when the cache is larger than the `fit_cache_size` option.
+
+    Parameters
+    ----------
+    key : str
+        Cache key
+
+    model : Model Object
+        Fitted model
+    """
+
+    path = os.path.join(DEFAULT_CACHE_DIR, "fits")
+    _make_dir(path)
+
+    # Write to a file unique to this call then rename, so a partially written file is never read
+    with tempfile.NamedTemporaryFile(dir=path, suffix=".tmp", delete=False) as f:
+        tmp_file = f.name
+
+        try:
+            pickle.dump(model, f)
+        except BaseException:
+            f.close()
+            os.remove(tmp_file)
+            raise
+
+    os.replace(tmp_file, os.path.join(path, key + ".pkl"))
+
+    files = sorted(
+        (entry.stat().st_mtime, entry.stat().st_size, entry.path)
+        for entry in os.scandir(path)
+        if entry.name.endswith(".pkl")
+    )
+    size = sum(f[1] for f in files)
+    max_size = _global_config["fit_cache_size"] * 1024 ** 2
+
+    for _, file_size, file_path in files[:-1]:
+        if size <= max_size:
+            break
+
+        os.remove(file_path)
+        size -= file_size
+
+
 def _make_img_project_dir(model_name: str):
     """
     Make a model dir in images directory.
@@ -266,11 +1249,148 @@ def _validate_model_name(model_obj, model_name: str) -> bool:
     return True
 
 
+# Maximum number of tracking jobs waiting to be logged, training blocks when it is reached
+MAX_TRACKING_JOBS = 100
+
+
+class _TrackingQueue(object):
+    """
+    Logs to MLFlow from a single background thread, so training does not wait on tracking I/O.
+
+    Jobs run in the order they are submitted, a model's run is created before its artifacts are logged.
+    """
+
+    def __init__(self, max_jobs=MAX_TRACKING_JOBS):
+
+        self._executor = None
+        self._slots = threading.BoundedSemaphore(max_jobs)
+        self._lock = threading.Lock()
+        self._jobs = set()
+        # Artifact uploads waiting to run, and the modification time of every file uploaded per run
+        self._pending_artifacts = set()
+        self._uploaded = {}
+
+    def submit(self, func, *args) -> Future:
+        """Queues `func(*args)`, blocking while the queue is full."""
+
+        self._slots.acquire()
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="aethos-tracking"
+                )
+
+            job = self._executor.submit(func, *args)
+            self._jobs.add(job)
+
+        job.add_done_callback(self._done)
+
+        return job
+
+    def _done(self, job):
+
+        with self._lock:
+            self._jobs.discard(job)
+
+        self._slots.release()
+
+        if job.exception() is not None:
+            warnings.warn(f"Experiment tracking failed: {job.exception()}")
+
+    def flush(self):
+        """Waits for every queued job to be logged."""
+
+        with self._lock:
+            jobs = list(self._jobs)
+
+        wait(jobs)
+
+
+_tracking_queue = _TrackingQueue()
+
+
+def flush_tracking():
+    """
+    Waits for every queued model and artifact to be logged to MLFlow.
+
+    Examples
+    --------
+    >>> flush_tracking()
+    """
+
+    _tracking_queue.flush()
+
+
+def _log_model(exp_name, model, model_name, model_kwargs, metrics):  # pragma: no cover
+    """Logs a model to MLFlow, batching its parameters, metrics and tags into a single call."""
+
+    from mlflow.entities import Metric, Param, RunTag
+    from mlflow.tracking import MlflowClient
+
+    mlflow.set_tracking_uri(EXP_DIR)
+    mlflow.set_experiment(exp_name)
+
+    with mlflow.start_run(run_name=model_name) as run:
+        run_id = run.info.run_uuid
+        timestamp = int(time.time() * 1000)
+
+        MlflowClient(EXP_DIR).log_batch(
+            run_id,
+            metrics=[
+                Metric(key, float(value), timestamp, 0)
+                for key, value in (metrics or {}).items()
+            ],
+            params=[Param(key, str(value)) for key, value in model_kwargs.items()],
+            tags=[RunTag("name", model_name)],
+        )
+
+        if isinstance(model, xgb.XGBModel):
+            mlflow.xgboost.log_model(model, model_name)
+        else:
+            mlflow.sklearn.log_model(model, model_name)
+
+    _log_artifacts(run_id, model_name)
+
+    return run_id
+
+
+def _log_artifacts(run_id, model_name):  # pragma: no cover
+    """Uploads the images of a model that are new or changed since they were last uploaded."""
+
+    with _tracking_queue._lock:
+        _tracking_queue._pending_artifacts.discard((run_id, model_name))
+
+    if isinstance(run_id, Future):
+        run_id = run_id.result()
+
+    image_dir = os.path.join(IMAGE_DIR, model_name)
+    uploaded = _tracking_queue._uploaded.setdefault(run_id, {})
+    client = None
+
+    for path in Path(image_dir).rglob("*"):
+        if not path.is_file() or uploaded.get(path) == path.stat().st_mtime:
+            continue
+
+        if client is None:
+            from mlflow.tracking import MlflowClient
+
+            client = MlflowClient(EXP_DIR)
+
+        artifact_dir = os.path.relpath(str(path.parent), image_dir)
+        client.log_artifact(
+            run_id, str(path), None if artifact_dir == "." else artifact_dir
+        )
+        uploaded[path] = path.stat().st_mtime
+
+
 def track_model(
     exp_name: str, model, model_name: str, model_kwargs: dict, metrics=None
 ):  # pragma: no cover
     """
     Logs model information into MLFlow console.
+
+    Logging happens in the background, call `flush_tracking` to wait for it.
     
     Parameters
     ----------
@@ -288,45 +1408,40 @@ def track_model(
 
     metrics : dict
         Metrics for the model
-    """
-
-    mlflow.set_tracking_uri(EXP_DIR)
-    mlflow.set_experiment(exp_name)
-
-    with mlflow.start_run(run_name=model_name) as run:
-
-        mlflow.log_params(model_kwargs)
-        mlflow.set_tag("name", model_name)
-
-        if isinstance(model, xgb.XGBModel):
-            mlflow.xgboost.log_model(model, model_name)
-        else:
-            mlflow.sklearn.log_model(model, model_name)
-
-        mlflow.log_metrics(metrics)
-        mlflow.log_artifacts(os.path.join(IMAGE_DIR, model_name))
 
-        run_id = run.info.run_uuid
-
-        mlflow.end_run()
+    Returns
+    -------
+    Future
+        MLFlow run id, once the model is logged
+    """
 
-    return run_id
+    return _tracking_queue.submit(
+        _log_model, exp_name, model, model_name, dict(model_kwargs), metrics
+    )
 
 
 def track_artifacts(run_id, model_name):  # pragma: no cover
     """
     Track artificats for modelling.
+
+    Uploads happen in the background and only new or changed images are uploaded.
+    Uploads requested while one is already waiting for the same model are merged into it.
     
     Parameters
     ----------
-    run_id : str
+    run_id : str or Future
         MLFlow run id
 
     model_name : str
         Name of the model
     """
 
-    with mlflow.start_run(run_id=run_id) as run:
+    key = (run_id, model_name)
+
+    with _tracking_queue._lock:
+        if key in _tracking_queue._pending_artifacts:
+            return
+
+        _tracking_queue._pending_artifacts.add(key)
 
-        mlflow.log_artifacts(os.path.join(IMAGE_DIR, model_name))
-        mlflow.end_run()
+    _tracking_queue.submit(_log_artifacts, run_id, model_name)
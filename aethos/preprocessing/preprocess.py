@@ -181,7 +181,9 @@ class Preprocess(object):
 
         return self
 
-    def split_sentences(self, *list_args, list_of_cols=[], new_col_name="_sentences"):
+    def split_sentences(
+        self, *list_args, list_of_cols=[], new_col_name="_sentences", n_jobs=None
+    ):
         """
         Splits text data into sentences and saves it into another column for analysis.
 
@@ -198,6 +200,9 @@ class Preprocess(object):
         new_col_name : str, optional
             New column name to be created when applying this technique, by default `COLUMN_sentences`
 
+        n_jobs : int, optional
+            Number of processes to transform the text with, -1 for one per CPU, by default the `n_jobs` option
+
         Returns
         -------
         Data:
@@ -215,18 +220,24 @@ class Preprocess(object):
             if new_col_name.startswith("_"):
                 new_col_name = col + new_col_name
 
-            self.x_train[new_col_name] = pd.Series(
-                map(sent_tokenize, self.x_train[col])
+            self.x_train[new_col_name] = text.map_text(
+                sent_tokenize, self.x_train[col], n_jobs=n_jobs
             )
+
             if self.x_test is not None:
-                self.x_test[new_col_name] = pd.Series(
-                    map(sent_tokenize, self.x_test[col])
+                self.x_test[new_col_name] = text.map_text(
+                    sent_tokenize, self.x_test[col], n_jobs=n_jobs
                 )
 
         return self
 
     def stem_nltk(
-        self, *list_args, list_of_cols=[], stemmer="porter", new_col_name="_stemmed"
+        self,
+        *list_args,
+        list_of_cols=[],
+        stemmer="porter",
+        new_col_name="_stemmed",
+        n_jobs=None,
     ):
         """
         Transforms text to their word stem, base or root form. 
@@ -254,6 +265,9 @@ class Preprocess(object):
 
         new_col_name : str, optional
             New column name to be created when applying this technique, by default `COLUMN_stemmed`
+
+        n_jobs : int, optional
+            Number of processes to stem new words with, -1 for one per CPU, by default the `n_jobs` option
         
         Returns
         -------
@@ -268,23 +282,98 @@ class Preprocess(object):
 
         list_of_cols = _input_columns(list_args, list_of_cols)
 
-        stem = NLTK_STEMMERS[stemmer]
-        # Create partial for speed purposes
-        func = partial(self._apply_text_method, transformer=stem.stem)
+        # Words are stemmed once and reused across columns, datasets and calls
+        stem = text.get_word_cache(NLTK_STEMMERS[stemmer].stem)
 
         for col in list_of_cols:
             if new_col_name.startswith("_"):
                 new_col_name = col + new_col_name
 
-            self.x_train[new_col_name] = pd.Series(map(func, self.x_train[col]))
+            self.x_train[new_col_name] = stem.transform(
+                self.x_train[col], n_jobs=n_jobs
+            )
 
             if self.x_test is not None:
-                self.x_test[new_col_name] = pd.Series(map(func, self.x_test[col]))
+                self.x_test[new_col_name] = stem.transform(
+                    self.x_test[col], n_jobs=n_jobs
+                )
+
+        return self
+
+    def lemmatize_nltk(
+        self,
+        *list_args,
+        list_of_cols=[],
+        lemmatizer="wordnet",
+        new_col_name="_lemmatized",
+        n_jobs=None,
+    ):
+        """
+        Transforms text to the dictionary form of their words, their lemma.
+        For example:
+            dogs --> dog
+            churches --> church
+            geese --> goose
+
+        Parameters
+        ----------
+        list_args : str(s), optional
+            Specific columns to apply this technique to.
+
+        list_of_cols : list, optional
+            A list of specific columns to apply this technique to., by default []
+
+        lemmatizer : str, optional
+            Type of NLTK lemmatizer to use, by default wordnet
+
+            Current lemmatization implementations:
+                - wordnet
+
+            For more information please refer to the NLTK stemming api https://www.nltk.org/api/nltk.stem.html
+
+        new_col_name : str, optional
+            New column name to be created when applying this technique, by default `COLUMN_lemmatized`
+
+        n_jobs : int, optional
+            Number of processes to lemmatize new words with, -1 for one per CPU, by default the `n_jobs` option
+
+        Returns
+        -------
+        Data:
+            Returns a deep copy of the Data object.
+
+        Examples
+        --------
+        >>> data.lemmatize_nltk('col1')
+        >>> data.lemmatize_nltk(['col1', 'col2'], new_col_name='_lemma')
+        """
+
+        list_of_cols = _input_columns(list_args, list_of_cols)
+
+        lemmatize = text.get_word_cache(NLTK_LEMMATIZERS[lemmatizer].lemmatize)
+
+        for col in list_of_cols:
+            if new_col_name.startswith("_"):
+                new_col_name = col + new_col_name
+
+            self.x_train[new_col_name] = lemmatize.transform(
+                self.x_train[col], n_jobs=n_jobs
+            )
+
+            if self.x_test is not None:
+                self.x_test[new_col_name] = lemmatize.transform(
+                    self.x_test[col], n_jobs=n_jobs
+                )
 
         return self
 
     def split_words_nltk(
-        self, *list_args, list_of_cols=[], regexp="", new_col_name="_tokenized"
+        self,
+        *list_args,
+        list_of_cols=[],
+        regexp="",
+        new_col_name="_tokenized",
+        n_jobs=None,
     ):
         """
         Splits text into its words using nltk punkt tokenizer by default. 
@@ -304,6 +393,9 @@ class Preprocess(object):
 
         new_col_name : str, optional
             New column name to be created when applying this technique, by default `COLUMN_tokenized`
+
+        n_jobs : int, optional
+            Number of processes to transform the text with, -1 for one per CPU, by default the `n_jobs` option
         
         Returns
         -------
@@ -318,35 +410,30 @@ class Preprocess(object):
 
         list_of_cols = _input_columns(list_args, list_of_cols)
 
-        tokenizer = RegexpTokenizer(regexp)
+        tokenize = RegexpTokenizer(regexp).tokenize if regexp else word_tokenize
 
         for col in list_of_cols:
             if new_col_name.startswith("_"):
                 new_col_name = col + new_col_name
 
-            if not regexp:
-                self.x_train[new_col_name] = pd.Series(
-                    map(word_tokenize, self.x_train[col])
-                )
+            self.x_train[new_col_name] = text.map_text(
+                tokenize, self.x_train[col], n_jobs=n_jobs
+            )
 
-                if self.x_test is not None:
-                    self.x_test[new_col_name] = pd.Series(
-                        map(word_tokenize, self.x_test[col])
-                    )
-            else:
-                self.x_train[new_col_name] = pd.Series(
-                    map(tokenizer.tokenize, self.x_train[col])
+            if self.x_test is not None:
+                self.x_test[new_col_name] = text.map_text(
+                    tokenize, self.x_test[col], n_jobs=n_jobs
                 )
 
-                if self.x_test is not None:
-                    self.x_test[new_col_name] = pd.Series(
-                        map(tokenizer.tokenize, self.x_test[col])
-                    )
-
         return self
 
     def remove_stopwords_nltk(
-        self, *list_args, list_of_cols=[], custom_stopwords=[], new_col_name="_rem_stop"
+        self,
+        *list_args,
+        list_of_cols=[],
+        custom_stopwords=[],
+        new_col_name="_rem_stop",
+        n_jobs=None,
     ):
         """
         Removes stopwords following the nltk English stopwords list.
@@ -368,6 +455,9 @@ class Preprocess(object):
 
         new_col_name : str, optional
             New column name to be created when applying this technique, by default `COLUMN_rem_stop`
+
+        n_jobs : int, optional
+            Number of processes to transform the text with, -1 for one per CPU, by default the `n_jobs` option
         
         Returns
         -------
@@ -384,37 +474,19 @@ class Preprocess(object):
 
         stop_words = stopwords.words("english")
         stop_words.extend(custom_stopwords)
-        stop_list = set(stop_words)
+        func = partial(text.remove_words, words=set(stop_words))
 
         for col in list_of_cols:
             if new_col_name.startswith("_"):
                 new_col_name = col + new_col_name
 
-            self.x_train[new_col_name] = list(
-                map(
-                    lambda x: " ".join(
-                        [
-                            word
-                            for word in word_tokenize(x.lower())
-                            if word not in stop_list
-                        ]
-                    ),
-                    self.x_train[col],
-                )
+            self.x_train[new_col_name] = text.map_text(
+                func, self.x_train[col], n_jobs=n_jobs
             )
 
             if self.x_test is not None:
-                self.x_test[new_col_name] = list(
-                    map(
-                        lambda x: " ".join(
-                            [
-                                word
-                                for word in word_tokenize(x.lower())
-                                if word not in stop_list
-                            ]
-                        ),
-                        self.x_test[col],
-                    )
+                self.x_test[new_col_name] = text.map_text(
+                    func, self.x_test[col], n_jobs=n_jobs
                 )
 
         return self
@@ -426,6 +498,7 @@ class Preprocess(object):
         regexp="",
         exceptions=[],
         new_col_name="_rem_punct",
+        n_jobs=None,
     ):
         """
         Removes punctuation from every string entry.
@@ -453,6 +526,9 @@ class Preprocess(object):
 
         new_col_name : str, optional
             New column name to be created when applying this technique, by default `COLUMN_rem_punct`
+
+        n_jobs : int, optional
+            Number of processes to transform the text with, -1 for one per CPU, by default the `n_jobs` option
         
         Returns
         -------
@@ -468,45 +544,32 @@ class Preprocess(object):
 
         list_of_cols = _input_columns(list_args, list_of_cols)
 
-        delete_punct = set(string.punctuation) - set(exceptions)
-        tokenizer = RegexpTokenizer(regexp)
+        if regexp:
+            func = partial(text.join_tokens, tokenize=RegexpTokenizer(regexp).tokenize)
+        else:
+            func = partial(
+                text.remove_characters,
+                characters=set(string.punctuation) - set(exceptions),
+            )
 
         for col in list_of_cols:
             if new_col_name.startswith("_"):
                 new_col_name = col + new_col_name
 
-            if not regexp:
-                self.x_train[new_col_name] = list(
-                    map(
-                        lambda x: "".join(
-                            [letter for letter in x if letter not in delete_punct]
-                        ),
-                        self.x_train[col],
-                    )
-                )
+            self.x_train[new_col_name] = text.map_text(
+                func, self.x_train[col], n_jobs=n_jobs
+            )
 
-                if self.x_test is not None:
-                    self.x_test[new_col_name] = list(
-                        map(
-                            lambda x: "".join(
-                                [letter for letter in x if letter not in delete_punct]
-                            ),
-                            self.x_test[col],
-                        )
-                    )
-            else:
-                self.x_train[new_col_name] = list(
-                    map(lambda x: " ".join(tokenizer.tokenize(x)), self.x_train[col])
+            if self.x_test is not None:
+                self.x_test[new_col_name] = text.map_text(
+                    func, self.x_test[col], n_jobs=n_jobs
                 )
 
-                if self.x_test is not None:
-                    self.x_test[new_col_name] = list(
-                        map(lambda x: " ".join(tokenizer.tokenize(x)), self.x_test[col])
-                    )
-
         return self
 
-    def remove_numbers(self, *list_args, list_of_cols=[], new_col_name="_rem_num"):
+    def remove_numbers(
+        self, *list_args, list_of_cols=[], new_col_name="_rem_num", n_jobs=None
+    ):
         """
         Removes numbers from text in a column.
         
@@ -521,6 +584,9 @@ class Preprocess(object):
         new_col_name : str, optional
             New column name to be created when applying this technique, by default `COLUMN_rem_num`
 
+        n_jobs : int, optional
+            Number of processes to transform the text with, -1 for one per CPU, by default the `n_jobs` option
+
         Returns
         -------
         Data:
@@ -533,23 +599,19 @@ class Preprocess(object):
 
         list_of_cols = _input_columns(list_args, list_of_cols)
 
+        func = partial(text.translate_text, table=str.maketrans("", "", "0123456789"))
+
         for col in list_of_cols:
             if new_col_name.startswith("_"):
                 new_col_name = col + new_col_name
 
-            self.x_train[new_col_name] = pd.Series(
-                map(
-                    lambda x: str.translate(x, str.maketrans("", "", "0123456789")),
-                    self.x_train[col],
-                )
+            self.x_train[new_col_name] = text.map_text(
+                func, self.x_train[col], n_jobs=n_jobs
             )
 
             if self.x_test is not None:
-                self.x_test[new_col_name] = pd.Series(
-                    map(
-                        lambda x: str.translate(x, str.maketrans("", "", "0123456789")),
-                        self.x_test[col],
-                    )
+                self.x_test[new_col_name] = text.map_text(
+                    func, self.x_test[col], n_jobs=n_jobs
                 )
 
         return self
@@ -564,6 +626,7 @@ class Preprocess(object):
         stemmer=True,
         numbers=True,
         new_col_name="_clean",
+        n_jobs=None,
     ):
         """
         Function that takes text and does the following:
@@ -599,6 +662,9 @@ class Preprocess(object):
 
         new_col_name : str, optional
             New column name to be created when applying this technique, by default `COLUMN_clean`            
+
+        n_jobs : int, optional
+            Number of processes to transform the text with, -1 for one per CPU, by default the `n_jobs` option
         
         Returns
         -------
@@ -613,61 +679,25 @@ class Preprocess(object):
         """
 
         list_of_cols = _input_columns(list_args, list_of_cols)
+        normalize = text.TextNormalizer(
+            lower=lower,
+            punctuation=punctuation,
+            stopwords=stopwords,
+            stemmer=stemmer,
+            numbers=numbers,
+        )
 
         for col in list_of_cols:
             if new_col_name.startswith("_"):
                 new_col_name = col + new_col_name
 
-            self.x_train[new_col_name] = [
-                text.process_text(
-                    txt,
-                    lower=lower,
-                    punctuation=punctuation,
-                    stopwords=stopwords,
-                    stemmer=stemmer,
-                    numbers=numbers,
-                )
-                for txt in self.x_train[col]
-            ]
+            self.x_train[new_col_name] = text.map_text(
+                normalize, self.x_train[col], n_jobs=n_jobs
+            )
 
             if self.x_test is not None:
-                self.x_test[new_col_name] = [
-                    text.process_text(
-                        txt,
-                        lower=lower,
-                        punctuation=punctuation,
-                        stopwords=stopwords,
-                        stemmer=stemmer,
-                        numbers=numbers,
-                    )
-                    for txt in self.x_test[col]
-                ]
+                self.x_test[new_col_name] = text.map_text(
+                    normalize, self.x_test[col], n_jobs=n_jobs
+                )
 
         return self
-
-    def _apply_text_method(self, text_data, transformer=None):
-        """
-        Applies a text based method to the given data, for example
-        a Lemmatizer, Stemmer, etc.
-
-        Parameters
-        ----------
-        text_data : str
-            Text data to transform
-            
-        transformer : Transformation object, optional
-            trasnformer applied on the data, for example
-            lemmatizer, stemmer, etc. , by default None
-
-        Returns
-        -------
-        str
-            Transformed data
-        """
-
-        transformed_text_data = ""
-
-        for word in text_data.split():
-            transformed_text_data += f"{transformer(word)} "
-
-        return transformed_text_data.strip()
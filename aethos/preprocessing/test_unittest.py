@@ -102,6 +102,36 @@ class TestPreprocessing(unittest.TestCase):
 
         self.assertEqual(validate, 3)
 
+    def test_preprocess_nltkstem_word_cache(self):
+
+        from aethos.preprocessing.preprocess import NLTK_STEMMERS
+        from aethos.preprocessing.text import get_word_cache
+
+        text_data = ["dogs and churches", "churches of dogs"]
+        data = pd.DataFrame(data=text_data, columns=["data"])
+        data["col3"] = [1, 2]
+
+        prep = Classification(x_train=data, target="col3", x_test=data)
+        prep.stem_nltk("data")
+        stem = get_word_cache(NLTK_STEMMERS["porter"].stem)
+
+        self.assertListEqual(
+            prep.x_train.data_stemmed.tolist(), ["dog and church", "church of dog"]
+        )
+        self.assertEqual(stem.words["churches"], "church")
+
+    def test_preprocess_nltklemmatize(self):
+
+        text_data = ["dogs and churches", "geese of dogs"]
+        data = pd.DataFrame(data=text_data, columns=["data"])
+        data["col3"] = [1, 2]
+
+        prep = Classification(x_train=data, target="col3", x_test=data)
+        prep.lemmatize_nltk("data")
+        validate = prep.x_train.data_lemmatized.tolist()
+
+        self.assertListEqual(validate, ["dog and church", "goose of dog"])
+
     def test_preprocess_nltksplit(self):
 
         text_data = ["Please.exe split me."]
@@ -164,6 +194,55 @@ class TestPreprocessing(unittest.TestCase):
 
         self.assertListEqual(validate, ["pleaseex split", "hello testingdl"])
 
+    def test_preprocess_textnormalizer(self):
+
+        from aethos.preprocessing.text import TextNormalizer, process_text
+
+        text_data = ["Please.exe, split me.", "hello it's me123, test1ing.dll."]
+        normalizer = TextNormalizer(stemmer=False)
+
+        self.assertListEqual(
+            [normalizer(txt) for txt in text_data],
+            [process_text(txt, stemmer=False) for txt in text_data],
+        )
+        self.assertListEqual(normalizer.tokenize(text_data[1]), ["hello", "testingdll"])
+
+    def test_preprocess_textnormalizer_cache_size(self):
+
+        from aethos.preprocessing.text import TextNormalizer
+
+        text_data = "Please.exe, split me. hello it's me123, test1ing.dll."
+        normalizer = TextNormalizer(stemmer=False, cache_size=3)
+
+        self.assertEqual(normalizer(text_data), TextNormalizer(stemmer=False)(text_data))
+        self.assertLessEqual(len(normalizer._tokens), 3)
+
+    def test_preprocess_wordcache_cache_size(self):
+
+        from aethos.preprocessing.text import WordCache
+
+        text_data = ["dogs and cats", "cats and birds", "fish"]
+        upper = WordCache(str.upper, cache_size=3)
+
+        self.assertListEqual(
+            [upper(txt) for txt in text_data], ["DOGS AND CATS", "CATS AND BIRDS", "FISH"]
+        )
+        self.assertLessEqual(len(upper.words), 3)
+
+    def test_preprocess_cleantext_n_jobs(self):
+
+        text_data = ["Please.exe, split me.", "hello it's me123, test1ing.dll."] * 1000
+        data = pd.DataFrame(data=text_data, columns=["data"])
+        data["col3"] = 1
+
+        prep = Classification(x_train=data, target="col3")
+        prep.clean_text("data", new_col_name="serial", n_jobs=1)
+        prep.clean_text("data", new_col_name="parallel", n_jobs=2)
+
+        self.assertListEqual(
+            prep.x_train["parallel"].tolist(), prep.x_train["serial"].tolist()
+        )
+
     def test_preprocess_nltkremove_punctuation_exception(self):
 
         text_data = ["Please,> split me."]
@@ -1,3 +1,201 @@
+import multiprocessing as mp
+import os
+from functools import lru_cache
+from itertools import chain
+
+from aethos.config.config import _global_config
+
+# Columns with fewer rows are transformed in this process, starting worker processes costs more than it saves
+MIN_PARALLEL_ROWS = 1000
+
+# Text transformation of the worker process, set once when the worker starts
+_text_func = None
+
+
+def _init_text_worker(func):
+    """Sets the text transformation of a worker process."""
+
+    global _text_func
+    _text_func = func
+
+
+def _apply_text_chunk(chunk: list) -> list:
+    """Applies the worker's text transformation to a chunk of rows."""
+
+    return [_text_func(txt) for txt in chunk]
+
+
+def map_text(func, texts, n_jobs=None) -> list:
+    """
+    Applies a text transformation to every row, in order.
+
+    With more than one job, the rows are split into chunks that are transformed by a pool of processes.
+    The transformation, for example a `TextNormalizer`, is sent to each process once when it starts.
+    
+    Parameters
+    ----------
+    func : callable
+        Picklable function transforming a single row
+
+    texts : iterable
+        Rows of text
+
+    n_jobs : int, optional
+        Number of processes, -1 for one per CPU, by default the `n_jobs` option
+
+    Returns
+    -------
+    list
+        Transformed rows
+
+    Examples
+    --------
+    >>> map_text(TextNormalizer(), df['text'], n_jobs=4)
+    """
+
+    n_jobs = _global_config["n_jobs"] if n_jobs is None else n_jobs
+
+    if n_jobs < 0:
+        n_jobs = os.cpu_count()
+
+    texts = list(texts)
+
+    if n_jobs <= 1 or len(texts) < MIN_PARALLEL_ROWS:
+        return [func(txt) for txt in texts]
+
+    # A few chunks per process balances uneven row lengths
+    chunk_size = -(-len(texts) // (n_jobs * 4))
+    chunks = [texts[i : i + chunk_size] for i in range(0, len(texts), chunk_size)]
+
+    with mp.Pool(n_jobs, initializer=_init_text_worker, initargs=(func,)) as pool:
+        return list(chain.from_iterable(pool.map(_apply_text_chunk, chunks)))
+
+
+class WordCache(object):
+    """
+    Applies a word transformation, such as a stemmer or lemmatizer, to text by transforming every unique word once.
+
+    The transformed form of up to `cache_size` words is kept, so it is reused across columns, datasets and later calls.
+
+    Parameters
+    ----------
+    transformer : callable
+        Picklable function transforming a single word
+
+    cache_size : int, optional
+        Number of transformed words kept before the table is cleared, by default 100000
+
+    Examples
+    --------
+    >>> stemmer = WordCache(PorterStemmer().stem)
+    >>> stemmer('dogs and churches')
+    >>> stemmer.transform(df['text'], n_jobs=4)
+    """
+
+    def __init__(self, transformer, cache_size=100000):
+
+        self.transformer = transformer
+        # Transformed form of the words seen
+        self.words = {}
+        self.cache_size = cache_size
+
+    def __call__(self, text_data: str) -> str:
+        """
+        Transforms every word of a text.
+
+        Parameters
+        ----------
+        text_data : str
+            Text
+
+        Returns
+        -------
+        str
+            Transformed text
+        """
+
+        return self.transform([text_data])[0]
+
+    def transform(self, texts, n_jobs=None) -> list:
+        """
+        Transforms every word of each row of text.
+
+        The words not seen before are transformed once, by a pool of processes with more than one job,
+        and the rows are rebuilt from the word table.
+
+        Parameters
+        ----------
+        texts : iterable
+            Rows of text
+
+        n_jobs : int, optional
+            Number of processes, -1 for one per CPU, by default the `n_jobs` option
+
+        Returns
+        -------
+        list
+            Transformed rows
+        """
+
+        rows = [txt.split() for txt in texts]
+        words = self.words
+
+        unique_words = set(chain.from_iterable(rows))
+        new_words = unique_words.difference(words)
+
+        # Keep the table bounded on corpora with a long tail of rare words
+        if len(words) + len(new_words) > self.cache_size:
+            words.clear()
+            new_words = unique_words
+
+        new_words = list(new_words)
+        words.update(
+            zip(new_words, map_text(self.transformer, new_words, n_jobs=n_jobs))
+        )
+        transformed = [" ".join([words[word] for word in row]) for row in rows]
+
+        # A single call may need more words than the table keeps
+        if len(words) > self.cache_size:
+            words.clear()
+
+        return transformed
+
+
+@lru_cache(maxsize=16)
+def get_word_cache(transformer) -> WordCache:
+    """Word cache of a transformer, shared by every call with the same transformer."""
+
+    return WordCache(transformer)
+
+
+def remove_words(text_data: str, words: set) -> str:
+    """Lowercases and tokenizes the text and removes the given words."""
+
+    from nltk.tokenize import word_tokenize
+
+    return " ".join(
+        [word for word in word_tokenize(text_data.lower()) if word not in words]
+    )
+
+
+def remove_characters(text_data: str, characters: set) -> str:
+    """Removes the given characters from the text."""
+
+    return "".join([letter for letter in text_data if letter not in characters])
+
+
+def join_tokens(text_data: str, tokenize) -> str:
+    """Tokenizes the text and joins the tokens with spaces."""
+
+    return " ".join(tokenize(text_data))
+
+
+def translate_text(text_data: str, table: dict) -> str:
+    """Translates the text with a `str.maketrans` table."""
+
+    return text_data.translate(table)
+
+
 def process_text(
     corpus, lower=True, punctuation=True, stopwords=True, stemmer=True, numbers=True,
 ):
@@ -36,36 +234,153 @@ def process_text(
         Normalized text
     """
 
-    import nltk
-    import string
-    from nltk.stem.snowball import SnowballStemmer
-    from nltk.tokenize import word_tokenize
+    return _get_normalizer(lower, punctuation, stopwords, stemmer, numbers)(corpus)
+
+
+@lru_cache(maxsize=32)
+def _get_normalizer(lower, punctuation, stopwords, stemmer, numbers):
+    """Normalizer shared by every call to `process_text` with the same options."""
+
+    return TextNormalizer(
+        lower=lower,
+        punctuation=punctuation,
+        stopwords=stopwords,
+        stemmer=stemmer,
+        numbers=numbers,
+    )
+
+
+class TextNormalizer(object):
+    """
+    Reusable version of `process_text`.
+
+    The stopwords, translation table and stemmer are built once and the normalized form of up to `cache_size` unique tokens
+    is memoized, so normalizing many documents mostly costs tokenizing them.
+
+    Parameters
+    ----------
+    lower : bool, optional
+        True to cast all text to lowercase, by default True
+
+    punctuation : bool, optional
+        True to remove punctuation, by default True
+
+    stopwords : bool, optional
+        True to remove stop words, by default True
+
+    stemmer : bool, optional
+        True to stem the data, by default True
+
+    numbers : bool, optional
+        True to remove any numbers, by default True
+
+    cache_size : int, optional
+        Number of normalized tokens memoized before the memo is cleared, by default 100000
+
+    Examples
+    --------
+    >>> normalizer = TextNormalizer(stemmer=False)
+    >>> normalizer('The cats are sleeping')
+    >>> normalizer.tokenize('The cats are sleeping')
+    """
+
+    def __init__(
+        self,
+        lower=True,
+        punctuation=True,
+        stopwords=True,
+        stemmer=True,
+        numbers=True,
+        cache_size=100000,
+    ):
+
+        import string
+        from nltk.corpus import stopwords as nltk_stopwords
+        from nltk.stem.snowball import SnowballStemmer
+        from nltk.tokenize import word_tokenize
+
+        self.lower = lower
+        self._word_tokenize = word_tokenize
+        self._punctuation = string.punctuation if punctuation else None
+        self._table = str.maketrans(
+            "",
+            "",
+            (string.punctuation if punctuation else "")
+            + ("0123456789" if numbers else ""),
+        )
+        self._stop_words = (
+            frozenset(nltk_stopwords.words("english")) if stopwords else frozenset()
+        )
+        self._stem = SnowballStemmer("english").stem if stemmer else None
+        # Normalized form of the tokens seen, None for tokens that are removed
+        self._tokens = {}
+        self.cache_size = cache_size
+
+    def _normalize_token(self, token):
+
+        if self._punctuation is not None and token in self._punctuation:
+            return None
+
+        token = token.translate(self._table)
+
+        if token in self._stop_words:
+            return None
+
+        if self._stem is not None:
+            token = self._stem(token)
+
+        return token
+
+    def _normalize(self, corpus):
+
+        tokens = self._tokens
+
+        if self.lower:
+            corpus = corpus.lower()
+
+        for token in self._word_tokenize(corpus):
+            try:
+                normalized = tokens[token]
+            except KeyError:
+                # Keep the memo bounded on corpora with a long tail of rare tokens
+                if len(tokens) >= self.cache_size:
+                    tokens.clear()
 
-    transformed_corpus = ""
+                normalized = tokens[token] = self._normalize_token(token)
 
-    if lower:
-        corpus = corpus.lower()
+            if normalized is not None:
+                yield normalized
 
-    for token in word_tokenize(corpus):
+    def __call__(self, corpus: str) -> str:
+        """
+        Normalizes text.
 
-        if punctuation:
-            if token in string.punctuation:
-                continue
+        Parameters
+        ----------
+        corpus : str
+            Text
 
-            token = token.translate(str.maketrans("", "", string.punctuation))
+        Returns
+        -------
+        str
+            Normalized text
+        """
 
-        if numbers:
-            token = token.translate(str.maketrans("", "", "0123456789"))
+        return " ".join(self._normalize(corpus)).strip()
 
-        if stopwords:
-            stop_words = nltk.corpus.stopwords.words("english")
-            if token in stop_words:
-                continue
+    def tokenize(self, corpus: str) -> list:
+        """
+        Normalizes text into a list of tokens, without joining and tokenizing it again.
 
-        if stemmer:
-            stem = SnowballStemmer("english")
-            token = stem.stem(token)
+        Parameters
+        ----------
+        corpus : str
+            Text
 
-        transformed_corpus += token + " "
+        Returns
+        -------
+        list
+            Normalized tokens
+        """
 
-    return transformed_corpus.strip()
+        return [token for token in self._normalize(corpus) if token]
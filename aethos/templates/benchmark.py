@@ -0,0 +1,266 @@
+import http.client
+import importlib.util
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+
+def _free_port() -> int:
+    """Port that is free to bind to on localhost."""
+
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+
+        return s.getsockname()[1]
+
+
+def _wait_for_service(port: int, process=None, log=None, timeout=60):
+    """Waits until the service answers on `port`, `log` is the file the service's stderr is written to."""
+
+    start = time.time()
+
+    while time.time() - start < timeout:
+        if process is not None and process.poll() is not None:
+            log.seek(0)
+
+            raise RuntimeError(
+                f"Service exited before starting:\n{log.read().decode(errors='replace')}"
+            )
+
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/openapi.json")
+            conn.getresponse().read()
+            conn.close()
+
+            return
+        except OSError:
+            time.sleep(0.1)
+
+    raise RuntimeError(f"Service did not start within {timeout} seconds.")
+
+
+@contextmanager
+def _subprocess_service(app_dir: str, port: int, workers=1):
+    """Runs the service with uvicorn in a subprocess."""
+
+    # uvicorn logs every request to stderr, a pipe nobody reads would fill up and block the service
+    log = tempfile.TemporaryFile()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+        ],
+        cwd=app_dir,
+        stdout=subprocess.DEVNULL,
+        stderr=log,
+    )
+
+    try:
+        _wait_for_service(port, process, log)
+        yield
+    finally:
+        process.terminate()
+        process.wait()
+        log.close()
+
+
+@contextmanager
+def _in_process_service(app_dir: str, port: int):
+    """Runs the service with uvicorn in a thread of this process."""
+
+    import uvicorn
+
+    # The service loads its model relative to its own directory
+    cwd = os.getcwd()
+    sys.path.insert(0, app_dir)
+
+    try:
+        os.chdir(app_dir)
+        spec = importlib.util.spec_from_file_location(
+            "main", os.path.join(app_dir, "main.py")
+        )
+        main = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(main)
+    finally:
+        os.chdir(cwd)
+        sys.path.remove(app_dir)
+
+    server = uvicorn.Server(
+        uvicorn.Config(main.app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+
+    try:
+        _wait_for_service(port)
+        yield
+    finally:
+        server.should_exit = True
+        thread.join()
+
+
+def _run_load(port: int, path: str, payloads: list, concurrency: int):
+    """
+    Sends `payloads` to `path` from `concurrency` threads, each with its own connection.
+
+    Returns the latency of each request in ms, whether it failed and the total time in seconds.
+    """
+
+    local = threading.local()
+    headers = {"Content-Type": "application/json"}
+
+    def send(payload):
+        if not hasattr(local, "conn"):
+            local.conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+
+        start = time.perf_counter()
+
+        try:
+            local.conn.request("POST", path, payload, headers)
+            response = local.conn.getresponse()
+            response.read()
+            failed = response.status != 200
+        except (OSError, http.client.HTTPException):
+            local.conn.close()
+            del local.conn
+            failed = True
+
+        return (time.perf_counter() - start) * 1000, failed
+
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(send, payloads))
+
+    return (
+        np.array([latency for latency, _ in results]),
+        np.array([failed for _, failed in results]),
+        time.perf_counter() - start,
+    )
+
+
+def benchmark_service(
+    app_dir: str,
+    data: pd.DataFrame,
+    concurrency=16,
+    n_requests=1000,
+    batch_size=64,
+    in_process=False,
+    workers=1,
+    port=None,
+) -> pd.DataFrame:
+    """
+    Load tests a service generated with `to_service` by replaying rows of data against its `/predict` and `/predict_batch` endpoints.
+
+    Parameters
+    ----------
+    app_dir : str
+        Directory of the service's main.py
+
+    data : pd.DataFrame
+        Rows to send, with the columns the model was trained on in the same order
+
+    concurrency : int, optional
+        Number of requests in flight at once, by default 16
+
+    n_requests : int, optional
+        Number of requests sent to each endpoint, by default 1000
+
+    batch_size : int, optional
+        Number of rows in each `/predict_batch` request, by default 64
+
+    in_process : bool, optional
+        Whether to run the service in a thread of this process rather than in a uvicorn subprocess, by default False
+
+    workers : int, optional
+        Number of uvicorn workers when running the service in a subprocess, by default 1
+
+    port : int, optional
+        Port to run the service on, by default a free port
+
+    Returns
+    -------
+    pd.DataFrame
+        Requests, rows, error rate, throughput and p50/p95/p99 latency in ms of each endpoint
+
+    Examples
+    --------
+    >>> benchmark_service('~/.aethos/projects/titanic/app', x_test, concurrency=32)
+    """
+
+    app_dir = os.path.expanduser(app_dir)
+
+    if not os.path.exists(os.path.join(app_dir, "main.py")):
+        raise ValueError(
+            f"No service found in {app_dir}, create one with `to_service` first."
+        )
+
+    port = port or _free_port()
+    rows = data.to_dict(orient="records")
+    columns = data.to_dict(orient="list")
+
+    payloads = {
+        "/predict": [
+            json.dumps(rows[i % len(rows)], default=float) for i in range(n_requests)
+        ],
+        "/predict_batch": [
+            json.dumps(
+                {
+                    col: [
+                        values[j % len(values)]
+                        for j in range(i * batch_size, (i + 1) * batch_size)
+                    ]
+                    for col, values in columns.items()
+                },
+                default=float,
+            )
+            for i in range(n_requests)
+        ],
+    }
+    batch_rows = {"/predict": 1, "/predict_batch": batch_size}
+
+    service = (
+        _in_process_service(app_dir, port)
+        if in_process
+        else _subprocess_service(app_dir, port, workers=workers)
+    )
+    report = {}
+
+    with service:
+        for path, endpoint_payloads in payloads.items():
+            latencies, failed, total_time = _run_load(
+                port, path, endpoint_payloads, concurrency
+            )
+            p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+
+            report[path] = {
+                "Requests": n_requests,
+                "Rows": n_requests * batch_rows[path],
+                "Error Rate": failed.mean(),
+                "Requests/s": n_requests / total_time,
+                "Rows/s": n_requests * batch_rows[path] / total_time,
+                "p50 (ms)": p50,
+                "p95 (ms)": p95,
+                "p99 (ms)": p99,
+            }
+
+    return pd.DataFrame(report).T
@@ -1,4 +1,5 @@
 import os
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -9,6 +10,7 @@ from aethos.templates.util import (
     _create_project_dir,
     _get_model_type_kwarg,
 )
+from aethos.util import _make_dir
 
 
 class TemplateGenerator(object):
@@ -23,11 +25,24 @@ class TemplateGenerator(object):
     project_dir = _create_dir()
 
     @classmethod
-    def generate_service(cls, name: str, filename: str, model):
+    def generate_service(
+        cls,
+        name: str,
+        filename: str,
+        model,
+        compiled=False,
+        workers=None,
+        max_batch_size=64,
+        max_wait_ms=5,
+        features=None,
+    ):
         """
         Generates the necessary files to run your model as a service.
 
         Generates the app.py, Dockerfile and requirements.txt file.
+
+        The service has a single row `/predict` endpoint, whose concurrent requests are batched into one prediction,
+        and a `/predict_batch` endpoint taking columnar JSON or an Arrow stream.
         
         Parameters
         ----------
@@ -36,16 +51,57 @@ class TemplateGenerator(object):
 
         filename : str
             Model file name
+
+        model : Model object
+            Model to serve
+
+        compiled : bool, optional
+            Whether the model is a CompiledTreeEnsemble, which is written to `filename` with the NumPy code to run it, by default False
+
+        workers : int, optional
+            Number of worker processes serving the model, by default the number the server image picks from the number of cores
+
+        max_batch_size : int, optional
+            Maximum number of `/predict` requests batched together, by default 64
+
+        max_wait_ms : int, optional
+            Maximum time in milliseconds a `/predict` request waits for others to be batched with, by default 5
+
+        features : list, optional
+            Features the model was trained on, in order. `/predict` rejects rows that do not have exactly these features, by default None
         """
 
         _create_project_dir(cls.project_dir, name=name)
 
         files = ["main.py", "Dockerfile", "requirements.txt"]
-        model_kwargs = _get_model_type_kwarg(model)
+
+        if compiled:
+            from aethos.model_analysis import compiled_model
+
+            app_dir = os.path.join(cls.project_dir, name, "app")
+            _make_dir(app_dir)
+
+            model.save(os.path.join(app_dir, filename))
+            shutil.copy(
+                compiled_model.__file__, os.path.join(app_dir, "compiled_model.py")
+            )
+
+            model_kwargs = {"xgboost": False, "lgbm": False}
+        else:
+            model_kwargs = _get_model_type_kwarg(model)
 
         for file in files:
             script = cls.env.get_template("files/" + file.replace(".py", "")).render(
-                name=name, filename=filename, service=True, **model_kwargs,
+                name=name,
+                filename=filename,
+                service=True,
+                compiled=compiled,
+                n_features=getattr(model, "n_features_in_", None),
+                workers=workers,
+                max_batch_size=max_batch_size,
+                max_wait_ms=max_wait_ms,
+                features=[str(f) for f in features] if features is not None else None,
+                **model_kwargs,
             )
 
             if file.endswith(".py") or file.endswith(".txt"):
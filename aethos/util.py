@@ -309,6 +309,48 @@ def _get_attr_(self, key):
         raise AttributeError(f"{type(self)} object does not have attribute {key}.")
 
 
+def _iter_chunks(source, chunk_size=100000):
+    """
+    Iterates over chunks of data.
+    
+    Parameters
+    ----------
+    source : str, callable or iterable
+        Path to a csv or parquet file, a function returning an iterable of DataFrames or an iterable of DataFrames
+
+    chunk_size : int, optional
+        Number of rows per chunk when reading a file, by default 100000
+
+    Yields
+    ------
+    pd.DataFrame
+        Chunk of data
+    """
+
+    if isinstance(source, (str, os.PathLike)):
+        if str(source).endswith(".parquet"):
+            import pyarrow.parquet as pq
+
+            for batch in pq.ParquetFile(source).iter_batches(batch_size=chunk_size):
+                yield batch.to_pandas()
+        else:
+            yield from pd.read_csv(source, chunksize=chunk_size)
+    elif callable(source):
+        yield from source()
+    else:
+        yield from source
+
+
+def _is_reiterable(source) -> bool:
+    """Whether chunks of data can be iterated over more than once."""
+
+    return (
+        isinstance(source, (str, os.PathLike))
+        or callable(source)
+        or iter(source) is not source
+    )
+
+
 def _make_dir(path: str):
     """
     Makes directory if it does exist.
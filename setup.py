@@ -10,7 +10,7 @@ VERSION = "2.0.1"
 pkgs = [
     "numpy==1.18.2",
     "pandas==1.0.3",
-    "scikit-learn>=0.22",
+    "scikit-learn>=0.24",
     "textblob==0.15.3",
     "matplotlib==3.2.1",
     "pandas_summary",